@@ -0,0 +1,221 @@
+import numpy as np
+
+
+def elastic_collisions(pos, vel, radius, hit, pairs=None):
+    """
+    Resolves collisions between overlapping balls with array operations.
+
+    Ball to ball collisions are perfectly elastic and the mass of a ball is proportional to its area.
+    Pairs where both balls have recently been hit are skipped. Every pair is resolved from the
+    velocities at the start of the call, so a ball touching several others gets the sum of the changes.
+
+    Args:
+        pos (numpy.ndarray): Ball positions of shape (n, 2).
+        vel (numpy.ndarray): Ball velocities of shape (n, 2). Updated in place.
+        radius (numpy.ndarray): Ball radii of shape (n,).
+        hit (numpy.ndarray): Recently hit flags of shape (n,). Updated in place.
+        pairs (tuple): Candidate pairs as two index arrays (i, j). Default is None, which tests every pair.
+
+    Returns:
+        tuple: The index arrays (i, j) of the pairs that collided.
+    """
+    if pairs is None:
+        i, j = np.triu_indices(len(pos), 1)
+    else:
+        i, j = pairs
+
+    candidates = ~(hit[i] & hit[j])
+    i, j = i[candidates], j[candidates]
+
+    delta = pos[i] - pos[j]
+    distance_sq = np.einsum("ij,ij->i", delta, delta)
+    touching = distance_sq < (radius[i] + radius[j]) ** 2
+    i, j = i[touching], j[touching]
+    if len(i) == 0:
+        return i, j
+
+    # v1f = ((m1 - m2) * v1 + 2 * m2 * v2) / (m1 + m2) rewritten as a change of velocity.
+    m_i = radius[i] ** 2
+    m_j = radius[j] ** 2
+    total = m_i + m_j
+    relative = vel[j] - vel[i]
+    np.add.at(vel, i, (2 * m_j / total)[:, None] * relative)
+    np.add.at(vel, j, -(2 * m_i / total)[:, None] * relative)
+
+    hit[i] = True
+    hit[j] = True
+    return i, j
+
+
+class BallSystem:
+    """
+    Stores many balls in NumPy arrays and updates them all at once.
+
+    This is the structure-of-arrays counterpart of Ball. It follows the same rules: positions move by
+    velocity times dt, balls keep a tail of their last positions, and a hit flag is cleared after a
+    few updates. Collisions are resolved by registering the system with a PhysicsWorld.
+
+    Attributes:
+    - MAX_TAILS: The number of tail positions kept per ball.
+    - count: The number of balls.
+    - pos: The ball positions, shape (count, 2).
+    - prev_pos: The ball positions before the last update, used to interpolate drawing.
+    - vel: The ball velocities, shape (count, 2).
+    - radius: The ball radii, shape (count,).
+    - hit: Flags indicating if the balls have been hit, shape (count,).
+    - hit_time: The remaining time for the hit effects, shape (count,).
+    - tails: A ring buffer of previous positions, shape (count, MAX_TAILS, 2).
+    - tail_head: The index in tails the next position is written to.
+    - tail_length: The number of valid positions in tails.
+
+    Methods:
+    - add(x, y, radius, vel_x, vel_y): Adds balls.
+    - interpolated(alpha): Returns positions between the last two updates.
+    - tail_order(): Returns the tail indices from oldest to newest.
+    - update(dt): Moves every ball.
+    - resize(width_ratio, height_ratio): Resizes the balls based on the given width and height ratios.
+    """
+
+    MAX_TAILS = 20
+
+    def __init__(self, capacity=16):
+        self.count = 0
+        self._allocate(capacity)
+        self.tail_head = 0
+        self.tail_length = 1
+
+    def _allocate(self, capacity):
+        """
+        Allocates storage for capacity balls, keeping the current ones.
+        """
+        old = getattr(self, "_pos", None)
+        pos = np.zeros((capacity, 2))
+        prev_pos = np.zeros((capacity, 2))
+        vel = np.zeros((capacity, 2))
+        radius = np.zeros(capacity)
+        hit = np.zeros(capacity, dtype=bool)
+        hit_time = np.zeros(capacity)
+        tails = np.zeros((capacity, self.MAX_TAILS, 2))
+        if old is not None:
+            n = self.count
+            pos[:n] = self._pos[:n]
+            prev_pos[:n] = self._prev_pos[:n]
+            vel[:n] = self._vel[:n]
+            radius[:n] = self._radius[:n]
+            hit[:n] = self._hit[:n]
+            hit_time[:n] = self._hit_time[:n]
+            tails[:n] = self._tails[:n]
+        self._pos, self._prev_pos = pos, prev_pos
+        self._vel, self._radius = vel, radius
+        self._hit, self._hit_time, self._tails = hit, hit_time, tails
+
+    @property
+    def pos(self):
+        return self._pos[: self.count]
+
+    @property
+    def prev_pos(self):
+        return self._prev_pos[: self.count]
+
+    @property
+    def vel(self):
+        return self._vel[: self.count]
+
+    @property
+    def radius(self):
+        return self._radius[: self.count]
+
+    @property
+    def hit(self):
+        return self._hit[: self.count]
+
+    @property
+    def hit_time(self):
+        return self._hit_time[: self.count]
+
+    @property
+    def tails(self):
+        return self._tails[: self.count]
+
+    def __len__(self):
+        return self.count
+
+    def add(self, x, y, radius=10, vel_x=3, vel_y=3):
+        """
+        Adds one or more balls. Each argument can be a number or an array.
+
+        Returns:
+        - The index of the first new ball.
+        """
+        x, y, radius, vel_x, vel_y = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(a, dtype=float)) for a in (x, y, radius, vel_x, vel_y))
+        )
+        first = self.count
+        end = first + len(x)
+        if end > len(self._pos):
+            self._allocate(max(end, 2 * len(self._pos)))
+
+        self._pos[first:end, 0] = x
+        self._pos[first:end, 1] = y
+        self._prev_pos[first:end] = self._pos[first:end]
+        self._vel[first:end, 0] = vel_x
+        self._vel[first:end, 1] = vel_y
+        self._radius[first:end] = radius
+        self._hit[first:end] = False
+        self._hit_time[first:end] = 5
+        # A new ball has no history yet, its whole tail sits on its position.
+        self._tails[first:end] = self._pos[first:end, None, :]
+        self.count = end
+        return first
+
+    def interpolated(self, alpha):
+        """
+        Returns the positions a fraction alpha of the way from prev_pos to pos.
+        """
+        prev_pos = self.prev_pos
+        return prev_pos + (self.pos - prev_pos) * alpha
+
+    def tail_order(self):
+        """
+        Returns the indices into the tail ring from the oldest to the newest position.
+        """
+        start = self.tail_head - self.tail_length
+        return np.arange(start, self.tail_head) % self.MAX_TAILS
+
+    def update(self, dt):
+        """
+        Moves every ball by its velocity and records the new positions in the tails.
+
+        Parameters:
+        - dt: The time step for the update.
+        """
+        pos = self.pos
+        self.prev_pos[:] = pos
+        pos += self.vel * dt
+
+        self._tails[: self.count, self.tail_head] = pos
+        self.tail_head = (self.tail_head + 1) % self.MAX_TAILS
+        self.tail_length = min(self.tail_length + 1, self.MAX_TAILS)
+
+        hit = self.hit
+        hit_time = self.hit_time
+        hit_time[hit] -= 1
+        expired = hit & (hit_time <= 0)
+        hit[expired] = False
+        hit_time[expired] = 10
+
+    def resize(self, width_ratio, height_ratio):
+        """
+        Resizes the balls based on the given width and height ratios.
+
+        Parameters:
+        - width_ratio: The ratio to resize the balls' width.
+        - height_ratio: The ratio to resize the balls' height.
+        """
+        scale = np.array([width_ratio, height_ratio])
+        self.pos[:] *= scale
+        self.prev_pos[:] *= scale
+        self.tails[:] *= scale
+        scaling_factor = (width_ratio + height_ratio) / 2
+        self.vel[:] *= scaling_factor
+        self.radius[:] *= scaling_factor
@@ -0,0 +1,329 @@
+import argparse
+import multiprocessing
+import time
+import numpy as np
+from Pong.balls import elastic_collisions
+from Pong.components import Arena, Paddle
+from Pong.gamelogic import StateManager
+from Pong.physics import bounce_circles_off_aabbs, bounce_circles_off_walls
+
+WIDTH = 1024
+HEIGHT = 768
+
+
+def follow_policy(sim):
+    """
+    Moves each paddle to the active ball closest to it, like headless.BallFollower.
+
+    Args:
+        sim (BatchSimulator): The simulator.
+
+    Returns:
+        numpy.ndarray: The paddle targets, shape (n_arenas, 2).
+    """
+    distance = np.abs(sim.ball_pos[:, :, None, 0] - sim.paddle_x[None, None, :])
+    distance = np.where(sim.ball_active[:, :, None], distance, np.inf)
+    closest = np.argmin(distance, axis=1)
+    ball_y = np.take_along_axis(sim.ball_pos[:, :, 1], closest, axis=1)
+    return (ball_y - sim.paddle_height / 2) / sim.height
+
+
+def idle_policy(sim):
+    """
+    Leaves the paddles where they are.
+    """
+    return None
+
+
+POLICIES = {"follow": follow_policy, "idle": idle_policy}
+
+
+class BatchSimulator:
+    """
+    Steps many independent Pong matches at once with their state stacked in NumPy arrays.
+
+    Every arena has the same size and layout as the App's, and the balls follow the same rules as
+    Game.check_collisions and Game.check_goal: swept bounces off the walls and paddles, elastic ball
+    to ball collisions and a reset to the center after a goal. New balls are added with the rules of
+    Game.adjust_difficulty. The paddles move straight to their targets, without the hand filter.
+
+    Args:
+        n_arenas (int): The number of matches.
+        one_player (bool): Whether to play with only the left paddle. Default is False.
+        width (int): The width of the virtual screen. Default is WIDTH.
+        height (int): The height of the virtual screen. Default is HEIGHT.
+        seed (int): The seed for the random new balls. Default is None.
+        difficulty (bool): Whether to add balls as the left score grows. Default is True.
+
+    Attributes:
+        MAX_BALLS (int): The most balls an arena can hold, as allowed by adjust_difficulty.
+        x, y, width, height (float): The arena rectangle.
+        paddle_x (numpy.ndarray): The x-coordinate of the left and right paddle, shape (2,).
+        paddle_width, paddle_height (float): The paddle size.
+        paddle_y (numpy.ndarray): The paddle tops, shape (n_arenas, 2).
+        paddle_prev_y (numpy.ndarray): The paddle tops before the last step.
+        paddle_vel (numpy.ndarray): The paddle velocities, shape (n_arenas, 2).
+        ball_pos (numpy.ndarray): The ball positions, shape (n_arenas, MAX_BALLS, 2).
+        ball_prev_pos (numpy.ndarray): The ball positions before the last step.
+        ball_vel (numpy.ndarray): The ball velocities, shape (n_arenas, MAX_BALLS, 2).
+        ball_radius (numpy.ndarray): The ball radii, shape (n_arenas, MAX_BALLS).
+        ball_active (numpy.ndarray): Which ball slots are in play, shape (n_arenas, MAX_BALLS).
+        ball_hit (numpy.ndarray): The recently hit flags of the balls.
+        ball_hit_time (numpy.ndarray): The remaining time for the hit flags.
+        scores (numpy.ndarray): The left and right scores, shape (n_arenas, 2).
+    """
+
+    MAX_BALLS = 11
+    VELOCITIES = np.array([-7, -6, -5, -4, -3, 3, 4, 5, 6, 7])
+
+    def __init__(
+        self, n_arenas, one_player=False, width=WIDTH, height=HEIGHT, seed=None, difficulty=True
+    ):
+        arena = Arena(width, height)
+        self.n_arenas = n_arenas
+        self.one_player = one_player
+        self.difficulty = difficulty
+        self.rng = np.random.default_rng(seed)
+        self.x, self.y = arena.x, arena.y
+        self.width, self.height = arena.width, arena.height
+
+        self.paddle_width = Paddle.DEFAULT_WIDTH
+        self.paddle_height = Paddle.DEFAULT_HEIGHT
+        self.paddle_x = np.array([arena.x, arena.width + arena.x - Paddle.DEFAULT_WIDTH], dtype=float)
+        # The right paddle is removed in one player mode.
+        self.paddle_active = np.array([True, not one_player])
+        start_y = arena.height // 2 - Paddle.DEFAULT_HEIGHT // 2
+        self.paddle_y = np.full((n_arenas, 2), float(start_y))
+        self.paddle_prev_y = self.paddle_y.copy()
+        self.paddle_vel = np.zeros((n_arenas, 2))
+
+        shape = (n_arenas, self.MAX_BALLS)
+        self.ball_pos = np.zeros(shape + (2,))
+        self.ball_pos[:, 0] = (width // 2, height // 2)
+        self.ball_prev_pos = self.ball_pos.copy()
+        self.ball_vel = np.zeros(shape + (2,))
+        self.ball_vel[:, 0] = (3, 3)
+        self.ball_radius = np.zeros(shape)
+        self.ball_radius[:, 0] = 12
+        self.ball_active = np.zeros(shape, dtype=bool)
+        self.ball_active[:, 0] = True
+        self.ball_hit = np.zeros(shape, dtype=bool)
+        self.ball_hit_time = np.full(shape, 5.0)
+        self.scores = np.zeros((n_arenas, 2), dtype=np.int64)
+
+        # Every pair of ball slots in an arena, offset to the flattened ball index.
+        i, j = np.triu_indices(self.MAX_BALLS, 1)
+        base = (np.arange(n_arenas) * self.MAX_BALLS)[:, None]
+        self._pairs = ((base + i).ravel(), (base + j).ravel())
+
+    def step(self, dt, targets=None, offset=1):
+        """
+        Advances every match by one step.
+
+        Args:
+            dt (float): The time step in game time units.
+            targets (numpy.ndarray): The paddle tops to move to as a fraction of the arena height, shape (n_arenas, 2). NaN or None keeps a paddle's velocity.
+            offset (float): The distance to push balls off walls and paddles so they do not stick. Default is 1.
+        """
+        if targets is not None:
+            goal = np.asarray(targets, dtype=float) * self.height
+            self.paddle_vel = np.where(
+                np.isnan(goal), self.paddle_vel, (goal - self.paddle_y) / dt
+            )
+
+        # Component updates.
+        self.paddle_prev_y[:] = self.paddle_y
+        self.paddle_y += self.paddle_vel * dt
+        self.ball_prev_pos[:] = self.ball_pos
+        active = self.ball_active
+        self.ball_pos[active] += self.ball_vel[active] * dt
+        hit = self.ball_hit
+        self.ball_hit_time[hit] -= 1
+        expired = hit & (self.ball_hit_time <= 0)
+        hit[expired] = False
+        self.ball_hit_time[expired] = 10
+
+        self.check_collisions(offset)
+        if self.difficulty:
+            self.adjust_difficulty()
+
+    def check_collisions(self, offset=1):
+        """
+        Applies the rules of Game.check_collisions to every arena.
+        """
+        np.clip(self.paddle_y, self.y, self.y + self.height - self.paddle_height, out=self.paddle_y)
+
+        active = self.ball_active
+        pos, prev, vel, radius = self.ball_pos, self.ball_prev_pos, self.ball_vel, self.ball_radius
+
+        # Walls, the top one first like Game.
+        walls = ((self.y, -1), (self.y + self.height, 1))
+        bounce_circles_off_walls(
+            prev[..., 1], pos[..., 1], vel[..., 1], radius, walls, offset, mask=active
+        )
+
+        # Paddles, swept in each paddle's frame.
+        for side in np.flatnonzero(self.paddle_active):
+            arenas, balls = np.nonzero(active)
+            if len(arenas) == 0:
+                break
+            paddle_y = self.paddle_y[arenas, side]
+            rect = np.stack(
+                (
+                    np.full(len(arenas), self.paddle_x[side]),
+                    paddle_y,
+                    np.full(len(arenas), self.paddle_x[side] + self.paddle_width),
+                    paddle_y + self.paddle_height,
+                ),
+                axis=1,
+            )
+            end, v = pos[arenas, balls], vel[arenas, balls]
+            shift = paddle_y - self.paddle_prev_y[arenas, side]
+            paddle_hit = bounce_circles_off_aabbs(
+                prev[arenas, balls], end, v, radius[arenas, balls], rect, shift, offset
+            )
+            arenas, balls = arenas[paddle_hit], balls[paddle_hit]
+            pos[arenas, balls] = end[paddle_hit]
+            vel[arenas, balls] = v[paddle_hit]
+
+        self.check_goals(offset)
+
+        # Ball to ball collisions, only between balls of the same arena.
+        flat_active = active.ravel()
+        i, j = self._pairs
+        keep = flat_active[i] & flat_active[j]
+        elastic_collisions(
+            pos.reshape(-1, 2),
+            vel.reshape(-1, 2),
+            radius.ravel(),
+            self.ball_hit.reshape(-1),
+            (i[keep], j[keep]),
+        )
+
+    def check_goals(self, offset=1):
+        """
+        Applies the rules of Game.check_goal to every arena.
+        """
+        active = self.ball_active
+        pos, vel, radius = self.ball_pos, self.ball_vel, self.ball_radius
+
+        left_goal = active & (pos[..., 0] - radius <= self.x)
+        self.scores[:, 1] += left_goal.sum(axis=1)
+        self.reset_balls(left_goal)
+
+        right_goal = active & (pos[..., 0] + radius >= self.x + self.width)
+        self.scores[:, 0] += right_goal.sum(axis=1)
+        if self.one_player:
+            vel[right_goal, 0] *= -1
+            pos[right_goal, 0] -= offset
+        else:
+            self.reset_balls(right_goal)
+
+    def reset_balls(self, mask):
+        """
+        Moves the balls in mask back to the center of their arena and reverses them, like Game.reset_ball.
+        """
+        self.ball_pos[mask] = (self.x + self.width // 2, self.y + self.height // 2)
+        self.ball_prev_pos[mask] = self.ball_pos[mask]
+        self.ball_vel[mask] *= -1
+
+    def adjust_difficulty(self):
+        """
+        Adds a ball to every arena where the rules of Game.adjust_difficulty call for one.
+        """
+        count = self.ball_active.sum(axis=1)
+        left = self.scores[:, 0]
+        grow = (left > count**2 + 1) & (left > 0) & (count < self.MAX_BALLS)
+        arenas = np.flatnonzero(grow)
+        if len(arenas) == 0:
+            return
+        slots = np.argmin(self.ball_active[arenas], axis=1)
+        n = len(arenas)
+        self.ball_pos[arenas, slots] = (self.x + self.width // 2, self.y + self.height // 3)
+        self.ball_prev_pos[arenas, slots] = self.ball_pos[arenas, slots]
+        self.ball_vel[arenas, slots] = self.rng.choice(self.VELOCITIES, (n, 2))
+        self.ball_radius[arenas, slots] = self.rng.integers(5, 16, n)
+        self.ball_hit[arenas, slots] = False
+        self.ball_hit_time[arenas, slots] = 5
+        self.ball_active[arenas, slots] = True
+
+    def run(self, ticks, policy=follow_policy, dt=StateManager.STEP):
+        """
+        Runs every match for a number of steps.
+
+        Args:
+            ticks (int): The number of steps.
+            policy (callable): Called with the simulator before each step, returns the paddle targets. Default is follow_policy.
+            dt (float): The time step in game time units. Default is StateManager.STEP.
+
+        Returns:
+            numpy.ndarray: The scores, shape (n_arenas, 2).
+        """
+        for _ in range(ticks):
+            self.step(dt, policy(self))
+        return self.scores
+
+
+def _run_chunk(args):
+    """
+    Runs one chunk of arenas in a pool worker.
+    """
+    n_arenas, ticks, policy, seed, one_player = args
+    sim = BatchSimulator(n_arenas, one_player=one_player, seed=seed)
+    return sim.run(ticks, POLICIES[policy])
+
+
+def run_parallel(n_arenas, ticks, processes=None, policy="follow", seed=0, one_player=False):
+    """
+    Splits the arenas over a process pool and runs them.
+
+    Each process simulates a contiguous chunk of arenas with its own seed derived from seed.
+
+    Args:
+        n_arenas (int): The total number of matches.
+        ticks (int): The number of steps to run.
+        processes (int): The number of worker processes. Default is None, which uses every core.
+        policy (str): The name of a paddle policy in POLICIES. Default is "follow".
+        seed (int): The base seed. Default is 0.
+        one_player (bool): Whether to play with only the left paddle. Default is False.
+
+    Returns:
+        numpy.ndarray: The scores of every match, shape (n_arenas, 2).
+    """
+    processes = processes or multiprocessing.cpu_count()
+    chunks = [len(c) for c in np.array_split(np.arange(n_arenas), processes) if len(c)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    jobs = [(n, ticks, policy, s, one_player) for n, s in zip(chunks, seeds)]
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(len(jobs)) as pool:
+        return np.concatenate(pool.map(_run_chunk, jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many Pong matches at once")
+    parser.add_argument("--arenas", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="follow")
+    parser.add_argument("--one-player", action="store_true")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.processes > 1:
+        scores = run_parallel(
+            args.arenas, args.ticks, args.processes, args.policy, one_player=args.one_player
+        )
+    else:
+        sim = BatchSimulator(args.arenas, one_player=args.one_player, seed=0)
+        scores = sim.run(args.ticks, POLICIES[args.policy])
+    elapsed = time.perf_counter() - start
+
+    steps = args.arenas * args.ticks
+    simulated = steps * StateManager.STEP * 0.03
+    print(f"{steps} arena steps in {elapsed:.2f} s ({steps / elapsed:.0f} steps/s)")
+    print(f"Simulated {simulated:.0f} s of play, {simulated / elapsed:.0f}x faster than real time")
+    print(f"Mean score {scores[:, 0].mean():.2f} - {scores[:, 1].mean():.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import time
+import numpy as np
+from Pong.balls import BallSystem
+from Pong.physics import PhysicsWorld
+
+
+def make_balls(count, width, height, seed=0):
+    """
+    Creates randomly placed balls at the density of the menu.
+
+    Args:
+        count (int): The number of balls.
+        width (float): The width of the area.
+        height (float): The height of the area.
+        seed (int): The random seed. Default is 0.
+
+    Returns:
+        BallSystem: The balls.
+    """
+    rng = np.random.default_rng(seed)
+    balls = BallSystem(count)
+    balls.add(
+        rng.uniform(0, width, count),
+        rng.uniform(0, height, count),
+        radius=rng.uniform(5, 20, count),
+        vel_x=rng.uniform(-3, 3, count),
+        vel_y=rng.uniform(-3, 3, count),
+    )
+    return balls
+
+
+def time_collisions(balls, pairs, frames, width, height):
+    """
+    Steps the balls in a PhysicsWorld and returns the mean time spent on collisions per frame.
+
+    Args:
+        balls (BallSystem): The balls to simulate.
+        pairs (str): The broadphase, a name in PhysicsWorld.PAIR_BACKENDS.
+        frames (int): The number of frames to simulate.
+        width (float): The width of the area.
+        height (float): The height of the area.
+
+    Returns:
+        float: The mean time per frame in seconds.
+    """
+    world = PhysicsWorld((0, 0, width, height), pairs=pairs)
+    world.add_balls(balls)
+    total = 0.0
+    for _ in range(frames):
+        balls.update(1.0)
+        start = time.perf_counter()
+        world.step()
+        total += time.perf_counter() - start
+    return total / frames
+
+
+def run(counts, frames=50, brute_limit=4000):
+    """
+    Prints the collision cost of the brute force test and the spatial hash for each ball count.
+
+    The area grows with the ball count so the density stays the same as the 100 ball menu.
+
+    Args:
+        counts (list): The ball counts to test.
+        frames (int): The number of frames to simulate per count. Default is 50.
+        brute_limit (int): The largest count to run the brute force test on. Default is 4000.
+    """
+    print(f"{'balls':>7} {'all pairs':>12} {'spatial hash':>14}")
+    for count in counts:
+        side = 800 * np.sqrt(count / 100)
+        if count <= brute_limit:
+            brute = time_collisions(make_balls(count, side, side), "all_pairs", frames, side, side)
+            brute_text = f"{1000 * brute:9.3f} ms"
+        else:
+            brute_text = f"{'-':>12}"
+        hashed = time_collisions(
+            make_balls(count, side, side), "spatial_hash", frames, side, side
+        )
+        print(f"{count:>7} {brute_text} {1000 * hashed:11.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ball to ball collision detection")
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[10, 100, 500, 1000, 2000, 5000, 10000]
+    )
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--brute-limit", type=int, default=4000)
+    args = parser.parse_args()
+    run(args.counts, frames=args.frames, brute_limit=args.brute_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import numpy as np
+
+
+def _expand_ranges(starts, stops):
+    """
+    Expands per-item index ranges into flat (owner, index) arrays.
+
+    Args:
+        starts (numpy.ndarray): The first index of each range.
+        stops (numpy.ndarray): One past the last index of each range.
+
+    Returns:
+        tuple: (owners, indices), with one entry per index in any range.
+    """
+    counts = stops - starts
+    owners = np.repeat(np.arange(len(starts)), counts)
+    firsts = np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, starts[owners] + np.arange(len(owners)) - firsts
+
+
+class AllPairs:
+    """
+    A broadphase that returns every pair of balls. It has no setup cost, so it suits a handful of balls.
+    """
+
+    def pairs(self, pos, radius):
+        """
+        Returns every pair of balls as two index arrays (i, j).
+        """
+        return np.triu_indices(len(pos), 1)
+
+    def reset(self):
+        pass
+
+
+class SpatialHash:
+    """
+    A uniform grid broadphase for ball to ball collisions.
+
+    Balls are bucketed into square cells at least as wide as the largest ball, so two balls can only
+    touch when they are in the same or neighbouring cells. Only those pairs are returned for the
+    narrowphase test. The sort order of the previous frame is kept, and since balls rarely change
+    cells between frames, re-sorting it is close to linear.
+
+    Args:
+        cell_size (float): The width of a grid cell. Default is None, which uses the largest ball diameter.
+    """
+
+    # Neighbouring cells to look in, as (dx, dy). Only half the neighbourhood is needed since every
+    # pair is found from the cell that comes first.
+    NEIGHBOURS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size
+        self._order = None
+
+    def pairs(self, pos, radius):
+        """
+        Returns the pairs of balls that are close enough to possibly touch.
+
+        Args:
+            pos (numpy.ndarray): Ball positions of shape (n, 2).
+            radius (numpy.ndarray): Ball radii of shape (n,).
+
+        Returns:
+            tuple: Two index arrays (i, j) with one entry per candidate pair.
+        """
+        n = len(pos)
+        if n < 2:
+            self._order = None
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        cell_size = self.cell_size or 2 * float(radius.max())
+        cells = np.floor(pos / cell_size).astype(np.int64)
+        cells -= cells.min(axis=0)
+        # One spare column and row on each side so neighbour keys never wrap onto another row.
+        width = int(cells[:, 0].max()) + 3
+        keys = (cells[:, 1] + 1) * width + cells[:, 0] + 1
+
+        if self._order is not None and len(self._order) == n:
+            order = self._order[np.argsort(keys[self._order], kind="stable")]
+        else:
+            order = np.argsort(keys, kind="stable")
+        self._order = order
+        sorted_keys = keys[order]
+
+        # Later balls in the same cell.
+        positions = np.arange(n)
+        stops = np.searchsorted(sorted_keys, sorted_keys, side="right")
+        owners, others = _expand_ranges(positions + 1, stops)
+        first = [owners]
+        second = [others]
+
+        # Every ball in the neighbouring cells.
+        for dx, dy in self.NEIGHBOURS:
+            neighbour_keys = sorted_keys + dy * width + dx
+            starts = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+            stops = np.searchsorted(sorted_keys, neighbour_keys, side="right")
+            owners, others = _expand_ranges(starts, stops)
+            first.append(owners)
+            second.append(others)
+
+        return order[np.concatenate(first)], order[np.concatenate(second)]
+
+    def reset(self):
+        """
+        Forgets the previous sort order, e.g. after balls were added or removed.
+        """
+        self._order = None
@@ -1,6 +1,7 @@
-import pygame
+import array
 import numpy as np
-from scipy.signal import convolve2d
+import pygame
+from Pong.life import LIFE_BACKENDS, DirtyCells, fast_forward
 
 
 class Component:
@@ -8,6 +9,7 @@ class Component:
     Represents a component in the Pong game.
 
     A component is an element that appears in the game and can be updated and resized.
+    Components declare their attributes in __slots__, so they have no per instance __dict__.
 
     Methods:
     - copy(): Creates a copy of the component object.
@@ -15,6 +17,8 @@ class Component:
     - update(dt): Updates the component based on the given time step.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -36,27 +40,54 @@ class Ball(Component):
     - radius: The radius of the ball.
     - x: The x-coordinate of the ball's position.
     - y: The y-coordinate of the ball's position.
+    - prev_x: The x-coordinate before the last update, used to interpolate drawing.
+    - prev_y: The y-coordinate before the last update, used to interpolate drawing.
     - vel_x: The velocity of the ball in the x-direction.
     - vel_y: The velocity of the ball in the y-direction.
-    - tail_positions: A list of previous positions of the ball.
-    - max_tails: The maximum number of tail positions to keep.
+    - MAX_TAILS: The number of tail positions to keep.
+    - tails: A ring buffer of previous positions of the ball as a flat array of doubles, x and y interleaved.
+    - tail_head: The index in tails the next position is written to.
+    - tail_length: The number of valid positions in tails.
     - hit: A flag indicating if the ball has been hit.
     - hit_time: The remaining time for the hit effect.
 
     Methods:
     - copy(): Creates a copy of the ball object.
+    - tail_order(): Returns the tail indices from oldest to newest.
     - update(dt): Updates the ball's position and tail positions.
     - resize(width_ratio, height_ratio): Resizes the ball based on the given width and height ratios.
     """
 
+    MAX_TAILS = 20
+
+    __slots__ = (
+        "radius",
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "vel_x",
+        "vel_y",
+        "tails",
+        "tail_head",
+        "tail_length",
+        "hit",
+        "hit_time",
+    )
+
     def __init__(self, x, y, radius=10, vel_x=3, vel_y=3):
         self.radius = radius
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vel_x = vel_x
         self.vel_y = vel_y
-        self.tail_positions = [(x, y)]
-        self.max_tails = 20
+        self.tails = array.array("d", bytes(16 * self.MAX_TAILS))
+        self.tails[0] = x
+        self.tails[1] = y
+        self.tail_head = 1
+        self.tail_length = 1
         self.hit = False
         self.hit_time = 5
 
@@ -69,6 +100,14 @@ class Ball(Component):
         """
         return Ball(self.x, self.y, self.radius, self.vel_x, self.vel_y)
 
+    def tail_order(self):
+        """
+        Returns the position indices into the tail ring from the oldest to the newest position.
+        Position i is stored at tails[2 * i] and tails[2 * i + 1].
+        """
+        start = self.tail_head - self.tail_length
+        return [i % self.MAX_TAILS for i in range(start, self.tail_head)]
+
     def update(self, dt):
         """
         Updates the ball's position and tail positions based on the given time step.
@@ -76,12 +115,18 @@ class Ball(Component):
         Parameters:
         - dt: The time step for the update.
         """
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.vel_x * dt
         self.y += self.vel_y * dt
 
-        self.tail_positions.insert(0, (self.x, self.y))
-        if len(self.tail_positions) > self.max_tails:
-            self.tail_positions.pop()
+        # Overwrite the oldest position instead of shifting the whole tail.
+        head = 2 * self.tail_head
+        self.tails[head] = self.x
+        self.tails[head + 1] = self.y
+        self.tail_head = (self.tail_head + 1) % self.MAX_TAILS
+        if self.tail_length < self.MAX_TAILS:
+            self.tail_length += 1
 
         if self.hit:
             self.hit_time -= 1
@@ -99,6 +144,11 @@ class Ball(Component):
         """
         self.x *= width_ratio
         self.y *= height_ratio
+        self.prev_x *= width_ratio
+        self.prev_y *= height_ratio
+        for i in range(0, len(self.tails), 2):
+            self.tails[i] *= width_ratio
+            self.tails[i + 1] *= height_ratio
 
         scaling_factor = (width_ratio + height_ratio) / 2
         self.vel_x *= scaling_factor
@@ -117,6 +167,7 @@ class Paddle(Component):
     - height: The height of the paddle.
     - x: The x-coordinate of the paddle's position.
     - y: The y-coordinate of the paddle's position.
+    - prev_y: The y-coordinate before the last update, used to interpolate drawing.
     - speed: The speed of the paddle.
     - vel: The velocity of the paddle.
     - arena: The arena in which the paddle is located.
@@ -133,11 +184,26 @@ class Paddle(Component):
     DEFAULT_WIDTH = 20
     DEFAULT_HEIGHT = 120
 
+    __slots__ = (
+        "width",
+        "height",
+        "x",
+        "y",
+        "prev_y",
+        "speed",
+        "vel",
+        "arena",
+        "hit",
+        "hit_time",
+        "left",
+    )
+
     def __init__(self, x, y, arena, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT):
         self.width = width
         self.height = height
         self.x = x
         self.y = y
+        self.prev_y = y
         self.speed = 10
         self.vel = 0
         self.arena = arena
@@ -162,6 +228,7 @@ class Paddle(Component):
         Parameters:
         - dt: The time step for the update.
         """
+        self.prev_y = self.y
         self.y += self.vel * dt
 
         if self.hit:
@@ -183,6 +250,7 @@ class Paddle(Component):
 
         self.x *= width_ratio
         self.y *= height_ratio
+        self.prev_y *= height_ratio
 
         scaling_factor = (width_ratio + height_ratio) / 2
         self.vel *= scaling_factor
@@ -196,6 +264,7 @@ class Arena(Component):
     Attributes:
     - UPDATE_RATE: The update rate of the arena.
     - GRID_SCALE: The scale of the grid in the arena.
+    - LIFE_BACKEND: The default Game of Life backend, a name in LIFE_BACKENDS.
     - HEIGHT_RATIO: The height ratio of the arena to the game window.
     - WIDTH_RATIO: The width ratio of the arena to the game window.
     - width: The width of the arena.
@@ -206,21 +275,44 @@ class Arena(Component):
     - rows: The number of rows in the arena's grid.
     - update_counter: The counter for updating the arena.
     - cell_size: The size of each cell in the arena's grid.
-    - grid: The grid representing the state of the arena.
-    - dirty_cells: A list of cells that have changed state.
+    - life_backend: The name of the Game of Life backend.
+    - life: The Game of Life backend holding the cells.
+    - grid: A boolean array of the cells, built on request.
+    - dirty_cells: A DirtyCells buffer of the cells that have changed state since the last draw.
+      Only the renderer clears it. If it grows past the grid size, every cell is listed once instead.
 
     Methods:
     - copy(): Creates a copy of the arena object.
+    - get_cell(row, col): Returns whether a cell is alive.
+    - get_cells(rows, cols): Returns whether each of many cells is alive.
+    - set_cell(row, col): Brings a cell to life and marks it for drawing.
     - update(dt): Updates the arena's state.
+    - fast_forward(generations, exact): Advances the Game of Life many generations at once.
+    - mark_dirty(rows, cols): Adds cells to the ones drawn next.
     - resize(width_ratio, height_ratio): Resizes the arena based on the given width and height ratios.
     """
 
     UPDATE_RATE = 10
     GRID_SCALE = 5
+    LIFE_BACKEND = "bitpacked"
     HEIGHT_RATIO = 0.6
     WIDTH_RATIO = 0.6
 
-    def __init__(self, width, height):
+    __slots__ = (
+        "width",
+        "height",
+        "x",
+        "y",
+        "cols",
+        "rows",
+        "update_counter",
+        "cell_size",
+        "life_backend",
+        "life",
+        "dirty_cells",
+    )
+
+    def __init__(self, width, height, life_backend=None):
         # center the arena in the window
         self.width = int(width * self.WIDTH_RATIO)
         self.height = int(height * self.HEIGHT_RATIO)
@@ -232,8 +324,9 @@ class Arena(Component):
         self.rows = int(self.height // self.GRID_SCALE)
         self.update_counter = 0
         self.cell_size = self.width // self.cols, self.height // self.rows
-        self.grid = np.zeros((self.rows, self.cols))
-        self.dirty_cells = []
+        self.life_backend = life_backend or self.LIFE_BACKEND
+        self.life = LIFE_BACKENDS[self.life_backend](self.rows, self.cols)
+        self.dirty_cells = DirtyCells(self.rows * self.cols)
 
     def copy(self):
         """
@@ -242,7 +335,40 @@ class Arena(Component):
         Returns:
         - A new Arena object with the same attributes as the original arena.
         """
-        return Arena(self.width / Arena.WIDTH_RATIO, self.height / Arena.HEIGHT_RATIO)
+        return Arena(
+            self.width / Arena.WIDTH_RATIO, self.height / Arena.HEIGHT_RATIO, self.life_backend
+        )
+
+    @property
+    def grid(self):
+        return self.life.cells()
+
+    def get_cell(self, row, col):
+        """
+        Returns whether a cell is alive.
+        """
+        return self.life.get(row, col)
+
+    def get_cells(self, rows, cols):
+        """
+        Returns whether each of many cells is alive, without building the whole grid.
+
+        Parameters:
+        - rows: The rows of the cells, an integer array.
+        - cols: The columns of the cells, an integer array.
+        """
+        return self.life.get_many(rows, cols)
+
+    def set_cell(self, row, col):
+        """
+        Brings a cell to life and marks it for drawing.
+
+        Parameters:
+        - row: The row of the cell.
+        - col: The column of the cell.
+        """
+        if self.life.set(row, col):
+            self.dirty_cells.add(row, col)
 
     def update(self, dt):
         """
@@ -255,23 +381,39 @@ class Arena(Component):
         self.update_counter += dt
         if self.update_counter >= self.UPDATE_RATE:
             self.update_counter = 0
-            # convolving with this kernel gives count of cells around the center.
-            kernel = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
-            neighbors = convolve2d(
-                self.grid, kernel, mode="same", boundary="fill", fillvalue=0
-            )
+            # Advance the Game of Life and add the cells that have changed state
+            self.mark_dirty(*self.life.step())
 
-            # Apply the rules of Conway's Game of Life
-            birth = (neighbors == 3) & (self.grid == 0)
-            survive = ((neighbors == 2) | (neighbors == 3)) & (self.grid == 1)
-            new_grid = birth | survive
+    def fast_forward(self, generations, exact=True):
+        """
+        Advances the Game of Life many generations at once, e.g. to skip the background ahead after a pause.
 
-            # Find the cells that have changed state
-            changed_cells = np.where(new_grid != self.grid)
+        Most backends simply step every generation. With exact=False the "hashlife" backend jumps ahead
+        by powers of two generations instead and only applies the arena edges after each jump. That is
+        nearly free once the background has settled into still lifes and oscillators, but slower than
+        stepping the "bitpacked" backend while it is still chaotic. Exact hashlife steps are always
+        slower than the other backends.
 
-            self.dirty_cells = list(zip(changed_cells[0], changed_cells[1]))
+        Parameters:
+        - generations: The number of generations to advance.
+        - exact: Whether every generation must match the other backends. Default is True.
+        """
+        self.mark_dirty(*fast_forward(self.life, generations, exact))
 
-            self.grid = new_grid
+    def mark_dirty(self, rows, cols):
+        """
+        Adds cells to the ones drawn next, keeping those that have not been drawn yet.
+
+        Parameters:
+        - rows: The rows of the cells, an integer array.
+        - cols: The columns of the cells, an integer array.
+        """
+        dirty = self.dirty_cells
+        dirty.extend(rows, cols)
+        if len(dirty) > self.rows * self.cols:
+            # Nothing has drawn the arena for a while, so redraw all of it.
+            dirty.clear()
+            dirty.extend(*np.indices((self.rows, self.cols)).reshape(2, -1))
 
     def resize(self, width_ratio, height_ratio):
         """
@@ -288,8 +430,8 @@ class Arena(Component):
         self.cols = int(self.width // self.GRID_SCALE)
         self.rows = int(self.height // self.GRID_SCALE)
         self.cell_size = self.width // self.cols, self.height // self.rows
-        self.grid = np.zeros((self.rows, self.cols))
-        self.dirty_cells = []
+        self.life = LIFE_BACKENDS[self.life_backend](self.rows, self.cols)
+        self.dirty_cells = DirtyCells(self.rows * self.cols)
 
 
 class Scorer(Component):
@@ -308,6 +450,8 @@ class Scorer(Component):
 
     """
 
+    __slots__ = ("font", "score_left", "score_right")
+
     def __init__(self, font_size=36):
         self.font = pygame.font.SysFont(None, font_size)
         self.score_left = 0
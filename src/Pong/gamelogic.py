@@ -1,8 +1,12 @@
 import pygame
 from Pong.components import Ball, Arena, Paddle, Scorer
+from Pong.balls import BallSystem
+from Pong.physics import PhysicsWorld
 import math
 import time
-import cv2
+import numpy as np
+from Tracker.filters import AlphaBetaFilter
+from Tracker.results import empty_faces, empty_hands
 import random
 import os
 
@@ -12,22 +16,24 @@ class State:
     Base class for game states.
 
     Methods:
-        draw(self, surface):
-            Draw the state on the given surface.
+        draw(self, alpha=1.0):
+            Draw the state.
         on_event(self, event):
             Process the given event.
         on_update(self, dt):
             Update the state based on the time elapsed since the last update.
         on_resize(self):
             Resize the window.
+        on_resume(self, dt):
+            Catch up with the time the state was paused.
     """
 
-    def draw(self, surface):
+    def draw(self, alpha=1.0):
         """
-        Draw the state on the given surface.
+        Draw the state.
 
         Args:
-            surface (pygame.Surface): The surface to draw on.
+            alpha (float): The fraction of a physics step since the last update, used to interpolate motion.
         """
         pass
 
@@ -55,6 +61,15 @@ class State:
         """
         pass
 
+    def on_resume(self, dt):
+        """
+        Catch up with the time the state was paused.
+
+        Args:
+            dt (float): The time the state was paused, in game time units.
+        """
+        pass
+
 
 class Menu(State):
     """
@@ -64,13 +79,15 @@ class Menu(State):
         menu_items (list): A list of menu items.
         selected_item (int): The index of the selected menu item.
         animation (Animation): The animation object.
-        balls (list): A list of random balls.
+        rng (random.Random): The random number generator for the balls.
+        balls (BallSystem): The random balls bouncing behind the menu.
+        world (PhysicsWorld): Bounces the balls off the window edges and each other.
         mixer (Mixer): The sound mixer object.
 
     Methods:
-        __init__(self, animation, mixer):
+        __init__(self, animation, mixer, seed=None):
             Initialize the Menu state.
-        draw(self):
+        draw(self, alpha=1.0):
             Draw the menu state using the Animation object.
         on_event(self, event):
             Move the menu selection based on keyboard input. Press return to select an item.
@@ -82,48 +99,54 @@ class Menu(State):
             Resize the window.
     """
 
-    def __init__(self, animation, mixer):
+    def __init__(self, animation, mixer, seed=None):
         """
         Initialize the Menu state.
 
         Args:
             animation (Animation): The animation object.
             mixer (Mixer): The mixer object.
+            seed (int, optional): The seed for the random balls. Defaults to None, which picks one at random.
         """
+        self.rng = random.Random(seed)
         self.menu_items = ["One Player", "Two Player", "Quit"]
         self.selected_item = 0
         self.animation = animation
         self.w, self.h = self.animation.width, self.animation.height
         self.balls = self.random_balls(100)
+        self.world = PhysicsWorld((0, 0, self.w, self.h))
+        self.world.add_balls(self.balls)
         self.animation = animation
         self.mixer = mixer
 
     def random_balls(self, number):
         """
-        Generate a list of random balls.
+        Generate random balls.
 
         Args:
             number (int): The number of balls to generate.
 
         Returns:
-            list: A list of Ball objects.
-        """
-        return [
-            Ball(
-                random.randint(0, self.w),
-                random.randint(0, self.h),
-                radius=random.randint(4, 15),
-                vel_x=random.randint(-5, 5),
-                vel_y=random.randint(-5, 5),
-            )
-            for _ in range(number)
-        ]
+            BallSystem: The balls.
+        """
+        balls = BallSystem(number)
+        balls.add(
+            [self.rng.randint(0, self.w) for _ in range(number)],
+            [self.rng.randint(0, self.h) for _ in range(number)],
+            radius=[self.rng.randint(4, 15) for _ in range(number)],
+            vel_x=[self.rng.randint(-5, 5) for _ in range(number)],
+            vel_y=[self.rng.randint(-5, 5) for _ in range(number)],
+        )
+        return balls
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """
         Draw the menu state using the Animation object.
+
+        Args:
+            alpha (float): The fraction of a physics step since the last update, used to interpolate motion.
         """
-        self.animation.draw(self.balls)
+        self.animation.draw([self.balls], alpha)
         self.animation.draw_menu(self.menu_items, self.selected_item)
         self.animation.render()
 
@@ -161,8 +184,7 @@ class Menu(State):
         Args:
             dt (float): The time elapsed since the last update.
         """
-        for ball in self.balls:
-            ball.update(dt)
+        self.balls.update(dt)
         self.check_collisions()
 
     def check_collisions(self):
@@ -170,60 +192,9 @@ class Menu(State):
         Check for collisions between balls and boundaries or other balls.
 
         Ball to ball collisions are perfectly elastic and their mass is proportional to their area.
+        All balls are handled at once by the physics world.
         """
-
-        # offset to prevent balls from getting stuck in the boundaries
-        offset = 1
-
-        for i in range(len(self.balls)):
-            ball1 = self.balls[i]
-            # collision with walls
-            if ball1.y - ball1.radius <= 0 and ball1.vel_y < 0:
-                ball1.vel_y *= -1
-                ball1.y += offset
-
-            elif ball1.y + ball1.radius >= self.h and ball1.vel_y > 0:
-                ball1.vel_y *= -1
-                ball1.y -= offset
-
-            if ball1.x - ball1.radius <= 0 and ball1.vel_x < 0:
-                ball1.vel_x *= -1
-                ball1.x += offset
-
-            elif ball1.x + ball1.radius >= self.w and ball1.vel_x > 0:
-                ball1.vel_x *= -1
-                ball1.x -= offset
-
-            # collision with other balls
-            for j in range(i + 1, len(self.balls)):
-                ball2 = self.balls[j]
-
-                # skip if both balls have recently been hit
-                if ball1.hit and ball2.hit:
-                    continue
-
-                dx = ball1.x - ball2.x
-                dy = ball1.y - ball2.y
-                distance = (dx**2 + dy**2) ** 0.5
-
-                if distance < ball1.radius + ball2.radius:
-                    v1 = pygame.Vector2(ball1.vel_x, ball1.vel_y)
-                    v2 = pygame.Vector2(ball2.vel_x, ball2.vel_y)
-
-                    m1 = ball1.radius**2
-                    m2 = ball2.radius**2
-
-                    # Elastic Collision
-                    v1f = ((m1 - m2) * v1 + 2 * m2 * v2) / (m1 + m2)
-                    v2f = ((m2 - m1) * v2 + 2 * m1 * v1) / (m1 + m2)
-
-                    ball1.vel_x = v1f.x
-                    ball1.vel_y = v1f.y
-                    ball2.vel_x = v2f.x
-                    ball2.vel_y = v2f.y
-
-                    ball1.hit = True
-                    ball2.hit = True
+        self.world.step()
 
     def on_resize(self, w, h):
         """
@@ -235,7 +206,8 @@ class Menu(State):
         """
         self.w = w
         self.h = h
-        self.animation.resize(w, h, self.balls)
+        self.world.bounds = (0, 0, w, h)
+        self.animation.resize(w, h, [self.balls])
 
 
 class Game(State):
@@ -243,53 +215,86 @@ class Game(State):
     Represents the game state of the game.
 
     Attributes:
+        MAX_BACKGROUND_SKIP (int): The most Game of Life generations the background skips after a pause.
+        BACKGROUND_SKIP_TIME (float): The seconds after which a resume stops skipping the background.
         graphic (Animation): The animation object.
         components (list): A list of game components.
         mixer (Mixer): The sound mixer object.
-        hand_tracker (HandTracker): The hand tracker object.
-        face_tracker (FaceTracker): The face tracker object.
-        cap (cv2.VideoCapture): The video capture object.
+        tracker (TrackerWorker): The worker that publishes the newest hand and face landmarks.
         one_player (bool, optional): Whether the game is in one player mode. Defaults to False.
+        tracker_result (TrackerResult): The tracker result used in the last update.
+        hand_filters (list): One AlphaBetaFilter per paddle that smooths and predicts its hand position.
+        clock (callable): Returns the current time in the tracker's timebase.
+        background (bool): Whether the Game of Life background is updated. It does not affect play.
+        seed (int): The seed of rng.
+        rng (random.Random): The random number generator for new balls, so a seeded game can be reproduced.
+        input_log (InputLog): Records the dt and paddle targets of every update, or None.
+        input_replay (InputReplay): Supplies recorded paddle targets instead of the tracker, or None.
         arena (Arena): The arena object.
         scorer (Scorer): The scorer object.
         paddles (list): A list of paddle objects.
         balls (list): A list of ball objects.
         others (list): A list of other game components.
+        world (PhysicsWorld): Resolves the collisions of the balls and paddles. Its events play the sounds and score the goals.
+        sounds (list): The sounds requested since the last frame was drawn, each at most once.
         frame_start_time (float): The start time of the current frame.
         fps (float): The frames per second of the game.
 
     Methods:
-        __init__(self, graphic, components, mixer, hand_tracker, face_tracker, cap, one_player=False):
+        __init__(self, graphic, components, mixer, tracker, one_player=False, filter_options=None, clock=time.perf_counter, background=True, seed=None, input_log=None, input_replay=None):
             Initialize the Game state.
-        draw(self):
+        draw(self, alpha=1.0):
             Draw the game state.
         update(self, dt):
             Update the game state.
+        read_targets(self, dt):
+            Read where the paddles should be at the end of this step from the tracker.
         on_event(self, event):
             Handles keyboard arrow inputs to move the paddles.
         on_resize(self, w, h):
             Resize the window.
+        on_resume(self, dt):
+            Skip the background ahead by the time the game was paused.
         adjust_difficulty(self):
             Adjust the game difficulty based on the score.
         update_background(self):
             Update the background of the game.
-        check_goal(self, ball):
-            Check if the ball passes the boundaries and update the score.
+        arena_bounds(self):
+            Return the arena rectangle used as the bounds of the physics world.
+        add_ball(self, ball):
+            Add a ball to the game and its physics world.
+        queue_sound(self, sound):
+            Request a sound for the next frame.
+        check_goal(self, ball, side):
+            Update the score when a ball reaches a goal.
+        on_paddle_hit(self, ball, paddle):
+            Queue the paddle sound and flash the paddle when a ball bounces off it.
+        handle_events(self):
+            Apply the events of the last physics step.
+        play_sounds(self):
+            Play the sounds requested since the last frame.
         reset_ball(self, ball):
             Reset the ball's position and velocity.
         check_collisions(self):
             Check for collisions between the balls, paddles, and boundaries.
     """
 
+    MAX_BACKGROUND_SKIP = 1000
+    BACKGROUND_SKIP_TIME = 0.01
+
     def __init__(
         self,
         graphic,
         components,
         mixer,
-        hand_tracker,
-        face_tracker,
-        cap,
+        tracker,
         one_player=False,
+        filter_options=None,
+        clock=time.perf_counter,
+        background=True,
+        seed=None,
+        input_log=None,
+        input_replay=None,
     ):
         """
         Initialize the Game state.
@@ -298,10 +303,14 @@ class Game(State):
             graphic (Animation): The animation object.
             components (list): A list of game components.
             mixer (Mixer): The sound mixer object.
-            hand_tracker (HandTracker): The hand tracker object.
-            face_tracker (FaceTracker): The face tracker object.
-            cap (cv2.VideoCapture): The video capture object.
+            tracker (TrackerWorker): The worker that publishes the newest hand and face landmarks.
             one_player (bool, optional): Whether the game is in one player mode. Defaults to False.
+            filter_options (dict, optional): Keyword arguments for every paddle's AlphaBetaFilter. Defaults to None.
+            clock (callable, optional): Returns the current time in the tracker's timebase. Defaults to time.perf_counter.
+            background (bool, optional): Whether to run the Game of Life background. Defaults to True.
+            seed (int, optional): The seed for the random new balls. Defaults to None, which picks one at random.
+            input_log (InputLog, optional): Records the input of every update. Defaults to None.
+            input_replay (InputReplay, optional): Replays recorded input instead of reading the tracker. Defaults to None.
         """
         self.graphic = graphic
         self.components = [c.copy() for c in components]
@@ -317,11 +326,16 @@ class Game(State):
 
         self.mixer = mixer
 
-        self.hand_tracker = hand_tracker
-        self.face_tracker = face_tracker
-        self.cap = cap
-        self.hand_landmarks = None
-        self.face_landmarks = None
+        self.tracker = tracker
+        self.clock = clock
+        self.background = background
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.input_log = input_log
+        self.input_replay = input_replay
+        self.tracker_result = None
+        self.hand_landmarks = empty_hands()
+        self.face_landmarks = empty_faces()
 
         # Parse the components
         for component in self.components:
@@ -344,9 +358,35 @@ class Game(State):
                     self.paddles.pop()
                     break
 
-    def draw(self):
+        # Each paddle gets its own filter so they can be tuned separately.
+        self.hand_filters = [
+            AlphaBetaFilter(**(filter_options or {})) for _ in self.paddles
+        ]
+
+        # The left and right edges of the arena are goals, the top and bottom are walls.
+        self.world = PhysicsWorld(self.arena_bounds(), goals=("left", "right"))
+        self.world.add_balls(self.balls)
+        for paddle in self.paddles:
+            self.world.add_paddle(paddle)
+        self.sounds = []
+        self.world.on("wall", lambda ball: self.queue_sound("wall"))
+        self.world.on("paddle", self.on_paddle_hit)
+        self.world.on("goal", self.check_goal)
+        self.world.on("ball", lambda ball, other: self.queue_sound("ball"))
+
+    def arena_bounds(self):
+        """
+        Returns the arena rectangle as (left, top, right, bottom).
+        """
+        arena = self.arena
+        return (arena.x, arena.y, arena.x + arena.width, arena.y + arena.height)
+
+    def draw(self, alpha=1.0):
         """
         Draw the game state.
+
+        Args:
+            alpha (float): The fraction of a physics step since the last update, used to interpolate motion.
         """
 
         # compute FPS
@@ -355,7 +395,8 @@ class Game(State):
             self.fps = 1 / time_diff if time_diff > 0 else 0
         self.frame_start_time = time.time()
 
-        self.graphic.draw(self.components)
+        self.play_sounds()
+        self.graphic.draw(self.components, alpha)
         self.graphic.draw_hand_landmarks(self.hand_landmarks, self.arena)
         self.graphic.draw_face_landmarks(self.face_landmarks, self.arena)
         self.graphic.draw_fps(self.fps)
@@ -369,41 +410,65 @@ class Game(State):
             dt (float): The time elapsed since the last update.
         """
 
-        # Read frame from camera
-        ret, frame = self.cap.read()
-        if not ret:
-            print("Failed to grab frame")
-            return
-        frame = cv2.flip(frame, 1)
+        if self.input_replay is not None:
+            targets = self.input_replay.next_targets()
+        else:
+            targets = self.read_targets(dt)
+        if self.input_log is not None:
+            self.input_log.write(dt, targets)
 
-        self.hand_tracker.find_hands(frame, draw=False)
-        self.hand_landmarks = self.hand_tracker.get_landmarks()
-        self.face_tracker.find_faces(frame, draw=False)
-        self.face_landmarks = self.face_tracker.get_landmarks()
+        # Every paddle is driven to its target with the same arithmetic live and in a replay.
+        for paddle, target in zip(self.paddles, targets):
+            paddle.vel = (target - paddle.y) / dt
 
-        # Update the paddles based on detected hand landmarks
-        for paddle in self.paddles:
-            if paddle.x < self.arena.width // 2 + self.arena.x:
-                left = True
-            else:
-                left = False
-            if self.hand_landmarks:
-                for hand_landmark in self.hand_landmarks:
-                    hand_x = hand_landmark.landmark[0].x * self.arena.width
-                    hand_y = hand_landmark.landmark[0].y * self.arena.height
-                    if hand_x < self.arena.width // 2 and left:
-                        paddle.vel = (hand_y - paddle.y) / dt
-                        break
-                    elif hand_x > self.arena.width // 2 and not left:
-                        paddle.vel = (hand_y - paddle.y) / dt
-                        break
-
-        self.update_background()
+        if self.background:
+            self.update_background()
         for component in self.components:
+            if component is self.arena and not self.background:
+                continue
             component.update(dt)
         self.check_collisions()
         self.adjust_difficulty()
 
+    def read_targets(self, dt):
+        """
+        Read where the paddles should be at the end of this step from the tracker.
+
+        The filters predict the hand forward from the frame's capture time to now to hide tracker latency.
+        A paddle without a hand keeps moving at its current velocity, e.g. the one set by the arrow keys.
+
+        Args:
+            dt (float): The time step of the update.
+
+        Returns:
+            list: The target top position of every paddle.
+        """
+        # Use the freshest landmarks the tracker worker has published.
+        self.tracker_result = self.tracker.latest()
+        self.hand_landmarks = self.tracker_result.hands
+        self.face_landmarks = self.tracker_result.faces
+
+        now = self.clock()
+        wrists = self.tracker_result.wrists() * (self.arena.width, self.arena.height)
+        half = self.arena.width // 2
+        left_hands = np.flatnonzero(wrists[:, 0] < half)
+        right_hands = np.flatnonzero(wrists[:, 0] > half)
+        targets = []
+        for paddle, hand_filter in zip(self.paddles, self.hand_filters):
+            if paddle.x < self.arena.width // 2 + self.arena.x:
+                hands = left_hands
+            else:
+                hands = right_hands
+            if len(hands):
+                hand_y = float(wrists[hands[0], 1])
+                hand_filter.update(hand_y, self.tracker_result.timestamp)
+                targets.append(hand_filter.predict(now))
+            else:
+                # Start over when the hand comes back instead of predicting from where it was lost.
+                hand_filter.reset()
+                targets.append(paddle.y + paddle.vel * dt)
+        return targets
+
     def on_event(self, event):
         """
         Handles keyboard arrow inputs to move the paddles.
@@ -441,6 +506,32 @@ class Game(State):
         self.graphic.resize(w, h, self.components)
         self.graphic.width = w
         self.graphic.height = h
+        self.world.bounds = self.arena_bounds()
+
+    def on_resume(self, dt):
+        """
+        Skip the background ahead by the time the game was paused, at most MAX_BACKGROUND_SKIP generations.
+
+        The background does not affect play, so it jumps ahead without the exact edges where the
+        backend supports it. A chaotic background can take seconds to skip that far, so it is
+        skipped in chunks that double in size, and stops early once BACKGROUND_SKIP_TIME has passed
+        rather than freezing the first frame.
+
+        Args:
+            dt (float): The time the game was paused, in game time units.
+        """
+        if not self.background:
+            return
+        generations = min(int(dt // self.arena.UPDATE_RATE), self.MAX_BACKGROUND_SKIP)
+        deadline = time.perf_counter() + self.BACKGROUND_SKIP_TIME
+        chunk = 1
+        while generations > 0:
+            chunk = min(chunk, generations)
+            self.arena.fast_forward(chunk, exact=False)
+            generations -= chunk
+            chunk *= 2
+            if time.perf_counter() >= deadline:
+                break
 
     def adjust_difficulty(self):
         """
@@ -466,14 +557,24 @@ class Game(State):
             ball = Ball(
                 self.arena.x + self.arena.width // 2,
                 self.arena.y + self.arena.height // 3,
-                radius=random.randint(5, 15),
-                vel_x=random.choice(vel_array),
-                vel_y=random.choice(vel_array),
+                radius=self.rng.randint(5, 15),
+                vel_x=self.rng.choice(vel_array),
+                vel_y=self.rng.choice(vel_array),
             )
-            self.balls.append(ball)
-            self.components.append(ball)
+            self.add_ball(ball)
             add_ball = False
 
+    def add_ball(self, ball):
+        """
+        Add a ball to the game and its physics world.
+
+        Args:
+            ball (Ball): The ball object.
+        """
+        self.balls.append(ball)
+        self.components.append(ball)
+        self.world.add_ball(ball)
+
     def update_background(self):
         """
         Update the background of the game.
@@ -483,36 +584,33 @@ class Game(State):
         for ball in self.balls:
             col = int((ball.x - self.arena.x) // self.arena.cell_size[0])
             row = int((ball.y - self.arena.y) // self.arena.cell_size[1])
-            if col < self.arena.cols and row < self.arena.rows:
-                if not self.arena.grid[row][col]:
-                    self.arena.grid[row][col] = 1
-                    self.arena.dirty_cells.append(
-                        (row, col)
-                    )  # mark cell as dirty for drawing
+            if 0 <= col < self.arena.cols and 0 <= row < self.arena.rows:
+                self.arena.set_cell(row, col)  # marks the cell as dirty for drawing
 
-    def check_goal(self, ball):
+    def check_goal(self, ball, side):
         """
-        Check if the ball passes the boundaries and update the score.
+        Update the score when a ball reaches a goal. Called for the goal events of the physics world.
 
         Args:
             ball (Ball): The ball object.
+            side (str): The goal the ball reached, "left" or "right".
         """
 
         # offset to prevent balls from getting stuck in the boundaries
-        offset = 1
+        offset = self.world.offset
 
-        if ball.x - ball.radius <= self.arena.x:
+        if side == "left":
             self.scorer.score_right += 1
             sound = "lose" if self.one_player else "score"
-            self.mixer.play_sound(sound)
+            self.queue_sound(sound)
             self.reset_ball(ball)
 
-        if ball.x + ball.radius >= self.arena.x + self.arena.width:
+        if side == "right":
             self.scorer.score_left += 1
             if self.one_player:
                 ball.vel_x *= -1
                 ball.x -= offset
-            self.mixer.play_sound("score")
+            self.queue_sound("score")
             if not self.one_player:
                 self.reset_ball(ball)
 
@@ -525,124 +623,113 @@ class Game(State):
         """
         ball.x = self.arena.x + self.arena.width // 2
         ball.y = self.arena.y + self.arena.height // 2
+        # Jump straight to the center instead of drawing the ball sliding there.
+        ball.prev_x = ball.x
+        ball.prev_y = ball.y
         ball.vel_x *= -1
         ball.vel_y *= -1
 
+    def on_paddle_hit(self, ball, paddle):
+        """
+        Queue the paddle sound and flash the paddle when a ball bounces off it. Called for the paddle events of the physics world.
+
+        Args:
+            ball (Ball): The ball object.
+            paddle (Paddle): The paddle object.
+        """
+        self.queue_sound("paddle")
+        paddle.hit = True
+
+    def queue_sound(self, sound):
+        """
+        Request a sound for the next frame. A sound requested many times before a frame is drawn is played once,
+        however many physics steps the frame ran.
+
+        Args:
+            sound (str): The name of the sound.
+        """
+        if sound not in self.sounds:
+            self.sounds.append(sound)
+
+    def handle_events(self):
+        """
+        Apply the events of the last physics step.
+
+        Goals are scored by the physics step itself, before the balls are collided with each
+        other. Paddle flashes and the other sounds are applied here afterwards, and the sounds
+        are queued for play_sounds().
+        """
+        self.world.dispatch()
+
+    def play_sounds(self):
+        """
+        Play the sounds requested since the last frame, each once, and clear them.
+
+        This is called once per drawn frame, so a frame that ran several physics steps does not
+        play the same sound several times.
+        """
+        for sound in self.sounds:
+            self.mixer.play_sound(sound)
+        self.sounds.clear()
+
     def check_collisions(self):
         """
         Check for collisions between balls and boundaries or other balls.
 
-        Ball to ball collisions are perfectly elastic and their mass is proportional to their area.
+        The physics world keeps the paddles in the arena, sweeps the balls against the walls and
+        paddles so fast balls cannot skip them, and only then checks the goals. Ball to ball
+        collisions are perfectly elastic and their mass is proportional to their area. The events
+        of the step are handled once it is done.
         """
-        # offset to prevent balls from getting stuck in the boundaries
-        offset = 1
-
-        for i in range(len(self.balls)):
-            ball1 = self.balls[i]
-
-            # collisions with walls and goals
-            if ball1.y - ball1.radius <= self.arena.y and ball1.vel_y < 0:
-                ball1.vel_y *= -1
-                ball1.y += offset
-                self.mixer.play_sound("wall")
-            elif (
-                ball1.y + ball1.radius >= self.arena.y + self.arena.height
-                and ball1.vel_y > 0
-            ):
-                ball1.vel_y *= -1
-                ball1.y -= offset
-                self.mixer.play_sound("wall")
-            self.check_goal(ball1)
-
-            for paddle in self.paddles:
-                # Check collision with left paddle
-                if paddle.x < self.arena.width // 2 + self.arena.x:
-                    if (
-                        paddle.x + paddle.width + ball1.radius > ball1.x > paddle.x
-                        and paddle.y < ball1.y < paddle.y + paddle.height
-                        and ball1.vel_x < 0
-                    ):
-                        ball1.vel_x *= -1
-                        ball1.x += offset
-                        self.mixer.play_sound("paddle")
-                        paddle.hit = True
-
-                # Check collision with right paddle
-                if paddle.x > self.arena.width // 2 + self.arena.x:
-                    if (
-                        paddle.x - ball1.radius < ball1.x < paddle.x + paddle.width
-                        and paddle.y < ball1.y < paddle.y + paddle.height
-                        and ball1.vel_x > 0
-                    ):
-                        ball1.vel_x *= -1
-                        ball1.x -= offset
-                        self.mixer.play_sound("paddle")
-                        paddle.hit = True
-
-                # Check if the paddle is out of bounds
-                if paddle.y < self.arena.y:
-                    paddle.y = self.arena.y
-                elif paddle.y + paddle.height > self.arena.y + self.arena.height:
-                    paddle.y = self.arena.y + self.arena.height - paddle.height
-
-            # collision with other balls
-            for j in range(i + 1, len(self.balls)):
-
-                ball2 = self.balls[j]
-                # skip if both balls have recently been hit
-                if ball1.hit and ball2.hit:
-                    continue
-                dx = ball1.x - ball2.x
-                dy = ball1.y - ball2.y
-                distance = (dx**2 + dy**2) ** 0.5
-                if distance < ball1.radius + ball2.radius:
-                    # Collision occurred
-                    v1 = pygame.Vector2(ball1.vel_x, ball1.vel_y)
-                    v2 = pygame.Vector2(ball2.vel_x, ball2.vel_y)
-
-                    m1 = ball1.radius**2
-                    m2 = ball2.radius**2
-
-                    # Elastic Collision
-                    v1f = ((m1 - m2) * v1 + 2 * m2 * v2) / (m1 + m2)
-                    v2f = ((m2 - m1) * v2 + 2 * m1 * v1) / (m1 + m2)
-
-                    ball1.vel_x = v1f.x
-                    ball1.vel_y = v1f.y
-                    ball2.vel_x = v2f.x
-                    ball2.vel_y = v2f.y
-
-                    ball1.hit = True
-                    ball2.hit = True
-                    self.mixer.play_sound("ball")
-                    # print("Collision")
+        self.world.step()
+        self.handle_events()
 
 
 class StateManager(State):
     """
     Manages the game states.
 
+    The physics runs in fixed steps of STEP game time units, where one unit is MS_PER_UNIT. Elapsed time
+    is collected in an accumulator and used up one step at a time, so the simulation does not
+    depend on the frame rate. If a frame took so long that more than max_steps steps are owed,
+    the rest is dropped and the game slows down for a moment instead of spending even longer
+    catching up. The leftover fraction of a step is passed to draw to interpolate the motion.
+
     Attributes:
+        MS_PER_UNIT (int): The milliseconds in one game time unit.
+        STEP (float): The default physics step in game time units.
+        MAX_STEPS (int): The default maximum number of physics steps per update.
         one_player (State): The one player game state.
         two_player (State): The two player game state.
         menu (State): The menu state.
         state (State): The current state.
         last_update (int): The time of the last update.
+        step (float): The physics step in game time units.
+        max_steps (int): The maximum number of physics steps per update.
+        accumulator (float): The simulated time owed to the physics.
+        alpha (float): The fraction of a step left in the accumulator, from 0 to 1.
+        paused_at (dict): The time each state was last left, used to tell it how long it was paused.
 
     Methods:
-        __init__(self, one_player, two_player, menu):
+        __init__(self, one_player, two_player, menu, step=STEP, max_steps=MAX_STEPS):
             Initialize the StateManager.
         draw(self):
-            Draw the current state.
+            Draw the current state between the last two physics steps.
         on_event(self, event):
             Process the given event.
+        set_state(self, state):
+            Switch to another state and let it catch up with the time it was paused.
         update(self):
-            Update the current state.
+            Run the physics steps owed since the last update.
         on_resize(self, w, h):
             Resize the window.
     """
 
-    def __init__(self, one_player, two_player, menu):
+    MS_PER_UNIT = 30
+    STEP = 1.0
+    MAX_STEPS = 4
+
+    def __init__(self, one_player, two_player, menu, step=STEP, max_steps=MAX_STEPS):
         """
         Initialize the StateManager.
 
@@ -650,18 +737,25 @@ class StateManager(State):
             one_player (State): The one player game state.
             two_player (State): The two player game state.
             menu (State): The menu state.
+            step (float, optional): The physics step in game time units. Defaults to STEP.
+            max_steps (int, optional): The maximum number of physics steps per update. Defaults to MAX_STEPS.
         """
         self.one_player = one_player
         self.two_player = two_player
         self.menu = menu
         self.state = self.menu
         self.last_update = pygame.time.get_ticks()
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.paused_at = {}
 
     def draw(self):
         """
-        Draw the current state.
+        Draw the current state between the last two physics steps.
         """
-        self.state.draw()
+        self.state.draw(self.alpha)
 
     def on_event(self, event):
         """
@@ -677,24 +771,53 @@ class StateManager(State):
             self.on_resize(event.w, event.h)
         elif event.type == pygame.KEYDOWN:
             if event.key == (pygame.K_ESCAPE or pygame.K_p):
-                self.state = self.menu if self.state is not self.menu else self.state
+                self.set_state(self.menu)
 
         state_code = self.state.on_event(event)
 
         if state_code == "One Player":
-            self.state = self.one_player
+            self.set_state(self.one_player)
         if state_code == "Two Player":
-            self.state = self.two_player
+            self.set_state(self.two_player)
+
+    def set_state(self, state):
+        """
+        Switch to another state and let it catch up with the time it was paused.
+
+        Args:
+            state (State): The state to switch to.
+        """
+        if state is self.state:
+            return
+        now = pygame.time.get_ticks()
+        self.paused_at[self.state] = now
+        self.state = state
+        if state in self.paused_at:
+            state.on_resume((now - self.paused_at[state]) / self.MS_PER_UNIT)
 
     def update(self):
         """
-        Update the current state according to the time elapsed since the last update.
+        Run the physics steps owed since the last update.
+
+        Returns:
+            int: The number of steps that were run.
         """
         now = pygame.time.get_ticks()
         dt = now - self.last_update
         self.last_update = now
-        # print(dt)
-        self.state.update(dt / 30)
+        self.accumulator += dt / self.MS_PER_UNIT
+
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.state.update(self.step)
+            self.accumulator -= self.step
+            steps += 1
+        if self.accumulator >= self.step:
+            # Too far behind, drop the time that could not be simulated.
+            self.accumulator %= self.step
+
+        self.alpha = self.accumulator / self.step
+        return steps
 
     def on_resize(self, w, h):
         """
@@ -1,7 +1,9 @@
 import random
 import pygame
 from Pong.components import Ball, Arena, Paddle, Scorer
+from Pong.balls import BallSystem
 import math
+import numpy as np
 
 
 class Animation:
@@ -16,10 +18,12 @@ class Animation:
     - draw_surf (pygame.Surface): The surface for drawing the game components.
     - font (pygame.font.Font): The font used for rendering text.
     - menu_surf (pygame.Surface): The surface for drawing the menu overlay.
+    - alpha (float): How far between the last two physics steps to draw the moving components.
+    - arena_style (str): How the Game of Life cells are drawn, one of ARENA_STYLES.
 
     Methods:
-    - __init__(self, height, width): Initializes the Animation object.
-    - draw(self, components): Draws the game components on the draw_surf.
+    - __init__(self, height, width, arena_style="ellipse"): Initializes the Animation object.
+    - draw(self, components, alpha=1.0): Draws the game components on the draw_surf.
     - render(self): Renders the draw_surf and arena_surf on the screen.
     - draw_component(self, component): Draws a specific game component.
     - draw_hand_landmarks(self, landmarks, arena): Draws hand landmarks on the draw_surf.
@@ -28,19 +32,32 @@ class Animation:
     - draw_menu(self, menu_items, selected_item): Draws the menu on the draw_surf.
     - resize(self, w, h, components): Resizes the animation and game components.
     - draw_ball(self, ball): Draws the ball component.
+    - draw_ball_system(self, balls): Draws every ball in a BallSystem.
     - draw_paddle(self, paddle): Draws the paddle component.
     - draw_arena(self, arena): Draws the arena component.
+    - draw_cells_square(self, arena, rows, cols, alive): Draws cells as squares through a grid-sized pixel buffer.
+    - draw_cells_sprite(self, arena, rows, cols, alive): Draws cells by stamping round sprites.
     - draw_scorer(self, scorer): Draws the scorer component.
     """
 
-    def __init__(self, height, width):
+    # "ellipse" draws every changed cell as a circle, "square" writes the grid into a pixel buffer
+    # and scales it up, "sprite" stamps pre-drawn circles in one call.
+    ARENA_STYLES = ("ellipse", "square", "sprite")
+    ALIVE_COLOR = (20, 255, 90)
+    DEAD_COLOR = (0, 0, 0)
+    SPRITE_KEY = (255, 0, 255)
+
+    def __init__(self, height, width, arena_style="ellipse"):
         """
         Initializes the Animation object.
 
         Parameters:
         - height (int): The height of the animation screen.
         - width (int): The width of the animation screen.
+        - arena_style (str): How the Game of Life cells are drawn, one of ARENA_STYLES. Default is "ellipse".
         """
+        if arena_style not in self.ARENA_STYLES:
+            raise ValueError(f"Unknown arena style: {arena_style}")
         self.height = height
         self.width = width
         self.screen = pygame.display.set_mode(
@@ -48,15 +65,26 @@ class Animation:
         )
         self.arena_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.draw_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.alpha = 1.0
+        self.arena_style = arena_style
+        # Buffers of the square and sprite styles, created for the current grid and cell size.
+        self.cell_surf = None
+        self.cell_pixels = None
+        self.cell_sprites = None
         pygame.display.set_caption("Hand-Pong")
 
-    def draw(self, components):
+    def draw(self, components, alpha=1.0):
         """
         Draws the game components on the draw_surf.
 
+        Balls and paddles are drawn between their previous and current positions so motion stays
+        smooth when the physics runs at a different rate than the screen.
+
         Parameters:
         - components (list): A list of game components to be drawn.
+        - alpha (float): The fraction of a physics step since the last update, from 0 to 1. Default is 1.0.
         """
+        self.alpha = alpha
 
         # Draw the background slightly transparent for smoothing effect
         self.draw_surf.fill((0, 0, 0, 220))
@@ -80,6 +108,8 @@ class Animation:
         """
         if type(component) is Ball:
             self.draw_ball(component)
+        elif type(component) is BallSystem:
+            self.draw_ball_system(component)
         elif type(component) is Paddle:
             self.draw_paddle(component)
         elif type(component) is Arena:
@@ -95,23 +125,18 @@ class Animation:
         The hands are scaled fit nicely on the screen with respect to the arena.
 
         Parameters:
-        - landmarks (list): A list of hand landmarks.
+        - landmarks (numpy.ndarray): Hand landmarks of shape (n_hands, 21, 3), as stored in TrackerResult.hands.
         - arena (object): The arena component.
         """
         scale = 0.2
-        if landmarks:
-            for hand in landmarks:
-                x_0, y_0 = (
-                    hand.landmark[0].x * self.width,
-                    hand.landmark[0].y * arena.height,
-                )
-                for landmark in hand.landmark:
-                    x, y = int(landmark.x * arena.width * scale), int(
-                        landmark.y * arena.height * scale
-                    )
-                    pygame.draw.circle(
-                        self.draw_surf, (150, 0, 0), (x + x_0, y + y_0), 3
-                    )
+        if len(landmarks) == 0:
+            return
+        # Every hand is drawn small, anchored at its wrist.
+        origins = landmarks[:, 0, :2] * (self.width, arena.height)
+        offsets = (landmarks[:, :, :2] * (arena.width * scale, arena.height * scale)).astype(int)
+        points = offsets + origins[:, None, :]
+        for x, y in points.reshape(-1, 2).tolist():
+            pygame.draw.circle(self.draw_surf, (150, 0, 0), (x, y), 3)
 
     def draw_face_landmarks(self, landmarks, arena):
         """
@@ -119,54 +144,37 @@ class Animation:
         The face landmarks are scaled to fit nicely on the screen with respect to the arena.
 
         Parameters:
-        - landmarks (list): A list of face landmarks.
+        - landmarks (numpy.ndarray): Face keypoints of shape (n_faces, 6, 2), as stored in TrackerResult.faces.
         - arena (object): The arena component.
         """
         scale = 0.2
-        if landmarks:
-            for detection in landmarks:
-                x_0, y_0 = (
-                    detection.location_data.relative_keypoints[0].x * arena.width,
-                    detection.location_data.relative_keypoints[0].y * arena.height
-                    - arena.height // 4,
+        if len(landmarks) == 0:
+            return
+        # Only the eyes, nose and mouth are drawn.
+        keypoints = landmarks[:, :4]
+        origins = keypoints[:, 0] * (arena.width, arena.height) - (0, arena.height // 4)
+        points = (keypoints * (self.width * scale, self.height * scale)).astype(int)
+        points = points + origins[:, None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wobble = np.nan_to_num(5 * np.sin(2 * np.pi / keypoints[:, :2]))
+
+        for face, face_wobble in zip(points.tolist(), wobble.tolist()):
+            # Eyes
+            for (x, y), (wobble_x, wobble_y) in zip(face[:2], face_wobble):
+                pygame.draw.circle(self.draw_surf, (0, 100, 0), (x, y), 10, 2)
+                pygame.draw.circle(
+                    self.draw_surf, (255, 255, 255), (x + wobble_x, y + wobble_y), 3
                 )
-                for index, landmark in enumerate(
-                    detection.location_data.relative_keypoints
-                ):
-                    x, y = int(landmark.x * self.width * scale), int(
-                        landmark.y * self.height * scale
-                    )
-
-                    # Eyes
-                    if index in [0, 1]: 
-                        pygame.draw.circle(
-                            self.draw_surf, (0, 100, 0), (x + x_0, y + y_0), 10, 2
-                        )
-                        pygame.draw.circle(
-                            self.draw_surf,
-                            (255, 255, 255),
-                            (x + x_0 + 5 * math.sin(2 * math.pi / landmark.x), y + y_0 + 5 * math.sin(2* math.pi / landmark.y)),
-                            3,
-                        )
-
-                    # Nose
-                    elif index == 2:
-                        pygame.draw.ellipse(
-                            self.draw_surf,
-                            (0, 100, 0),
-                            (x + x_0 - 2.5, y + y_0 - 5, 5, 15),
-                        )
-
-                    # Mouth
-                    elif index == 3:
-                        pygame.draw.arc(
-                            self.draw_surf,
-                            (0, 100, 0),
-                            (x + x_0 - 15, y + y_0, 30, 20),
-                            -math.pi,
-                            0,
-                            2,
-                        )
+
+            # Nose
+            x, y = face[2]
+            pygame.draw.ellipse(self.draw_surf, (0, 100, 0), (x - 2.5, y - 5, 5, 15))
+
+            # Mouth
+            x, y = face[3]
+            pygame.draw.arc(
+                self.draw_surf, (0, 100, 0), (x - 15, y, 30, 20), -math.pi, 0, 2
+            )
 
     def draw_fps(self, fps):
         """
@@ -223,6 +231,10 @@ class Animation:
         for component in components:
             component.resize(width_ratio, height_ratio)
         self.arena_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # The arena grid starts over, so the cell buffers do too.
+        self.cell_surf = None
+        self.cell_pixels = None
+        self.cell_sprites = None
         self.draw_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.screen = pygame.display.set_mode(
             (self.width, self.height), pygame.RESIZABLE
@@ -240,11 +252,13 @@ class Animation:
         Parameters:
         - ball (object): The ball component.
         """
-        tail_length = len(ball.tail_positions)
+        tail_length = ball.tail_length
         tail_factor = 255 // tail_length
-        for i, (x, y) in enumerate(reversed(ball.tail_positions)):
-            if i >= tail_length:
-                break
+        # Read the ring from the oldest to the newest position.
+        tails = ball.tails
+        for i, k in enumerate(ball.tail_order()):
+            x = tails[2 * k]
+            y = tails[2 * k + 1]
             wiggle = 5
             x += math.cos(x * 0.1) * wiggle
             y += math.sin(y * 0.1) * wiggle
@@ -265,7 +279,51 @@ class Animation:
             ball_color = (255 - ball.hit_time, 10 * ball.hit_time, 0)
         else:
             ball_color = (20, 255, 90)
-        pygame.draw.circle(self.draw_surf, ball_color, (ball.x, ball.y), ball.radius)
+        x = ball.prev_x + (ball.x - ball.prev_x) * self.alpha
+        y = ball.prev_y + (ball.y - ball.prev_y) * self.alpha
+        pygame.draw.circle(self.draw_surf, ball_color, (x, y), ball.radius)
+
+    def draw_ball_system(self, balls):
+        """
+        Draws every ball in a BallSystem the same way draw_ball draws a single ball.
+
+        The tail positions, sizes and colors are computed for all balls at once.
+
+        Parameters:
+        - balls (BallSystem): The balls to draw.
+        """
+        if balls.count == 0:
+            return
+        order = balls.tail_order()
+        tail_length = len(order)
+        tail_factor = 255 // tail_length
+        steps = np.arange(tail_length)
+
+        # oldest to newest, like draw_ball
+        tails = balls.tails[:, order]
+        wiggle = 5
+        points = tails + wiggle * np.stack(
+            (np.cos(tails[..., 0] * 0.1), np.sin(tails[..., 1] * 0.1)), axis=-1
+        )
+        radii = balls.radius[:, None] * (steps + 1) / tail_length
+        tail_colors = [
+            (max(20 - tail_factor * i, 0), 255 - tail_factor * i, max(100 - tail_factor * i, 0))
+            for i in range(tail_length)
+        ]
+
+        draw_surf = self.draw_surf
+        for ball_points, ball_radii in zip(points.tolist(), radii.tolist()):
+            for point, color, radius in zip(ball_points, tail_colors, ball_radii):
+                pygame.draw.circle(draw_surf, color, point, radius, 1)
+
+        for (x, y), radius, hit, hit_time in zip(
+            balls.interpolated(self.alpha).tolist(), balls.radius.tolist(), balls.hit.tolist(), balls.hit_time.tolist()
+        ):
+            if hit:
+                ball_color = (255 - hit_time, 10 * hit_time, 0)
+            else:
+                ball_color = (20, 255, 90)
+            pygame.draw.circle(draw_surf, ball_color, (x, y), radius)
 
     def draw_paddle(self, paddle):
         """
@@ -281,44 +339,108 @@ class Animation:
         if paddle.hit:
             paddle_color = (255, 0, 0)
             offset = math.sin(paddle.hit_time / 5 * math.pi) * 10
+        y = paddle.prev_y + (paddle.y - paddle.prev_y) * self.alpha
         if paddle.left:
             pygame.draw.rect(
                 self.draw_surf,
                 paddle_color,
-                (paddle.x, paddle.y, paddle.width - offset, paddle.height),
+                (paddle.x, y, paddle.width - offset, paddle.height),
             )
         else:
             pygame.draw.rect(
                 self.draw_surf,
                 paddle_color,
-                (paddle.x + offset, paddle.y, paddle.width - offset, paddle.height),
+                (paddle.x + offset, y, paddle.width - offset, paddle.height),
             )
 
     def draw_arena(self, arena):
         """
         Draws the arena component.
 
-        It draws the current state of the Conway's Game of Life and the border of the arena.
+        It draws the cells of the Conway's Game of Life that changed since the last draw in the
+        chosen arena_style, and the border of the arena.
 
         Parameters:
         - arena (object): The arena component.
         """
-        ALIVE_C = (20, 255, 90)
-        DEAD_C = (0, 0, 0)
         draw_surf = self.arena_surf
         cell_size = arena.cell_size
 
-        for row, col in arena.dirty_cells:
-            color = ALIVE_C if arena.grid[row][col] else DEAD_C
-            x = arena.x + col * cell_size[0]
-            y = arena.y + row * cell_size[1]
-            pygame.draw.ellipse(draw_surf, color, (x, y, cell_size[0], cell_size[1]))
-
-        arena.dirty_cells.clear()
+        dirty = arena.dirty_cells
+        if len(dirty):
+            rows, cols = dirty.rows, dirty.cols
+            alive = arena.get_cells(rows, cols)
+            if self.arena_style == "square":
+                self.draw_cells_square(arena, rows, cols, alive)
+            elif self.arena_style == "sprite":
+                self.draw_cells_sprite(arena, rows, cols, alive)
+            else:
+                for row, col, is_alive in zip(rows.tolist(), cols.tolist(), alive.tolist()):
+                    color = self.ALIVE_COLOR if is_alive else self.DEAD_COLOR
+                    x = arena.x + col * cell_size[0]
+                    y = arena.y + row * cell_size[1]
+                    pygame.draw.ellipse(draw_surf, color, (x, y, cell_size[0], cell_size[1]))
+            dirty.clear()
 
         pygame.draw.rect(
-            draw_surf, ALIVE_C, (arena.x, arena.y, arena.width, arena.height), 2
+            draw_surf, self.ALIVE_COLOR, (arena.x, arena.y, arena.width, arena.height), 2
+        )
+
+    def draw_cells_square(self, arena, rows, cols, alive):
+        """
+        Draws cells as squares.
+
+        The grid is kept as a pixel buffer with one pixel per cell. The changed cells are written
+        into it with NumPy, and it is copied to a grid-sized surface, scaled up to the arena and
+        blitted in one go.
+
+        Parameters:
+        - arena (object): The arena component.
+        - rows (numpy.ndarray): The rows of the changed cells.
+        - cols (numpy.ndarray): The columns of the changed cells.
+        - alive (numpy.ndarray): Whether each changed cell is alive.
+        """
+        if self.cell_surf is None or self.cell_surf.get_size() != (arena.cols, arena.rows):
+            # Start from the whole grid, the cells that did not change have to be drawn too.
+            self.cell_surf = pygame.Surface((arena.cols, arena.rows))
+            self.cell_pixels = np.zeros((arena.cols, arena.rows, 3), dtype=np.uint8)
+            self.cell_pixels[arena.grid.T] = self.ALIVE_COLOR
+        colors = np.array((self.DEAD_COLOR, self.ALIVE_COLOR), dtype=np.uint8)
+        # Surface arrays are indexed by x first.
+        self.cell_pixels[cols, rows] = colors[alive.astype(np.intp)]
+        pygame.surfarray.blit_array(self.cell_surf, self.cell_pixels)
+
+        cell_width, cell_height = int(arena.cell_size[0]), int(arena.cell_size[1])
+        scaled = pygame.transform.scale(
+            self.cell_surf, (arena.cols * cell_width, arena.rows * cell_height)
         )
+        self.arena_surf.blit(scaled, (arena.x, arena.y))
+
+    def draw_cells_sprite(self, arena, rows, cols, alive):
+        """
+        Draws cells as circles like the "ellipse" style, by stamping a pre-drawn sprite for each
+        changed cell with a single Surface.blits call.
+
+        Parameters:
+        - arena (object): The arena component.
+        - rows (numpy.ndarray): The rows of the changed cells.
+        - cols (numpy.ndarray): The columns of the changed cells.
+        - alive (numpy.ndarray): Whether each changed cell is alive.
+        """
+        cell_width, cell_height = int(arena.cell_size[0]), int(arena.cell_size[1])
+        if self.cell_sprites is None or self.cell_sprites[0].get_size() != (cell_width, cell_height):
+            self.cell_sprites = []
+            for color in (self.DEAD_COLOR, self.ALIVE_COLOR):
+                # The corners are left out with a colour key, which blits faster than per-pixel alpha.
+                sprite = pygame.Surface((cell_width, cell_height))
+                sprite.fill(self.SPRITE_KEY)
+                sprite.set_colorkey(self.SPRITE_KEY, pygame.RLEACCEL)
+                pygame.draw.ellipse(sprite, color, (0, 0, cell_width, cell_height))
+                self.cell_sprites.append(sprite)
+        x = (arena.x + cols * arena.cell_size[0]).tolist()
+        y = (arena.y + rows * arena.cell_size[1]).tolist()
+        sprites = map(self.cell_sprites.__getitem__, alive.tolist())
+        self.arena_surf.blits(list(zip(sprites, zip(x, y))), doreturn=False)
 
     def draw_scorer(self, scorer):
         """
@@ -0,0 +1,319 @@
+import argparse
+import time
+import numpy as np
+import pygame
+from Pong.components import Ball, Arena, Paddle, Scorer
+from Pong.gamelogic import Game, StateManager
+from Tracker.results import HAND_LANDMARK_COUNT, TrackerResult
+
+WIDTH = 1024
+HEIGHT = 768
+
+# Seconds per game time unit, StateManager passes dt in units of 30 ms.
+SECONDS_PER_UNIT = 0.03
+
+
+class NullAnimation:
+    """
+    Stands in for Animation without opening a window. Drawing does nothing.
+
+    Attributes:
+    - height (int): The height of the virtual screen.
+    - width (int): The width of the virtual screen.
+    - alpha (float): The interpolation fraction of the last draw call.
+
+    Methods:
+    - resize(self, w, h, components): Resizes the game components like Animation does.
+    """
+
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.alpha = 1.0
+
+    def draw(self, components, alpha=1.0):
+        self.alpha = alpha
+
+    def render(self):
+        pass
+
+    def draw_component(self, component):
+        pass
+
+    def draw_hand_landmarks(self, landmarks, arena):
+        pass
+
+    def draw_face_landmarks(self, landmarks, arena):
+        pass
+
+    def draw_fps(self, fps):
+        pass
+
+    def draw_menu(self, menu_items, selected_item):
+        pass
+
+    def resize(self, w, h, components):
+        """
+        Resizes the game components.
+
+        Parameters:
+        - w (int): The new width of the virtual screen.
+        - h (int): The new height of the virtual screen.
+        - components (list): A list of game components to be resized.
+        """
+        width_ratio = w / self.width
+        height_ratio = h / self.height
+        self.width = w
+        self.height = h
+        for component in components:
+            component.resize(width_ratio, height_ratio)
+
+
+class NullSoundManager:
+    """
+    Stands in for SoundManager without opening an audio device. It counts the sounds instead of playing them.
+
+    Attributes:
+    - played (dict): How many times each sound was played.
+    """
+
+    def __init__(self):
+        self.played = {}
+
+    def play_sound(self, sound):
+        self.played[sound] = self.played.get(sound, 0) + 1
+
+    def play_background(self):
+        pass
+
+
+class SimulatedClock:
+    """
+    A clock that only moves when it is advanced, used as the timebase of a headless game.
+
+    Attributes:
+    - now (float): The current time in seconds.
+    """
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class ScriptedTracker:
+    """
+    Stands in for TrackerWorker and publishes hands from a script instead of a camera.
+
+    The script is called once per game update with the tick number and returns the target top
+    position of the left and right paddle, as a fraction of the arena height, or None for no hand.
+
+    Attributes:
+    - script (callable): Returns (left_y, right_y) for a tick.
+    - clock (callable): Gives the timestamps of the published results.
+    - ticks (int): The number of results published so far.
+
+    Methods:
+    - latest(self): Returns a TrackerResult with the scripted hands.
+    """
+
+    # Where the hands are placed across the arena, as a fraction of its width.
+    LEFT_X = 0.25
+    RIGHT_X = 0.75
+
+    def __init__(self, script, clock=time.perf_counter):
+        self.script = script
+        self.clock = clock
+        self.ticks = 0
+
+    def latest(self):
+        """
+        Runs the script for the next tick and returns its hands.
+
+        Returns:
+        - A TrackerResult with one hand per scripted paddle.
+        """
+        targets = self.script(self.ticks)
+        self.ticks += 1
+        wrists = [
+            (x, y) for x, y in zip((self.LEFT_X, self.RIGHT_X), targets) if y is not None
+        ]
+        hands = np.zeros((len(wrists), HAND_LANDMARK_COUNT, 3), dtype=np.float32)
+        if wrists:
+            hands[:, :, :2] = np.array(wrists, dtype=np.float32)[:, None, :]
+        return TrackerResult(hands=hands, timestamp=self.clock(), sequence=self.ticks)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class BallFollower:
+    """
+    A paddle script that moves each paddle to the ball closest to it.
+
+    Attributes:
+    - game (Game): The game whose balls are followed.
+    """
+
+    def __init__(self, game=None):
+        self.game = game
+
+    def __call__(self, tick):
+        game = self.game
+        targets = []
+        for side in range(2):
+            paddles = [p for p in game.paddles if p.left == (side == 0)]
+            if not paddles or not game.balls:
+                targets.append(None)
+                continue
+            paddle = paddles[0]
+            ball = min(game.balls, key=lambda b: abs(b.x - paddle.x))
+            targets.append((ball.y - paddle.height / 2) / game.arena.height)
+        return tuple(targets)
+
+
+def make_components(width=WIDTH, height=HEIGHT):
+    """
+    Creates the game components laid out the same way as the App does.
+
+    Args:
+        width (int): The width of the virtual screen. Default is WIDTH.
+        height (int): The height of the virtual screen. Default is HEIGHT.
+
+    Returns:
+        list: The ball, the two paddles, the scorer and the arena.
+    """
+    # The scorer needs fonts, which work without a display.
+    pygame.font.init()
+    arena = Arena(width, height)
+    ball = Ball(width // 2, height // 2, radius=12)
+    left_paddle = Paddle(arena.x, arena.height // 2 - Paddle.DEFAULT_HEIGHT // 2, arena)
+    right_paddle = Paddle(
+        arena.width + arena.x - Paddle.DEFAULT_WIDTH,
+        arena.height // 2 - Paddle.DEFAULT_HEIGHT // 2,
+        arena,
+    )
+    return [ball, left_paddle, right_paddle, Scorer(), arena]
+
+
+class HeadlessGame:
+    """
+    Runs a Game without a window, audio or camera, as fast as the CPU allows.
+
+    The game is stepped in fixed steps of simulated time. Its tracker is a ScriptedTracker and its
+    clock only advances with the steps, so the outcome does not depend on how fast it runs. The
+    Game of Life background only matters on screen and is skipped by default.
+
+    Args:
+        script (callable): The paddle script for the ScriptedTracker. Default is None, which uses a BallFollower.
+        one_player (bool): Whether to play with one paddle. Default is False.
+        width (int): The width of the virtual screen. Default is WIDTH.
+        height (int): The height of the virtual screen. Default is HEIGHT.
+        step (float): The physics step in game time units. Default is StateManager.STEP.
+        filter_options (dict): Keyword arguments for the paddles' AlphaBetaFilter. Default is None.
+        background (bool): Whether to run the Game of Life background. Default is False.
+        seed (int): The seed for the random new balls. Default is None.
+        input_log (InputLog): Records the inputs of every step. Default is None.
+
+    Attributes:
+    - clock (SimulatedClock): The simulated time.
+    - tracker (ScriptedTracker): The scripted hand input.
+    - graphic (NullAnimation): The null graphics.
+    - mixer (NullSoundManager): The null audio.
+    - game (Game): The game being simulated.
+    - ticks (int): The number of steps run.
+    """
+
+    def __init__(
+        self,
+        script=None,
+        one_player=False,
+        width=WIDTH,
+        height=HEIGHT,
+        step=StateManager.STEP,
+        filter_options=None,
+        background=False,
+        seed=None,
+        input_log=None,
+    ):
+        self.step = step
+        self.clock = SimulatedClock()
+        follower = BallFollower() if script is None else None
+        self.tracker = ScriptedTracker(follower or script, clock=self.clock)
+        self.graphic = NullAnimation(height, width)
+        self.mixer = NullSoundManager()
+        self.game = Game(
+            self.graphic,
+            make_components(width, height),
+            self.mixer,
+            self.tracker,
+            one_player=one_player,
+            filter_options=filter_options,
+            clock=self.clock,
+            background=background,
+            seed=seed,
+            input_log=input_log,
+        )
+        if follower is not None:
+            follower.game = self.game
+        self.ticks = 0
+
+    @property
+    def scores(self):
+        """
+        The (left, right) score.
+        """
+        return self.game.scorer.score_left, self.game.scorer.score_right
+
+    def run(self, ticks):
+        """
+        Runs the game for a number of steps.
+
+        Args:
+            ticks (int): The number of steps to run.
+
+        Returns:
+            tuple: The (left, right) score afterwards.
+        """
+        seconds = self.step * SECONDS_PER_UNIT
+        for _ in range(ticks):
+            self.clock.advance(seconds)
+            self.game.update(self.step)
+            # Every step is a frame here.
+            self.game.play_sounds()
+        self.ticks += ticks
+        return self.scores
+
+    def simulated_time(self):
+        """
+        Returns the simulated seconds so far.
+        """
+        return self.ticks * self.step * SECONDS_PER_UNIT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Hand Pong matches without a window")
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--one-player", action="store_true")
+    args = parser.parse_args()
+
+    headless = HeadlessGame(one_player=args.one_player)
+    start = time.perf_counter()
+    left, right = headless.run(args.ticks)
+    elapsed = time.perf_counter() - start
+
+    simulated = headless.simulated_time()
+    print(f"{args.ticks} steps in {elapsed:.2f} s ({args.ticks / elapsed:.0f} steps/s)")
+    print(f"Simulated {simulated:.0f} s, {simulated / elapsed:.0f}x faster than real time")
+    print(f"Score {left} - {right}")
+
+
+if __name__ == "__main__":
+    main()
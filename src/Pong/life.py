@@ -0,0 +1,660 @@
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+from scipy.signal import convolve2d
+
+# Shifts as numpy integers so uint64 words are never promoted to float.
+ONE = np.uint64(1)
+TOP_BIT = np.uint64(63)
+
+
+class ConvolveLife:
+    """
+    Conway's Game of Life on a dense grid, stepped by convolving it with a neighbour kernel.
+
+    Cells outside the grid are always dead. Every backend in LIFE_BACKENDS has the same methods,
+    so Arena can use any of them.
+
+    Args:
+        rows (int): The number of rows.
+        cols (int): The number of columns.
+
+    Attributes:
+        grid (numpy.ndarray): The cells, 1 for alive, shape (rows, cols).
+
+    Methods:
+        step(): Advances one generation and returns the cells that changed.
+        get(row, col): Returns whether a cell is alive.
+        get_many(rows, cols): Returns whether each of many cells is alive.
+        set(row, col, alive=True): Sets a cell and returns whether it changed.
+        cells(): Returns all cells as a boolean array.
+    """
+
+    # Convolving with this kernel gives the count of cells around the center.
+    KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.grid = np.zeros((rows, cols), dtype=np.uint8)
+
+    def step(self):
+        """
+        Advances one generation.
+
+        Returns:
+            tuple: The (rows, cols) index arrays of the cells that changed state.
+        """
+        neighbors = convolve2d(self.grid, self.KERNEL, mode="same", boundary="fill", fillvalue=0)
+
+        # Apply the rules of Conway's Game of Life
+        birth = (neighbors == 3) & (self.grid == 0)
+        survive = ((neighbors == 2) | (neighbors == 3)) & (self.grid == 1)
+        new_grid = (birth | survive).view(np.uint8)
+
+        changed = np.nonzero(new_grid != self.grid)
+        self.grid = new_grid
+        return changed
+
+    def get(self, row, col):
+        return bool(self.grid[row, col])
+
+    def get_many(self, rows, cols):
+        return self.grid[rows, cols].astype(bool)
+
+    def set(self, row, col, alive=True):
+        """
+        Sets a cell.
+
+        Returns:
+            bool: Whether the cell changed state.
+        """
+        if bool(self.grid[row, col]) == alive:
+            return False
+        self.grid[row, col] = alive
+        return True
+
+    def cells(self):
+        return self.grid.astype(bool)
+
+
+class BitLife:
+    """
+    Conway's Game of Life on a bit-packed grid, stepped with bitwise neighbour counting.
+
+    Each row is stored as uint64 words holding 64 cells each, column c in bit c % 64 of word
+    c // 64. A generation shifts the words to line up the eight neighbours of every cell and adds
+    them with bit-sliced adders, so 64 cells are updated per word operation. The grid takes one
+    bit per cell, 64 times less than a float64 grid.
+
+    Args:
+        rows (int): The number of rows.
+        cols (int): The number of columns.
+
+    Attributes:
+        bits (numpy.ndarray): The packed cells, shape (rows, words).
+        mask (numpy.ndarray): The bits of each word that hold real cells, shape (words,).
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        words = (cols + 63) // 64
+        self.bits = np.zeros((rows, words), dtype="<u8")
+        self.mask = np.full(words, np.iinfo(np.uint64).max, dtype="<u8")
+        if cols % 64:
+            self.mask[-1] = (1 << (cols % 64)) - 1
+
+    @staticmethod
+    def _west(words):
+        # Every cell gets the value of the cell to its left.
+        shifted = words << ONE
+        shifted[:, 1:] |= words[:, :-1] >> TOP_BIT
+        return shifted
+
+    @staticmethod
+    def _east(words):
+        # Every cell gets the value of the cell to its right.
+        shifted = words >> ONE
+        shifted[:, :-1] |= words[:, 1:] << TOP_BIT
+        return shifted
+
+    def step(self):
+        """
+        Advances one generation.
+
+        Returns:
+            tuple: The (rows, cols) index arrays of the cells that changed state.
+        """
+        bits = self.bits
+        above = np.zeros_like(bits)
+        above[1:] = bits[:-1]
+        below = np.zeros_like(bits)
+        below[:-1] = bits[1:]
+
+        # Count the neighbours in three bit planes. Counts of four or more only set the top one.
+        ones = np.zeros_like(bits)
+        twos = np.zeros_like(bits)
+        fours = np.zeros_like(bits)
+        for neighbour in (
+            above,
+            below,
+            self._west(bits),
+            self._east(bits),
+            self._west(above),
+            self._east(above),
+            self._west(below),
+            self._east(below),
+        ):
+            carry = ones & neighbour
+            ones ^= neighbour
+            fours |= twos & carry
+            twos ^= carry
+
+        # Alive with two or three neighbours, or dead with three.
+        new_bits = twos & ~fours & (ones | bits) & self.mask
+        changed = self._unpack(new_bits ^ bits)
+        self.bits = new_bits
+        return np.nonzero(changed)
+
+    def _unpack(self, words):
+        return np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")[:, : self.cols]
+
+    def get(self, row, col):
+        return bool((int(self.bits[row, col >> 6]) >> (col & 63)) & 1)
+
+    def get_many(self, rows, cols):
+        words = self.bits[rows, cols >> 6]
+        return ((words >> (cols & 63).astype(np.uint64)) & ONE).astype(bool)
+
+    def set(self, row, col, alive=True):
+        """
+        Sets a cell.
+
+        Returns:
+            bool: Whether the cell changed state.
+        """
+        if self.get(row, col) == alive:
+            return False
+        self.bits[row, col >> 6] ^= np.uint64(1 << (col & 63))
+        return True
+
+    def cells(self):
+        return self._unpack(self.bits).astype(bool)
+
+
+class SparseLife:
+    """
+    Conway's Game of Life that only steps the tiles of the grid where something can change.
+
+    The grid is split into TILE x TILE tiles. A cell can only change if a cell next to it changed
+    in the previous generation, so only the tiles that changed and their neighbours are active.
+    They are gathered with a one cell border into a batch, stepped together and written back.
+    The cost follows the number of active tiles, and a dead arena costs almost nothing.
+
+    Args:
+        rows (int): The number of rows.
+        cols (int): The number of columns.
+
+    Attributes:
+        padded (numpy.ndarray): The cells, 1 for alive, with a dead border and padding up to whole tiles.
+        changed (numpy.ndarray): The tiles that changed in the last generation or since, shape (tile rows, tile cols).
+    """
+
+    TILE = 16
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        tile = self.TILE
+        tile_rows = -(-rows // tile)
+        tile_cols = -(-cols // tile)
+        self.padded = np.zeros((tile_rows * tile + 2, tile_cols * tile + 2), dtype=np.uint8)
+        self.changed = np.zeros((tile_rows, tile_cols), dtype=bool)
+
+        # Views of the grid by tile: with their border for reading, without it for writing.
+        self.windows = np.lib.stride_tricks.sliding_window_view(
+            self.padded, (tile + 2, tile + 2)
+        )[::tile, ::tile]
+        self.tiles = self.padded[1:-1, 1:-1].reshape(tile_rows, tile, tile_cols, tile).swapaxes(1, 2)
+        inside = np.zeros((tile_rows * tile, tile_cols * tile), dtype=bool)
+        inside[:rows, :cols] = True
+        self.inside = inside.reshape(tile_rows, tile, tile_cols, tile).swapaxes(1, 2).copy()
+
+    def active_tiles(self):
+        """
+        Returns the (tile rows, tile cols) index arrays of the tiles that can change next generation.
+        """
+        changed = np.pad(self.changed, 1)
+        active = np.zeros_like(self.changed)
+        height, width = active.shape
+        for dy in range(3):
+            for dx in range(3):
+                active |= changed[dy : dy + height, dx : dx + width]
+        return np.nonzero(active)
+
+    def step(self):
+        """
+        Advances one generation.
+
+        Returns:
+            tuple: The (rows, cols) index arrays of the cells that changed state.
+        """
+        tile_rows, tile_cols = self.active_tiles()
+        self.changed[:] = False
+        if len(tile_rows) == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        # Every active tile with a one cell border, shape (n, TILE + 2, TILE + 2).
+        block = self.windows[tile_rows, tile_cols]
+        neighbors = (
+            block[:, :-2, :-2]
+            + block[:, :-2, 1:-1]
+            + block[:, :-2, 2:]
+            + block[:, 1:-1, :-2]
+            + block[:, 1:-1, 2:]
+            + block[:, 2:, :-2]
+            + block[:, 2:, 1:-1]
+            + block[:, 2:, 2:]
+        )
+        center = block[:, 1:-1, 1:-1]
+        alive = (neighbors == 3) | ((neighbors == 2) & (center == 1))
+        # Cells in the padding past the last row or column stay dead.
+        alive &= self.inside[tile_rows, tile_cols]
+        new = alive.view(np.uint8)
+        self.tiles[tile_rows, tile_cols] = new
+
+        tiles, row, col = np.nonzero(new != center)
+        self.changed[tile_rows[tiles], tile_cols[tiles]] = True
+        return tile_rows[tiles] * self.TILE + row, tile_cols[tiles] * self.TILE + col
+
+    def get(self, row, col):
+        return bool(self.padded[row + 1, col + 1])
+
+    def get_many(self, rows, cols):
+        return self.padded[rows + 1, cols + 1].astype(bool)
+
+    def set(self, row, col, alive=True):
+        """
+        Sets a cell.
+
+        Returns:
+            bool: Whether the cell changed state.
+        """
+        if bool(self.padded[row + 1, col + 1]) == alive:
+            return False
+        self.padded[row + 1, col + 1] = alive
+        self.changed[row // self.TILE, col // self.TILE] = True
+        return True
+
+    def cells(self):
+        return self.padded[1 : self.rows + 1, 1 : self.cols + 1].astype(bool)
+
+
+# The most quadtree nodes and successors HashLife remembers. The least recently used are evicted first.
+NODE_CACHE_SIZE = 1 << 17
+
+
+class _Node(namedtuple("_Node", "level a b c d population hash")):
+    """
+    A square of 2 ** level cells in a HashLife quadtree, split into the quadrants a (top left),
+    b (top right), c (bottom left) and d (bottom right). Level 0 nodes are single cells.
+    """
+
+    __slots__ = ()
+
+    def __hash__(self):
+        return self.hash
+
+
+_DEAD = _Node(0, None, None, None, None, 0, 0)
+_ALIVE = _Node(0, None, None, None, None, 1, 1)
+
+
+@lru_cache(maxsize=NODE_CACHE_SIZE)
+def _join(a, b, c, d):
+    # Nodes are hash-consed, so equal squares are usually the same object.
+    population = a.population + b.population + c.population + d.population
+    node_hash = (
+        a.level + 2 + 5131830419411 * a.hash + 3758991985019 * b.hash
+        + 8973110871315 * c.hash + 4318490180473 * d.hash
+    ) & ((1 << 63) - 1)
+    return _Node(a.level + 1, a, b, c, d, population, node_hash)
+
+
+@lru_cache(maxsize=64)
+def _empty(level):
+    if level == 0:
+        return _DEAD
+    child = _empty(level - 1)
+    return _join(child, child, child, child)
+
+
+def _centre(node):
+    """
+    Returns a node one level up with the given node in its middle and dead cells around it.
+    """
+    border = _empty(node.level - 1)
+    return _join(
+        _join(border, border, border, node.a),
+        _join(border, border, node.b, border),
+        _join(border, node.c, border, border),
+        _join(node.d, border, border, border),
+    )
+
+
+def _inner(node):
+    """
+    Returns the middle half of a node, one level down.
+    """
+    return _join(node.a.d, node.b.c, node.c.b, node.d.a)
+
+
+def _rule(a, b, c, d, center, f, g, h, i):
+    neighbours = (
+        a.population + b.population + c.population + d.population
+        + f.population + g.population + h.population + i.population
+    )
+    if neighbours == 3 or (neighbours == 2 and center.population):
+        return _ALIVE
+    return _DEAD
+
+
+def _step_4x4(m):
+    # One generation of the middle 2x2 cells of a 4x4 node.
+    return _join(
+        _rule(m.a.a, m.a.b, m.b.a, m.a.c, m.a.d, m.b.c, m.c.a, m.c.b, m.d.a),
+        _rule(m.a.b, m.b.a, m.b.b, m.a.d, m.b.c, m.b.d, m.c.b, m.d.a, m.d.b),
+        _rule(m.a.c, m.a.d, m.b.c, m.c.a, m.c.b, m.d.a, m.c.c, m.c.d, m.d.c),
+        _rule(m.a.d, m.b.c, m.b.d, m.c.b, m.d.a, m.d.b, m.c.d, m.d.c, m.d.d),
+    )
+
+
+@lru_cache(maxsize=NODE_CACHE_SIZE)
+def _successor(m, j):
+    """
+    Returns the middle half of a node of level k >= 2 after 2 ** min(j, k - 2) generations.
+    """
+    if m.population == 0:
+        return m.a
+    if m.level == 2:
+        return _step_4x4(m)
+    j = min(j, m.level - 2)
+    # Nine overlapping sub-squares a quarter of the way in.
+    c1 = _successor(_join(m.a.a, m.a.b, m.a.c, m.a.d), j)
+    c2 = _successor(_join(m.a.b, m.b.a, m.a.d, m.b.c), j)
+    c3 = _successor(_join(m.b.a, m.b.b, m.b.c, m.b.d), j)
+    c4 = _successor(_join(m.a.c, m.a.d, m.c.a, m.c.b), j)
+    c5 = _successor(_join(m.a.d, m.b.c, m.c.b, m.d.a), j)
+    c6 = _successor(_join(m.b.c, m.b.d, m.d.a, m.d.b), j)
+    c7 = _successor(_join(m.c.a, m.c.b, m.c.c, m.c.d), j)
+    c8 = _successor(_join(m.c.b, m.d.a, m.c.d, m.d.c), j)
+    c9 = _successor(_join(m.d.a, m.d.b, m.d.c, m.d.d), j)
+    if j < m.level - 2:
+        # The sub-squares have already advanced far enough, only put them together.
+        return _join(
+            _join(c1.d, c2.c, c4.b, c5.a),
+            _join(c2.d, c3.c, c5.b, c6.a),
+            _join(c4.d, c5.c, c7.b, c8.a),
+            _join(c5.d, c6.c, c8.b, c9.a),
+        )
+    return _join(
+        _successor(_join(c1, c2, c4, c5), j),
+        _successor(_join(c2, c3, c5, c6), j),
+        _successor(_join(c4, c5, c7, c8), j),
+        _successor(_join(c5, c6, c8, c9), j),
+    )
+
+
+class HashLife:
+    """
+    Conway's Game of Life on a memoized quadtree (HashLife), for large arenas and fast-forwarding.
+
+    The grid is a quadtree of hash-consed nodes, so equal squares anywhere in it and at any time
+    are stored once, and the future of every square is remembered. A generation only computes the
+    squares that have not been seen before, and squares that do not change are shared between
+    generations, which also makes finding the changed cells cheap. The node and successor caches
+    hold at most NODE_CACHE_SIZE entries each and evict the least recently used ones.
+
+    After every generation the cells outside the arena are cleared, so the result matches the other
+    backends exactly. fast_forward() can also jump ahead by powers of two generations at a time,
+    in which case the arena edges are only applied at the end of every jump.
+
+    Args:
+        rows (int): The number of rows.
+        cols (int): The number of columns.
+
+    Attributes:
+        level (int): The level of the root, which covers 2 ** level rows and columns from the top left.
+        root (_Node): The quadtree of the cells.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.level = max(2, (max(rows, cols) - 1).bit_length())
+        self.root = _empty(self.level)
+
+    def step(self):
+        """
+        Advances one generation.
+
+        Returns:
+            tuple: The (rows, cols) index arrays of the cells that changed state.
+        """
+        return self.fast_forward(1)
+
+    def fast_forward(self, generations, exact=True):
+        """
+        Advances many generations in one call.
+
+        Args:
+            generations (int): The number of generations to advance.
+            exact (bool): Whether to clear the cells outside the arena after every generation like
+                the other backends. Otherwise the grid jumps ahead by powers of two up to
+                2 ** level generations at a time, as if the arena had no edges during a jump,
+                and the cells outside it are cleared after each jump. Default is True.
+
+        Returns:
+            tuple: The (rows, cols) index arrays of the cells that changed state.
+        """
+        start = self.root
+        if exact:
+            for _ in range(generations):
+                self.root = self._clip(_successor(_centre(self.root), 0), 0, 0)
+        else:
+            while generations:
+                j = min(generations.bit_length() - 1, self.level)
+                # Two rings of dead cells leave room for 2 ** level generations of growth.
+                ahead = _successor(_centre(_centre(self.root)), j)
+                half = 1 << (self.level - 1)
+                self.root = _inner(self._clip(ahead, -half, -half))
+                generations -= 1 << j
+        changed = []
+        self._diff(start, self.root, 0, 0, changed)
+        if not changed:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        rows, cols = np.array(changed, dtype=np.intp).T
+        return rows, cols
+
+    def _clip(self, node, row, col):
+        """
+        Returns the node with top left cell at (row, col) without the cells outside the arena.
+        """
+        size = 1 << node.level
+        if node.population == 0:
+            return node
+        if row >= 0 and col >= 0 and row + size <= self.rows and col + size <= self.cols:
+            return node
+        if row >= self.rows or col >= self.cols or row + size <= 0 or col + size <= 0:
+            return _empty(node.level)
+        half = size >> 1
+        return _join(
+            self._clip(node.a, row, col),
+            self._clip(node.b, row, col + half),
+            self._clip(node.c, row + half, col),
+            self._clip(node.d, row + half, col + half),
+        )
+
+    def _diff(self, old, new, row, col, changed):
+        # Subtrees shared between the generations did not change.
+        if old is new or (old.population == 0 and new.population == 0):
+            return
+        if new.level == 0:
+            changed.append((row, col))
+            return
+        half = 1 << (new.level - 1)
+        self._diff(old.a, new.a, row, col, changed)
+        self._diff(old.b, new.b, row, col + half, changed)
+        self._diff(old.c, new.c, row + half, col, changed)
+        self._diff(old.d, new.d, row + half, col + half, changed)
+
+    def get(self, row, col):
+        node = self.root
+        while node.level:
+            half = 1 << (node.level - 1)
+            if row < half:
+                node = node.a if col < half else node.b
+            else:
+                node = node.c if col < half else node.d
+            row %= half
+            col %= half
+        return node is _ALIVE
+
+    def get_many(self, rows, cols):
+        # Every lookup walks down from the root, so the cost follows the number of cells asked for.
+        get = self.get
+        return np.fromiter(
+            (get(row, col) for row, col in zip(rows.tolist(), cols.tolist())),
+            dtype=bool,
+            count=len(rows),
+        )
+
+    def set(self, row, col, alive=True):
+        """
+        Sets a cell.
+
+        Returns:
+            bool: Whether the cell changed state.
+        """
+        if self.get(row, col) == alive:
+            return False
+        self.root = self._set(self.root, row, col, _ALIVE if alive else _DEAD)
+        return True
+
+    def _set(self, node, row, col, cell):
+        if node.level == 0:
+            return cell
+        half = 1 << (node.level - 1)
+        a, b, c, d = node.a, node.b, node.c, node.d
+        if row < half:
+            if col < half:
+                a = self._set(a, row, col, cell)
+            else:
+                b = self._set(b, row, col - half, cell)
+        elif col < half:
+            c = self._set(c, row - half, col, cell)
+        else:
+            d = self._set(d, row - half, col - half, cell)
+        return _join(a, b, c, d)
+
+    def cells(self):
+        size = 1 << self.level
+        cells = np.zeros((size, size), dtype=bool)
+        self._fill(self.root, 0, 0, cells)
+        return cells[: self.rows, : self.cols]
+
+    def _fill(self, node, row, col, cells):
+        if node.population == 0:
+            return
+        if node.level == 0:
+            cells[row, col] = True
+            return
+        half = 1 << (node.level - 1)
+        self._fill(node.a, row, col, cells)
+        self._fill(node.b, row, col + half, cells)
+        self._fill(node.c, row + half, col, cells)
+        self._fill(node.d, row + half, col + half, cells)
+
+
+class DirtyCells:
+    """
+    The cells that changed state since the arena was last drawn, kept in a preallocated index buffer.
+
+    Producers write whole index arrays with extend() or single cells with add(), and the renderer
+    reads the rows and cols arrays in bulk, so no Python object is created per cell. The buffer
+    doubles when it fills up. A cell may be listed more than once.
+
+    Args:
+        capacity (int): The number of cells to allocate room for. Default is 1024.
+
+    Attributes:
+        buffer (numpy.ndarray): The row and column of every cell, shape (2, capacity).
+        count (int): The number of cells in the buffer.
+    """
+
+    def __init__(self, capacity=1024):
+        self.buffer = np.zeros((2, max(capacity, 1)), dtype=np.intp)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, n):
+        if self.count + n > self.buffer.shape[1]:
+            buffer = np.zeros((2, max(2 * self.buffer.shape[1], self.count + n)), dtype=np.intp)
+            buffer[:, : self.count] = self.buffer[:, : self.count]
+            self.buffer = buffer
+
+    def add(self, row, col):
+        self._reserve(1)
+        self.buffer[0, self.count] = row
+        self.buffer[1, self.count] = col
+        self.count += 1
+
+    def extend(self, rows, cols):
+        n = len(rows)
+        self._reserve(n)
+        self.buffer[0, self.count : self.count + n] = rows
+        self.buffer[1, self.count : self.count + n] = cols
+        self.count += n
+
+    @property
+    def rows(self):
+        return self.buffer[0, : self.count]
+
+    @property
+    def cols(self):
+        return self.buffer[1, : self.count]
+
+    def clear(self):
+        self.count = 0
+
+
+def fast_forward(life, generations, exact=True):
+    """
+    Advances any backend many generations, with its own fast_forward when it has one.
+
+    Args:
+        life (object): A backend from LIFE_BACKENDS.
+        generations (int): The number of generations to advance.
+        exact (bool): Passed on to a backend's own fast_forward. Backends without one always step
+            every generation. Default is True.
+
+    Returns:
+        tuple: The (rows, cols) index arrays of the cells that differ from before.
+    """
+    if hasattr(life, "fast_forward"):
+        return life.fast_forward(generations, exact)
+    before = life.cells()
+    for _ in range(generations):
+        life.step()
+    return np.nonzero(life.cells() != before)
+
+
+LIFE_BACKENDS = {
+    "convolve": ConvolveLife,
+    "bitpacked": BitLife,
+    "sparse": SparseLife,
+    "hashlife": HashLife,
+}
@@ -0,0 +1,750 @@
+import math
+import numpy as np
+from Pong.balls import BallSystem, elastic_collisions
+from Pong.broadphase import AllPairs, SpatialHash
+
+
+def sweep_circle_wall(start, end, radius, wall, direction):
+    """
+    Finds when a moving circle first touches an axis aligned wall during a step.
+
+    Only the coordinate across the wall matters, so the circle is given by its x or y coordinate at
+    the start and end of the step.
+
+    Args:
+        start (float): The circle's coordinate at the start of the step.
+        end (float): The circle's coordinate at the end of the step.
+        radius (float): The radius of the circle.
+        wall (float): The coordinate of the wall.
+        direction (int): -1 if the wall is at a smaller coordinate than the circle (top or left), 1 if it is larger (bottom or right).
+
+    Returns:
+        float: The time of impact as a fraction of the step from 0 to 1, or None if the circle does not hit the wall.
+    """
+    gap_start = direction * (wall - start) - radius
+    gap_end = direction * (wall - end) - radius
+    if gap_end > 0 or gap_end >= gap_start:
+        # Never reaches the wall, or is moving away from it.
+        return None
+    if gap_start <= 0:
+        return 0.0
+    return gap_start / (gap_start - gap_end)
+
+
+def reflect_off_wall(end, radius, wall, direction, offset=1):
+    """
+    Returns where a circle ends the step after bouncing off a wall.
+
+    The part of the motion past the point of impact is mirrored back from the wall.
+
+    Args:
+        end (float): The circle's coordinate at the end of the step, past the wall.
+        radius (float): The radius of the circle.
+        wall (float): The coordinate of the wall.
+        direction (int): The side of the wall, as in sweep_circle_wall.
+        offset (float): The minimum distance to keep from the wall so the circle does not stick to it. Default is 1.
+
+    Returns:
+        float: The corrected coordinate.
+    """
+    contact = wall - direction * radius
+    mirrored = 2 * contact - end
+    if direction < 0:
+        return max(mirrored, contact + offset)
+    return min(mirrored, contact - offset)
+
+
+def sweep_circle_aabb(start, end, radius, rect):
+    """
+    Finds when a moving circle first touches an axis aligned rectangle during a step.
+
+    The circle's center is swept as a ray against the rectangle grown by the radius. Hits on the
+    rounded corners of the grown rectangle are tested against a circle at the corner.
+
+    Args:
+        start (tuple): The (x, y) center of the circle at the start of the step.
+        end (tuple): The (x, y) center of the circle at the end of the step.
+        radius (float): The radius of the circle.
+        rect (tuple): The rectangle as (left, top, right, bottom).
+
+    Returns:
+        tuple: (t, normal) with the time of impact as a fraction of the step and the unit surface normal at the contact, or None if the circle does not hit the rectangle while moving towards it.
+    """
+    left, top, right, bottom = rect
+    delta = (end[0] - start[0], end[1] - start[1])
+    grown = ((left - radius, right + radius), (top - radius, bottom + radius))
+
+    # Slab test against the grown rectangle.
+    t_enter = -math.inf
+    t_exit = math.inf
+    normal = (0.0, 0.0)
+    for axis in (0, 1):
+        low, high = grown[axis]
+        if delta[axis] == 0:
+            if not low <= start[axis] <= high:
+                return None
+            continue
+        t_low = (low - start[axis]) / delta[axis]
+        t_high = (high - start[axis]) / delta[axis]
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        if t_low > t_enter:
+            t_enter = t_low
+            normal = (-math.copysign(1.0, delta[0]), 0.0) if axis == 0 else (0.0, -math.copysign(1.0, delta[1]))
+        t_exit = min(t_exit, t_high)
+    if t_enter > t_exit or t_enter > 1 or t_exit < 0:
+        return None
+
+    t = max(t_enter, 0.0)
+    x = start[0] + t * delta[0]
+    y = start[1] + t * delta[1]
+
+    corner_x = left if x < left else right if x > right else None
+    corner_y = top if y < top else bottom if y > bottom else None
+    if corner_x is not None and corner_y is not None:
+        # In a corner region, the grown rectangle is rounded there.
+        rel_x = start[0] - corner_x
+        rel_y = start[1] - corner_y
+        a = delta[0] ** 2 + delta[1] ** 2
+        b = rel_x * delta[0] + rel_y * delta[1]
+        c = rel_x**2 + rel_y**2 - radius**2
+        if c <= 0:
+            t = 0.0
+        else:
+            discriminant = b * b - a * c
+            if a == 0 or discriminant < 0:
+                return None
+            t = (-b - math.sqrt(discriminant)) / a
+            if not 0 <= t <= 1:
+                return None
+        nx = rel_x + t * delta[0]
+        ny = rel_y + t * delta[1]
+        length = math.hypot(nx, ny) or 1.0
+        normal = (nx / length, ny / length)
+    elif t_enter < 0:
+        # Already overlapping, push out through the nearest face.
+        faces = (
+            (x - grown[0][0], (-1.0, 0.0)),
+            (grown[0][1] - x, (1.0, 0.0)),
+            (y - grown[1][0], (0.0, -1.0)),
+            (grown[1][1] - y, (0.0, 1.0)),
+        )
+        normal = min(faces)[1]
+
+    if delta[0] * normal[0] + delta[1] * normal[1] >= 0:
+        return None
+    return t, normal
+
+
+def separate_circle_aabb(x, y, radius, rect, offset=1):
+    """
+    Moves a circle out of a rectangle it overlaps.
+
+    Args:
+        x (float): The x-coordinate of the circle's center.
+        y (float): The y-coordinate of the circle's center.
+        radius (float): The radius of the circle.
+        rect (tuple): The rectangle as (left, top, right, bottom).
+        offset (float): The extra distance to leave between them. Default is 1.
+
+    Returns:
+        tuple: The new (x, y) center, unchanged if they do not overlap.
+    """
+    left, top, right, bottom = rect
+    closest_x = min(max(x, left), right)
+    closest_y = min(max(y, top), bottom)
+    dx = x - closest_x
+    dy = y - closest_y
+    distance = math.hypot(dx, dy)
+    if distance >= radius:
+        return x, y
+    if distance > 0:
+        scale = (radius + offset) / distance
+        return closest_x + dx * scale, closest_y + dy * scale
+
+    # The center is inside the rectangle, leave through the nearest face.
+    return min(
+        (x - left, left - radius - offset, y),
+        (right - x, right + radius + offset, y),
+        (y - top, x, top - radius - offset),
+        (bottom - y, x, bottom + radius + offset),
+    )[1:]
+
+
+def sweep_circles_wall(start, end, radius, wall, direction):
+    """
+    Array version of sweep_circle_wall for many circles at once.
+
+    Args:
+        start (numpy.ndarray): The circles' coordinates at the start of the step.
+        end (numpy.ndarray): The circles' coordinates at the end of the step.
+        radius (numpy.ndarray): The radii of the circles.
+        wall (float): The coordinate of the wall.
+        direction (int): -1 if the wall is at a smaller coordinate than the circles, 1 if it is larger.
+
+    Returns:
+        numpy.ndarray: The times of impact, NaN where a circle does not hit the wall.
+    """
+    gap_start = direction * (wall - start) - radius
+    gap_end = direction * (wall - end) - radius
+    hit = (gap_end <= 0) & (gap_end < gap_start)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(gap_start <= 0, 0.0, gap_start / (gap_start - gap_end))
+    return np.where(hit, t, np.nan)
+
+
+def reflect_circles_off_wall(end, radius, wall, direction, offset=1):
+    """
+    Array version of reflect_off_wall for many circles at once.
+
+    Returns:
+        numpy.ndarray: The corrected coordinates.
+    """
+    contact = wall - direction * radius
+    mirrored = 2 * contact - end
+    if direction < 0:
+        return np.maximum(mirrored, contact + offset)
+    return np.minimum(mirrored, contact - offset)
+
+
+def sweep_circles_aabbs(start, end, radius, rect):
+    """
+    Array version of sweep_circle_aabb, sweeping each circle against its own rectangle.
+
+    Args:
+        start (numpy.ndarray): The circle centers at the start of the step, shape (n, 2).
+        end (numpy.ndarray): The circle centers at the end of the step, shape (n, 2).
+        radius (numpy.ndarray): The radii of the circles, shape (n,).
+        rect (numpy.ndarray): The rectangles as (left, top, right, bottom), shape (n, 4).
+
+    Returns:
+        tuple: (t, normal) with the times of impact of shape (n,), NaN where there is no hit, and the unit normals of shape (n, 2).
+    """
+    start = np.asarray(start, dtype=float)
+    delta = np.asarray(end, dtype=float) - start
+    radius = np.asarray(radius, dtype=float)
+    rect = np.asarray(rect, dtype=float)
+    n = len(start)
+    low = rect[:, :2] - radius[:, None]
+    high = rect[:, 2:] + radius[:, None]
+
+    # Slab test against the grown rectangles.
+    moving = delta != 0
+    inside = (low <= start) & (start <= high)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+    t_near = np.where(moving, np.minimum(t_low, t_high), np.where(inside, -np.inf, np.inf))
+    t_far = np.where(moving, np.maximum(t_low, t_high), np.where(inside, np.inf, -np.inf))
+    enter_axis = np.argmax(t_near, axis=1)
+    rows = np.arange(n)
+    t_enter = t_near[rows, enter_axis]
+    t_exit = t_far.min(axis=1)
+    hit = (t_enter <= t_exit) & (t_enter <= 1) & (t_exit >= 0)
+
+    normal = np.zeros((n, 2))
+    normal[rows, enter_axis] = -np.sign(delta[rows, enter_axis])
+    t = np.maximum(t_enter, 0.0)
+    t[~hit] = 0.0
+    point = start + t[:, None] * delta
+
+    # Rounded corners of the grown rectangles.
+    below = point < rect[:, :2]
+    above = point > rect[:, 2:]
+    corner = hit & (below | above).all(axis=1)
+    corner_point = np.where(below, rect[:, :2], rect[:, 2:])
+    rel = start - corner_point
+    a = np.einsum("ij,ij->i", delta, delta)
+    b = np.einsum("ij,ij->i", rel, delta)
+    c = np.einsum("ij,ij->i", rel, rel) - radius**2
+    discriminant = b * b - a * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_corner = np.where(c <= 0, 0.0, (-b - np.sqrt(discriminant)) / a)
+    valid = (c <= 0) | ((a > 0) & (discriminant >= 0) & (t_corner >= 0) & (t_corner <= 1))
+    hit &= ~corner | valid
+    corner &= hit
+    t = np.where(corner, t_corner, t)
+    corner_normal = rel + np.where(corner, t, 0.0)[:, None] * delta
+    length = np.hypot(corner_normal[:, 0], corner_normal[:, 1])
+    length[length == 0] = 1.0
+    normal[corner] = corner_normal[corner] / length[corner, None]
+
+    # Already overlapping a face, push out through the nearest one.
+    overlap = hit & ~corner & (t_enter < 0)
+    if overlap.any():
+        depth = np.concatenate((point - low, high - point), axis=1)[overlap]
+        faces = np.array([(-1.0, 0.0), (0.0, -1.0), (1.0, 0.0), (0.0, 1.0)])
+        normal[overlap] = faces[np.argmin(depth, axis=1)]
+
+    hit &= np.einsum("ij,ij->i", delta, normal) < 0
+    return np.where(hit, t, np.nan), normal
+
+
+def separate_circles_aabbs(pos, radius, rect, offset=1):
+    """
+    Array version of separate_circle_aabb. Moves the circles in pos out of their rectangles in place.
+
+    Args:
+        pos (numpy.ndarray): The circle centers, shape (n, 2). Updated in place.
+        radius (numpy.ndarray): The radii of the circles, shape (n,).
+        rect (numpy.ndarray): The rectangles as (left, top, right, bottom), shape (n, 4).
+        offset (float): The extra distance to leave between them. Default is 1.
+    """
+    closest = np.clip(pos, rect[:, :2], rect[:, 2:])
+    delta = pos - closest
+    distance = np.hypot(delta[:, 0], delta[:, 1])
+    outside = (distance > 0) & (distance < radius)
+    scale = (radius[outside] + offset) / distance[outside]
+    pos[outside] = closest[outside] + delta[outside] * scale[:, None]
+
+    centered = distance == 0
+    if centered.any():
+        p = pos[centered]
+        r = radius[centered] + offset
+        box = rect[centered]
+        depth = np.stack(
+            (p[:, 0] - box[:, 0], p[:, 1] - box[:, 1], box[:, 2] - p[:, 0], box[:, 3] - p[:, 1]),
+            axis=1,
+        )
+        face = np.argmin(depth, axis=1)
+        rows = np.arange(len(p))
+        axis = face % 2
+        target = np.where(face < 2, box[rows, axis] - r, box[rows, axis + 2] + r)
+        p[rows, axis] = target
+        pos[centered] = p
+
+
+def bounce_circles_off_walls(start, end, vel, radius, walls, offset=1, mask=None):
+    """
+    Bounces circles off the walls across one axis, at most one wall per circle.
+
+    This is the step PhysicsWorld and BatchSimulator share for the walls, so the arrays can have
+    any shape as long as they match.
+
+    Args:
+        start (numpy.ndarray): The circles' coordinates across the walls at the start of the step.
+        end (numpy.ndarray): The coordinates at the end of the step. Updated in place.
+        vel (numpy.ndarray): The velocities along the same axis. Updated in place.
+        radius (numpy.ndarray): The radii of the circles.
+        walls (list): The walls as (coordinate, direction) pairs, tested in this order.
+        offset (float): The extra distance to push the circles off the wall. Default is 1.
+        mask (numpy.ndarray): Which circles take part. Default is None, which is all of them.
+
+    Returns:
+        numpy.ndarray: Which circles bounced.
+    """
+    bounced = np.zeros(end.shape, dtype=bool)
+    for wall, direction in walls:
+        t = sweep_circles_wall(start, end, radius, wall, direction)
+        wall_hit = ~bounced & ~np.isnan(t)
+        if mask is not None:
+            wall_hit &= mask
+        vel[wall_hit] *= -1
+        end[wall_hit] = reflect_circles_off_wall(
+            end[wall_hit], radius[wall_hit], wall, direction, offset
+        )
+        bounced |= wall_hit
+    return bounced
+
+
+def bounce_circles_off_aabbs(start, end, vel, radius, rect, shift=0.0, offset=1):
+    """
+    Bounces circles off rectangles that moved vertically during the step, like paddles.
+
+    Each circle is swept in the frame of its rectangle, the rest of the step's motion after the
+    impact is reflected about the contact normal and the circle is pushed out of the rectangle.
+    This is the step PhysicsWorld and BatchSimulator share for the paddles.
+
+    Args:
+        start (numpy.ndarray): The circle centers at the start of the step, shape (n, 2).
+        end (numpy.ndarray): The centers at the end of the step, shape (n, 2). Updated in place.
+        vel (numpy.ndarray): The circle velocities, shape (n, 2). Updated in place.
+        radius (numpy.ndarray): The radii of the circles, shape (n,).
+        rect (numpy.ndarray): The rectangles at the end of the step as (left, top, right, bottom), shape (n, 4).
+        shift (float or numpy.ndarray): How far each rectangle moved down during the step. Default is 0.0.
+        offset (float): The extra distance to leave between them. Default is 1.
+
+    Returns:
+        numpy.ndarray: The indices of the circles that hit their rectangle.
+    """
+    swept = start.copy()
+    swept[:, 1] += shift
+    t, normal = sweep_circles_aabbs(swept, end, radius, rect)
+    hit = np.flatnonzero(~np.isnan(t))
+    if len(hit) == 0:
+        return hit
+    t, normal, rect = t[hit], normal[hit], rect[hit]
+    moved = end[hit]
+    along = np.einsum("ij,ij->i", moved - start[hit], normal)
+    moved -= (2 * (1 - t) * np.minimum(along, 0.0))[:, None] * normal
+    v = vel[hit]
+    velocity = np.minimum(np.einsum("ij,ij->i", v, normal), 0.0)
+    v -= (2 * velocity)[:, None] * normal
+    separate_circles_aabbs(moved, radius[hit], rect, offset)
+    end[hit] = moved
+    vel[hit] = v
+    return hit
+
+
+class EventQueue:
+    """
+    A preallocated queue of compact collision and goal events.
+
+    Every event is a record of three integers: its kind and two operands. Pushing an event only
+    writes into a numpy buffer, so the physics step can record what happened without playing
+    sounds or changing scores, and a consumer can handle all events of a step at once. The buffer
+    doubles when it fills up, so no event is ever lost.
+
+    Kinds and operands:
+    - WALL (ball, -1): A ball bounced off a wall.
+    - PADDLE (ball, paddle): A ball bounced off a paddle.
+    - GOAL (ball, side): A ball reached a goal, side is an index into PhysicsWorld.SIDE_NAMES.
+    - BALL (ball, other): Two balls collided.
+
+    Args:
+        capacity (int): The number of events to allocate room for. Default is 64.
+
+    Attributes:
+        buffer (numpy.ndarray): The event records, with fields kind, a and b.
+        count (int): The number of events in the queue.
+    """
+
+    WALL, PADDLE, GOAL, BALL = range(4)
+    NAMES = ("wall", "paddle", "goal", "ball")
+    DTYPE = np.dtype([("kind", np.uint8), ("a", np.int32), ("b", np.int32)])
+
+    def __init__(self, capacity=64):
+        self.buffer = np.zeros(capacity, dtype=self.DTYPE)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, n):
+        if self.count + n > len(self.buffer):
+            buffer = np.zeros(max(2 * len(self.buffer), self.count + n), dtype=self.DTYPE)
+            buffer[: self.count] = self.buffer[: self.count]
+            self.buffer = buffer
+
+    def push(self, kind, a, b=-1):
+        """
+        Adds one event.
+        """
+        self._reserve(1)
+        self.buffer[self.count] = (kind, a, b)
+        self.count += 1
+
+    def extend(self, kind, a, b=-1):
+        """
+        Adds one event of the same kind per element of a, with b broadcast against it.
+        """
+        n = len(a)
+        if n == 0:
+            return
+        self._reserve(n)
+        events = self.buffer[self.count : self.count + n]
+        events["kind"] = kind
+        events["a"] = a
+        events["b"] = b
+        self.count += n
+
+    @property
+    def events(self):
+        """
+        The queued events, a view into the buffer.
+        """
+        return self.buffer[: self.count]
+
+    def counts(self):
+        """
+        Returns the number of queued events of every kind.
+        """
+        return np.bincount(self.events["kind"], minlength=len(self.NAMES))
+
+    def clear(self):
+        self.count = 0
+
+
+class PhysicsWorld:
+    """
+    Resolves the collisions of the balls and paddles in a rectangular world after they have moved.
+
+    Balls are registered either one by one as Ball objects or all at once as a BallSystem. Ball
+    objects are tested against the walls and paddles one at a time with the swept tests above,
+    while a BallSystem is tested with their array versions. Ball to ball collisions go through a
+    pluggable broadphase, by default a SpatialHash, and are resolved with elastic_collisions.
+
+    Each side of the world is either a wall that balls bounce off or a goal. Everything that
+    happened in a step is pushed to the events queue, which is cleared at the start of the next
+    step. Consumers either read the queue directly or call dispatch(), which hands the events to
+    the listeners registered with on():
+    - "wall" (ball): A ball bounced off a wall.
+    - "paddle" (ball, paddle): A ball bounced off a paddle.
+    - "goal" (ball, side): A ball reached the goal on the given side.
+    - "ball" (ball, other): Two balls collided.
+    A ball is passed as the Ball object, or as its index for a BallSystem. A goal is not scored
+    by the step itself, so its listener is expected to move the ball away from the goal. That has
+    to happen before the balls are collided with each other, so goal listeners are called during
+    the step itself and dispatch() only calls the listeners of the other events.
+
+    Args:
+        bounds (tuple): The world rectangle as (left, top, right, bottom).
+        goals (tuple): The sides that are goals instead of walls, any of "left", "top", "right" and "bottom". Default is none.
+        pairs (str or object): The broadphase, a name in PAIR_BACKENDS or any object with pairs(pos, radius) and reset(). Default is "spatial_hash".
+        offset (float): The distance to push balls off walls and paddles so they do not stick. Default is 1.
+
+    Attributes:
+        bounds (tuple): The world rectangle.
+        goals (tuple): The sides that are goals, checked in this order.
+        broadphase (object): Finds candidate ball pairs.
+        balls (list): The registered Ball objects.
+        ball_system (BallSystem): The registered BallSystem, or None.
+        paddles (list): The registered paddles.
+        events (EventQueue): The events of the last step.
+        hooks (dict): The listeners of each event.
+
+    Methods:
+        add_ball(ball): Registers a Ball.
+        add_balls(balls): Registers a list of Ball objects or a BallSystem.
+        add_paddle(paddle): Registers a paddle.
+        on(event, callback): Registers a listener.
+        dispatch(): Calls the listeners of the events of the last step other than goals.
+        step(): Resolves the collisions of everything registered.
+    """
+
+    # Sides as (axis, direction, bounds index), goal events refer to them by bounds index.
+    SIDE_NAMES = ("left", "top", "right", "bottom")
+    SIDES = {"left": (0, -1, 0), "top": (1, -1, 1), "right": (0, 1, 2), "bottom": (1, 1, 3)}
+    PAIR_BACKENDS = {"all_pairs": AllPairs, "spatial_hash": SpatialHash}
+
+    def __init__(self, bounds, goals=(), pairs="spatial_hash", offset=1):
+        self.bounds = tuple(bounds)
+        self.goals = tuple(goals)
+        self.broadphase = self.PAIR_BACKENDS[pairs]() if isinstance(pairs, str) else pairs
+        self.offset = offset
+        self.balls = []
+        self.ball_system = None
+        self.paddles = []
+        self.events = EventQueue()
+        self.hooks = {}
+
+    def add_ball(self, ball):
+        """
+        Registers a Ball.
+        """
+        self.balls.append(ball)
+        self.broadphase.reset()
+
+    def add_balls(self, balls):
+        """
+        Registers a list of Ball objects or a BallSystem.
+        """
+        if isinstance(balls, BallSystem):
+            self.ball_system = balls
+        else:
+            self.balls.extend(balls)
+        self.broadphase.reset()
+
+    def add_paddle(self, paddle):
+        """
+        Registers a paddle.
+        """
+        self.paddles.append(paddle)
+
+    def on(self, event, callback):
+        """
+        Registers a listener for an event.
+
+        Args:
+            event (str): "wall", "paddle", "goal" or "ball".
+            callback (callable): Called with the arguments of the event.
+        """
+        self.hooks.setdefault(event, []).append(callback)
+
+    def dispatch(self):
+        """
+        Calls the listeners of the events of the last step, in the order they happened.
+
+        Goal listeners were already called during the step and are skipped.
+        """
+        self._call_listeners(0, goals=False)
+
+    def _call_listeners(self, start, goals):
+        """
+        Calls the listeners of the queued events from index start on, either only of the goal
+        events or only of the others.
+        """
+        if not self.hooks:
+            return
+        system = self.ball_system is not None
+        balls, paddles, names = self.balls, self.paddles, EventQueue.NAMES
+        for kind, a, b in self.events.events[start:].tolist():
+            if (kind == EventQueue.GOAL) != goals:
+                continue
+            callbacks = self.hooks.get(names[kind])
+            if not callbacks:
+                continue
+            ball = a if system else balls[a]
+            if kind == EventQueue.WALL:
+                args = (ball,)
+            elif kind == EventQueue.PADDLE:
+                args = (ball, paddles[b])
+            elif kind == EventQueue.GOAL:
+                args = (ball, self.SIDE_NAMES[b])
+            else:
+                args = (ball, b if system else balls[b])
+            for callback in callbacks:
+                callback(*args)
+
+    def step(self):
+        """
+        Resolves the collisions of everything registered.
+
+        Paddles are kept inside the world first. Then each ball is bounced off the walls and
+        paddles and checked for goals, the goal listeners are called, and finally the balls are
+        collided with each other.
+        """
+        self.events.clear()
+        left, top, right, bottom = self.bounds
+        for paddle in self.paddles:
+            if paddle.y < top:
+                paddle.y = top
+            elif paddle.y + paddle.height > bottom:
+                paddle.y = bottom - paddle.height
+
+        if self.balls:
+            for index, ball in enumerate(self.balls):
+                self._collide_ball(index, ball)
+            self._call_listeners(0, goals=True)
+            self._collide_ball_list()
+        if self.ball_system is not None:
+            self._collide_ball_system()
+
+    def _collide_ball(self, index, ball):
+        """
+        Bounces a Ball off the walls and paddles and checks it for goals.
+        """
+        # Only one wall per axis can be hit in a step.
+        for axis, sides in ((1, ("top", "bottom")), (0, ("left", "right"))):
+            start = ball.prev_y if axis else ball.prev_x
+            end = ball.y if axis else ball.x
+            for side in sides:
+                if side in self.goals:
+                    continue
+                _, direction, bound = self.SIDES[side]
+                wall = self.bounds[bound]
+                if sweep_circle_wall(start, end, ball.radius, wall, direction) is not None:
+                    end = reflect_off_wall(end, ball.radius, wall, direction, self.offset)
+                    if axis:
+                        ball.vel_y *= -1
+                        ball.y = end
+                    else:
+                        ball.vel_x *= -1
+                        ball.x = end
+                    self.events.push(EventQueue.WALL, index)
+                    break
+
+        for number, paddle in enumerate(self.paddles):
+            if self._bounce_off_paddle(ball, paddle):
+                self.events.push(EventQueue.PADDLE, index, number)
+
+        # Only score once the paddles had their chance to return the ball.
+        for side in self.goals:
+            axis, direction, bound = self.SIDES[side]
+            edge = ball.y if axis else ball.x
+            if direction * (edge - self.bounds[bound]) + ball.radius >= 0:
+                self.events.push(EventQueue.GOAL, index, bound)
+
+    def _bounce_off_paddle(self, ball, paddle):
+        """
+        Bounces a ball off a paddle if it hit the paddle during the last step.
+
+        The ball is swept from its previous to its current position in the paddle's frame, so the
+        motion of both is included and the time of impact is found inside the step. The rest of
+        the step's motion is reflected about the surface normal at the contact.
+
+        Returns:
+            bool: Whether the ball hit the paddle.
+        """
+        rect = (paddle.x, paddle.y, paddle.x + paddle.width, paddle.y + paddle.height)
+        shift = paddle.y - paddle.prev_y
+        hit = sweep_circle_aabb(
+            (ball.prev_x, ball.prev_y + shift), (ball.x, ball.y), ball.radius, rect
+        )
+        if hit is None:
+            return False
+
+        t, (nx, ny) = hit
+        move_x = ball.x - ball.prev_x
+        move_y = ball.y - ball.prev_y
+        along = move_x * nx + move_y * ny
+        if along < 0:
+            # Reflect the motion left after the impact.
+            ball.x -= 2 * (1 - t) * along * nx
+            ball.y -= 2 * (1 - t) * along * ny
+        velocity = ball.vel_x * nx + ball.vel_y * ny
+        if velocity < 0:
+            ball.vel_x -= 2 * velocity * nx
+            ball.vel_y -= 2 * velocity * ny
+        ball.x, ball.y = separate_circle_aabb(ball.x, ball.y, ball.radius, rect, self.offset)
+        return True
+
+    def _collide_ball_list(self):
+        """
+        Collides the registered Ball objects with each other.
+        """
+        balls = self.balls
+        if len(balls) < 2:
+            return
+        pos = np.array([(ball.x, ball.y) for ball in balls])
+        vel = np.array([(ball.vel_x, ball.vel_y) for ball in balls])
+        radius = np.array([ball.radius for ball in balls])
+        hit = np.array([ball.hit for ball in balls])
+        pairs = self.broadphase.pairs(pos, radius)
+        collided, others = elastic_collisions(pos, vel, radius, hit, pairs)
+        for ball, (vel_x, vel_y), ball_hit in zip(balls, vel.tolist(), hit.tolist()):
+            ball.vel_x = vel_x
+            ball.vel_y = vel_y
+            ball.hit = ball_hit
+        self.events.extend(EventQueue.BALL, collided, others)
+
+    def _collide_ball_system(self):
+        """
+        Does for a BallSystem what _collide_ball and _collide_ball_list do for Ball objects.
+        """
+        system = self.ball_system
+        pos, prev, vel, radius = system.pos, system.prev_pos, system.vel, system.radius
+        start = len(self.events)
+
+        for axis, sides in ((1, ("top", "bottom")), (0, ("left", "right"))):
+            walls = [
+                (self.bounds[self.SIDES[side][2]], self.SIDES[side][1])
+                for side in sides
+                if side not in self.goals
+            ]
+            bounced = bounce_circles_off_walls(
+                prev[:, axis], pos[:, axis], vel[:, axis], radius, walls, self.offset
+            )
+            self.events.extend(EventQueue.WALL, np.flatnonzero(bounced))
+
+        for number, paddle in enumerate(self.paddles):
+            rect = np.tile(
+                (paddle.x, paddle.y, paddle.x + paddle.width, paddle.y + paddle.height),
+                (len(pos), 1),
+            )
+            paddle_hit = bounce_circles_off_aabbs(
+                prev, pos, vel, radius, rect, paddle.y - paddle.prev_y, self.offset
+            )
+            if len(paddle_hit):
+                self.events.extend(EventQueue.PADDLE, paddle_hit, number)
+
+        for side in self.goals:
+            axis, direction, bound = self.SIDES[side]
+            scored = direction * (pos[:, axis] - self.bounds[bound]) + radius >= 0
+            self.events.extend(EventQueue.GOAL, np.flatnonzero(scored), bound)
+        self._call_listeners(start, goals=True)
+
+        collided, others = elastic_collisions(
+            pos, vel, radius, system.hit, self.broadphase.pairs(pos, radius)
+        )
+        self.events.extend(EventQueue.BALL, collided, others)
@@ -0,0 +1,174 @@
+import argparse
+import atexit
+import cProfile
+import struct
+import time
+import numpy as np
+from Pong.gamelogic import Game
+from Pong.headless import NullAnimation, NullSoundManager, make_components
+
+MAGIC = b"HPINPUT1"
+# magic, seed, paddles, width, height
+HEADER = struct.Struct("<8sQIII")
+# The seed is stored unsigned.
+MAX_SEED = 2**64 - 1
+
+
+class InputLog:
+    """
+    Writes the inputs of a Game to a compact binary file so the match can be replayed exactly.
+
+    The file starts with a header holding the seed and the screen size, followed by one record per
+    tick: the dt of the tick and the target top position of every paddle, all as float64. The
+    file is opened on the first write, so a log that is never used does not create a file.
+
+    Args:
+        path (str): The file to write.
+        seed (int): The seed of the game's random number generator, from 0 to MAX_SEED.
+        paddles (int): The number of paddles in the game.
+        width (int): The width of the screen the game was created for.
+        height (int): The height of the screen the game was created for.
+
+    Attributes:
+        ticks (int): The number of ticks written so far.
+    """
+
+    def __init__(self, path, seed, paddles, width, height):
+        # Checked here, the header is only written on the first tick in the middle of a match.
+        if not 0 <= seed <= MAX_SEED:
+            raise ValueError(f"The seed must be between 0 and {MAX_SEED}, got {seed}")
+        self.path = path
+        self.seed = seed
+        self.paddles = paddles
+        self.width = width
+        self.height = height
+        self.ticks = 0
+        self._file = None
+        self._record = np.zeros(1 + paddles)
+
+    def write(self, dt, targets):
+        """
+        Adds the inputs of one tick.
+
+        Args:
+            dt (float): The time step of the tick.
+            targets (list): The target top position of every paddle.
+        """
+        if self._file is None:
+            self._file = open(self.path, "wb")
+            self._file.write(
+                HEADER.pack(MAGIC, self.seed, self.paddles, int(self.width), int(self.height))
+            )
+            atexit.register(self.close)
+        self._record[0] = dt
+        self._record[1:] = targets
+        self._file.write(self._record.tobytes())
+        self.ticks += 1
+
+    def close(self):
+        """
+        Flushes and closes the file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            atexit.unregister(self.close)
+
+
+class InputReplay:
+    """
+    Reads an input log and hands its ticks back to a Game.
+
+    Args:
+        path (str): The file written by an InputLog.
+
+    Attributes:
+        seed (int): The seed of the recorded game.
+        paddles (int): The number of paddles in the recorded game.
+        width (int): The width of the screen the recorded game was created for.
+        height (int): The height of the screen the recorded game was created for.
+        dt (numpy.ndarray): The dt of every tick, shape (ticks,).
+        targets (numpy.ndarray): The paddle targets of every tick, shape (ticks, paddles).
+        tick (int): The index of the next tick to hand out.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is not an input log")
+            magic, self.seed, self.paddles, self.width, self.height = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an input log")
+            records = np.fromfile(file, dtype=np.float64)
+        records = records[: len(records) - len(records) % (1 + self.paddles)]
+        records = records.reshape(-1, 1 + self.paddles)
+        self.dt = records[:, 0]
+        self.targets = records[:, 1:]
+        self.tick = 0
+
+    def __len__(self):
+        return len(self.dt)
+
+    def next_targets(self):
+        """
+        Returns the paddle targets of the next tick and moves on.
+        """
+        targets = self.targets[self.tick]
+        self.tick += 1
+        return targets.tolist()
+
+
+def replay(path, background=False):
+    """
+    Replays a recorded match headlessly.
+
+    Args:
+        path (str): The input log to replay.
+        background (bool): Whether to run the Game of Life background. Default is False.
+
+    Returns:
+        Game: The game after the last recorded tick.
+    """
+    inputs = InputReplay(path)
+    game = Game(
+        NullAnimation(inputs.height, inputs.width),
+        make_components(inputs.width, inputs.height),
+        NullSoundManager(),
+        tracker=None,
+        one_player=inputs.paddles == 1,
+        seed=inputs.seed,
+        input_replay=inputs,
+        background=background,
+    )
+    for dt in inputs.dt.tolist():
+        game.update(dt)
+        game.play_sounds()
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Hand Pong match")
+    parser.add_argument("path")
+    parser.add_argument("--profile", action="store_true", help="print profiler stats")
+    parser.add_argument("--background", action="store_true", help="run the Game of Life background")
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    game = replay(args.path, background=args.background)
+    if profiler is not None:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    ticks = len(game.input_replay)
+    print(f"Replayed {ticks} ticks in {elapsed:.3f} s")
+    print(f"Score {game.scorer.score_left} - {game.scorer.score_right}")
+    if profiler is not None:
+        profiler.print_stats("tottime")
+
+
+if __name__ == "__main__":
+    main()
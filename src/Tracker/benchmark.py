@@ -0,0 +1,110 @@
+import argparse
+import time
+import cv2
+from Tracker.preprocess import FramePreprocessor
+from Tracker.sources import FramePlayer, FrameRecorder
+from Tracker.trackers import HandTracker, FaceTracker
+
+
+def record(path, frames, camera_index=0):
+    """
+    Records frames from a camera for later benchmarking.
+
+    Args:
+        path (str): The file to record to.
+        frames (int): The number of frames to record.
+        camera_index (int): The camera to record from. Default is 0.
+    """
+    recorder = FrameRecorder(cv2.VideoCapture(camera_index), path)
+    recorded = 0
+    while recorded < frames:
+        ret, _ = recorder.read()
+        if not ret:
+            print("Failed to grab frame")
+            break
+        recorded += 1
+    recorder.release()
+    print(f"Recorded {recorded} frames to {path}")
+
+
+def run(path, realtime=False, scale=1.0, inference_width=None, model_complexity=1):
+    """
+    Runs the hand and face trackers over a recording and prints their throughput.
+
+    Args:
+        path (str): The recording to play.
+        realtime (bool): Whether to play the frames at the recorded timing. Default is False.
+        scale (float): The preprocessing scale factor. Default is 1.0.
+        inference_width (int): The hand tracker inference width. Default is None.
+        model_complexity (int): The hand tracker model complexity. Default is 1.
+    """
+    player = FramePlayer(path, realtime=realtime)
+    preprocessor = FramePreprocessor(flip=True, scale=scale)
+    hand_tracker = HandTracker(
+        model_complexity=model_complexity, inference_width=inference_width
+    )
+    face_tracker = FaceTracker()
+
+    timings = {"preprocess": 0.0, "hands": 0.0, "faces": 0.0}
+    frames = 0
+    start = time.perf_counter()
+    while True:
+        ret, frame = player.read()
+        if not ret:
+            break
+        t0 = time.perf_counter()
+        frame_rgb = preprocessor.process(frame)
+        t1 = time.perf_counter()
+        hand_tracker.process_rgb(frame_rgb)
+        t2 = time.perf_counter()
+        face_tracker.process_rgb(frame_rgb)
+        t3 = time.perf_counter()
+        timings["preprocess"] += t1 - t0
+        timings["hands"] += t2 - t1
+        timings["faces"] += t3 - t2
+        frames += 1
+    elapsed = time.perf_counter() - start
+
+    player.release()
+    hand_tracker.close()
+    face_tracker.close()
+
+    if frames == 0:
+        print("The recording has no frames")
+        return
+    print(f"{frames} frames in {elapsed:.2f} s ({frames / elapsed:.1f} FPS)")
+    for stage, total in timings.items():
+        print(f"  {stage:<10} {1000 * total / frames:7.2f} ms/frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record frames and benchmark the trackers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="record camera frames")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--frames", type=int, default=300)
+    record_parser.add_argument("--camera", type=int, default=0)
+
+    run_parser = commands.add_parser("run", help="benchmark the trackers on a recording")
+    run_parser.add_argument("path")
+    run_parser.add_argument("--realtime", action="store_true")
+    run_parser.add_argument("--scale", type=float, default=1.0)
+    run_parser.add_argument("--inference-width", type=int, default=None)
+    run_parser.add_argument("--model-complexity", type=int, default=1, choices=[0, 1])
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.path, args.frames, args.camera)
+    else:
+        run(
+            args.path,
+            realtime=args.realtime,
+            scale=args.scale,
+            inference_width=args.inference_width,
+            model_complexity=args.model_complexity,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,91 @@
 import cv2
 import numpy as np
+import threading
 import time
 from Tracker.trackers import HandTracker, FaceTracker
 
+
+class CameraStream:
+    """
+    Reads frames from a capture device on a background thread.
+
+    Only the newest frame is kept in a single-slot buffer, so consumers never wait on the camera.
+    Frames that are overwritten before anyone reads them are counted as dropped.
+
+    Args:
+        capture (FrameSource): The source to read frames from, e.g. a cv2.VideoCapture or a FramePlayer.
+    """
+
+    def __init__(self, capture):
+        self.capture = capture
+        self.frame = None
+        self.timestamp = 0.0
+        self.sequence = 0
+        self.dropped_frames = 0
+        self.failed_reads = 0
+        self._read_sequence = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """
+        Starts the background capture thread. Does nothing if it is already running.
+        """
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+
+    def _capture_loop(self):
+        """
+        Grabs frames until the stream is stopped, replacing the buffered frame each time.
+        """
+        while self._running:
+            ret, frame = self.capture.read()
+            timestamp = time.perf_counter()
+            if not ret:
+                self.failed_reads += 1
+                time.sleep(0.01)
+                continue
+            with self._lock:
+                if self.sequence != self._read_sequence:
+                    self.dropped_frames += 1
+                self.frame = frame
+                self.timestamp = timestamp
+                self.sequence += 1
+
+    def read_latest(self):
+        """
+        Returns the newest frame without blocking.
+
+        Returns:
+            tuple: (frame, timestamp, sequence). frame is None until the first frame arrives.
+            timestamp is the time.perf_counter() value when the frame was captured and sequence
+            increases by one for every captured frame.
+        """
+        with self._lock:
+            self._read_sequence = self.sequence
+            return self.frame, self.timestamp, self.sequence
+
+    def stop(self):
+        """
+        Stops the background capture thread.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def release(self):
+        """
+        Stops the capture thread and releases the capture device.
+        """
+        self.stop()
+        self.capture.release()
+
+
 def main():
     # Initialize HandTracker
     hand_tracker = HandTracker()
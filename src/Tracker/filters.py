@@ -0,0 +1,75 @@
+class AlphaBetaFilter:
+    """
+    Estimates the position and velocity of a tracked coordinate and predicts it forward in time.
+
+    Each measurement is blended with the prediction from the previous state: alpha sets how much the
+    position trusts the measurement and beta how quickly the velocity follows it. Predicting to the
+    current time hides the capture and inference latency of the measurement.
+
+    Args:
+        alpha (float): The position gain, between 0 and 1. Higher follows the hand more closely but passes on more jitter. Default is 0.6.
+        beta (float): The velocity gain, between 0 and 1. Higher reacts to speed changes faster. Default is 0.2.
+        max_lead (float): The longest time in seconds a prediction may run ahead of the last measurement. Default is 0.1.
+        max_gap (float): A measurement more than this many seconds after the last one starts a new estimate. Default is 0.25.
+    """
+
+    def __init__(self, alpha=0.6, beta=0.2, max_lead=0.1, max_gap=0.25):
+        self.alpha = alpha
+        self.beta = beta
+        self.max_lead = max_lead
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets the current estimate. The next measurement is taken as is.
+        """
+        self.position = None
+        self.velocity = 0.0
+        self.timestamp = None
+
+    def update(self, position, timestamp):
+        """
+        Adds a measurement.
+
+        Args:
+            position (float): The measured position.
+            timestamp (float): The time the measurement was taken, e.g. the camera frame's capture time.
+
+        Returns:
+            float: The filtered position at the measurement time.
+        """
+        if self.position is not None and timestamp - self.timestamp > self.max_gap:
+            # The old velocity says nothing about where the hand went while it was gone.
+            self.reset()
+        if self.position is None:
+            self.position = position
+            self.timestamp = timestamp
+            return self.position
+
+        dt = timestamp - self.timestamp
+        if dt <= 0:
+            # The same frame again, there is nothing new to learn from it.
+            return self.position
+
+        predicted = self.position + self.velocity * dt
+        residual = position - predicted
+        self.position = predicted + self.alpha * residual
+        self.velocity += self.beta * residual / dt
+        self.timestamp = timestamp
+        return self.position
+
+    def predict(self, now):
+        """
+        Predicts the position at a later time.
+
+        Args:
+            now (float): The time to predict for, on the same clock as the measurement timestamps.
+
+        Returns:
+            float: The predicted position, or None before the first measurement.
+        """
+        if self.position is None:
+            return None
+        lead = min(max(now - self.timestamp, 0.0), self.max_lead)
+        return self.position + self.velocity * lead
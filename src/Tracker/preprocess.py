@@ -0,0 +1,81 @@
+import cv2
+import numpy as np
+
+
+class FramePreprocessor:
+    """
+    Prepares camera frames for the trackers in a single pass.
+
+    The frame is optionally downscaled, mirrored and converted from BGR to RGB once, into buffers that
+    are allocated on the first frame and reused afterwards. Every tracker can then share the result.
+
+    Args:
+        flip (bool): Whether to mirror frames horizontally. Default is True.
+        scale (float): The factor to resize frames by before tracking, e.g. 0.5. Default is 1.0.
+    """
+
+    def __init__(self, flip=True, scale=1.0):
+        self.flip = flip
+        self.scale = scale
+        self._input_shape = None
+        self._resized = None
+        self._flipped = None
+        self._rgb = None
+
+    def output_shape(self, shape):
+        """
+        Returns the shape of the prepared frame for a camera frame of the given shape.
+
+        Args:
+            shape (tuple): The shape of the camera frame.
+
+        Returns:
+            tuple: The shape of the prepared RGB frame.
+        """
+        height, width = shape[:2]
+        if self.scale != 1.0:
+            width = max(1, int(round(width * self.scale)))
+            height = max(1, int(round(height * self.scale)))
+        return (height, width, 3)
+
+    def _allocate(self, frame):
+        """
+        Allocates the intermediate buffers for frames shaped like the given frame.
+        """
+        self._input_shape = frame.shape
+        shape = self.output_shape(frame.shape)
+        self._resized = np.empty(shape, dtype=frame.dtype) if self.scale != 1.0 else None
+        self._flipped = np.empty(shape, dtype=frame.dtype) if self.flip else None
+        self._rgb = np.empty(shape, dtype=frame.dtype)
+
+    def process(self, frame, out=None):
+        """
+        Resizes, mirrors and converts a BGR frame to RGB.
+
+        Args:
+            frame (numpy.ndarray): The input frame in BGR format.
+            out (numpy.ndarray): An optional buffer of shape output_shape(frame.shape) to write into,
+                e.g. a shared memory slot. Default is None, which uses the internal buffer.
+
+        Returns:
+            numpy.ndarray: The prepared RGB frame. It is overwritten by the next call unless out is given.
+        """
+        if frame.shape != self._input_shape:
+            self._allocate(frame)
+
+        source = frame
+        if self._resized is not None:
+            cv2.resize(
+                source,
+                (self._resized.shape[1], self._resized.shape[0]),
+                dst=self._resized,
+                interpolation=cv2.INTER_AREA,
+            )
+            source = self._resized
+        if self._flipped is not None:
+            cv2.flip(source, 1, dst=self._flipped)
+            source = self._flipped
+
+        rgb = self._rgb if out is None else out
+        cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=rgb)
+        return rgb
@@ -0,0 +1,369 @@
+import logging
+import multiprocessing as mp
+import os
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from Tracker.preprocess import FramePreprocessor
+from Tracker.results import TrackerResult
+from Tracker.scheduling import FaceScheduler
+from Tracker.trackers import HandTracker, FaceTracker
+
+logger = logging.getLogger(__name__)
+
+# The tracker class each process kind runs.
+TRACKERS = {"hand": HandTracker, "face": FaceTracker}
+
+
+class SharedFrameRing:
+    """
+    A ring of frame slots in shared memory.
+
+    Prepared RGB frames are written once by the parent process and read in place by the tracker processes,
+    so only a slot index crosses the process boundary instead of a pickled frame.
+
+    Args:
+        shape (tuple): The shape of one frame, e.g. (height, width, 3).
+        slots (int): The number of frame slots. Default is 4.
+        name (str): The name of an existing ring to attach to. Default is None, which creates a new ring.
+    """
+
+    def __init__(self, shape, slots=4, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        size = slots * int(np.prod(self.shape))
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.frames = np.ndarray(
+            (slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf
+        )
+
+    @property
+    def name(self):
+        """
+        The shared memory name other processes use to attach to the ring.
+        """
+        return self.shm.name
+
+    def close(self):
+        """
+        Detaches from the shared memory and frees it if this ring created it.
+        """
+        # Drop the array view first, the buffer cannot be closed while it is exported.
+        self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _tracker_process(tracker_class, ring_name, shape, slots, conn, options, cores):
+    """
+    Entry point of a tracker process.
+
+    The tracker is created here from tracker_class and options, so only the class name is pickled.
+
+    Waits for (slot, sequence, timestamp) messages, runs the tracker on the frame in that slot and
+    sends back (sequence, timestamp, arrays, latency) where arrays is the tuple from the tracker's
+    get_arrays().
+    A ("quality", model_complexity, inference_width) message reconfigures the hand tracker and gets
+    no reply. A None message stops the process.
+    """
+    if cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+
+    tracker = tracker_class(**options)
+    ring = SharedFrameRing(shape, slots, name=ring_name)
+
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            if message[0] == "quality":
+                # Rebuilding here only pauses this process, the game keeps running.
+                _, model_complexity, inference_width = message
+                if model_complexity != tracker.model_complexity:
+                    tracker.set_hands(tracker.create_hands(model_complexity), model_complexity)
+                tracker.inference_width = inference_width
+                continue
+            slot, sequence, timestamp = message
+            start = time.perf_counter()
+            tracker.process_rgb(ring.frames[slot])
+            arrays = tracker.get_arrays()
+            conn.send((sequence, timestamp, arrays, time.perf_counter() - start))
+    finally:
+        ring.close()
+        tracker.close()
+
+
+class ProcessTrackerWorker:
+    """
+    Runs the hand and face trackers in separate processes.
+
+    Frames are passed through a SharedFrameRing and only compact landmark arrays come back, so the
+    two models run on their own cores without the GIL or frame pickling in the way. It has the same
+    interface as TrackerWorker and can be used in its place.
+
+    Args:
+        camera (CameraStream): The stream to read frames from.
+        flip (bool): Whether to mirror frames horizontally before tracking. Default is True.
+        scale (float): The factor to resize frames by before tracking. Default is 1.0.
+        hand_options (dict): Keyword arguments for HandTracker. Default is None.
+        face_options (dict): Keyword arguments for FaceTracker. Default is None.
+        affinity (dict): Optional CPU cores per tracker, e.g. {"hand": {2}, "face": {3}}. Default is None.
+        slots (int): The number of frame slots in the ring. Default is 4.
+        face_scheduler (FaceScheduler): Decides which frames face detection runs on. Default is None,
+            which runs it on every frame the face process is free for.
+        trackers (dict): The tracker class per kind. Default is None, which uses TRACKERS.
+
+    Attributes:
+        failed (str): The kind of the tracker process that died, or None. A worker with a dead
+            process shuts down and keeps its last result.
+    """
+
+    KINDS = ("hand", "face")
+
+    def __init__(
+        self,
+        camera,
+        flip=True,
+        scale=1.0,
+        hand_options=None,
+        face_options=None,
+        affinity=None,
+        slots=4,
+        face_scheduler=None,
+        trackers=None,
+    ):
+        self.camera = camera
+        self.trackers = trackers or TRACKERS
+        self.preprocessor = FramePreprocessor(flip, scale)
+        self.options = {"hand": hand_options or {}, "face": face_options or {}}
+        self.affinity = affinity or {}
+        self.face_scheduler = face_scheduler if face_scheduler is not None else FaceScheduler()
+        # Every process holds at most one slot, so one more is always free for the next frame.
+        self.slots = max(slots, len(self.KINDS) + 1)
+        self.result = TrackerResult()
+
+        self.ring = None
+        self._context = mp.get_context("spawn")
+        self._processes = {}
+        self._connections = {}
+        self._busy_slots = {}
+        self._dispatched = {"hand": 0, "face": 0}
+        self._quality_lock = threading.Lock()
+        self._pending_quality = None
+        self._ring_sequences = [0] * self.slots
+        self._latest = {"hand": (0, 0.0, None, 0.0), "face": (0, 0.0, None, 0.0)}
+        self._thread = None
+        self._running = False
+        self.failed = None
+
+    def start(self):
+        """
+        Starts the dispatcher thread. The tracker processes are started once the first frame arrives.
+        """
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._thread.start()
+
+    def _start_processes(self, shape):
+        """
+        Creates the frame ring and starts one tracker process per kind.
+
+        Args:
+            shape (tuple): The shape of the camera frames.
+        """
+        shape = self.preprocessor.output_shape(shape)
+        self.ring = SharedFrameRing(shape, self.slots)
+        for kind in self.KINDS:
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(
+                target=_tracker_process,
+                args=(
+                    self.trackers[kind],
+                    self.ring.name,
+                    shape,
+                    self.slots,
+                    child_conn,
+                    self.options[kind],
+                    self.affinity.get(kind),
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes[kind] = process
+            self._connections[kind] = parent_conn
+            self._busy_slots[kind] = None
+
+    def _dispatch_loop(self):
+        """
+        Feeds frames to idle tracker processes until the worker is stopped.
+        """
+        while self._running:
+            if not self.process_latest():
+                time.sleep(0.002)
+
+    def _slot_for(self, frame, sequence):
+        """
+        Returns the ring slot holding the given frame, preparing it straight into a free slot if needed.
+        """
+        if sequence in self._ring_sequences:
+            return self._ring_sequences.index(sequence)
+        busy = set(self._busy_slots.values())
+        slot = next(i for i in range(self.slots) if i not in busy)
+        self.preprocessor.process(frame, out=self.ring.frames[slot])
+        self._ring_sequences[slot] = sequence
+        return slot
+
+    def process_latest(self):
+        """
+        Collects finished results and hands the newest camera frame to every idle tracker process.
+
+        If a tracker process has died, the worker logs it and shuts down instead of raising.
+
+        Returns:
+            bool: True if a result was collected or a frame was dispatched, otherwise False.
+        """
+        if self.failed is not None:
+            return False
+        try:
+            return self._exchange()
+        except (EOFError, OSError):
+            self.failed = next(
+                (kind for kind, process in self._processes.items() if not process.is_alive()),
+                "unknown",
+            )
+            logger.error("The %s tracker process stopped, tracking is disabled", self.failed)
+            self._running = False
+            self._shutdown()
+            return False
+
+    def _exchange(self):
+        """
+        Does the work of process_latest, letting errors from a dead process through.
+        """
+        progressed = False
+        for kind, conn in self._connections.items():
+            if self._busy_slots[kind] is not None and conn.poll():
+                self._latest[kind] = conn.recv()
+                self._busy_slots[kind] = None
+                if kind == "face":
+                    _, face_timestamp, (faces, scores), face_latency = self._latest[kind]
+                    self.face_scheduler.add_detection(
+                        face_timestamp, faces, face_latency, scores
+                    )
+                progressed = True
+        if progressed:
+            self._publish()
+
+        frame, timestamp, sequence = self.camera.read_latest()
+        if frame is None:
+            return progressed
+        if self.ring is None:
+            self._start_processes(frame.shape)
+        self._apply_quality()
+
+        for kind, conn in self._connections.items():
+            if self._busy_slots[kind] is not None or self._dispatched[kind] == sequence:
+                continue
+            if kind == "face" and not self.face_scheduler.should_detect(timestamp):
+                # Count the frame as handled so the scheduler sees it only once.
+                self._dispatched[kind] = sequence
+                continue
+            slot = self._slot_for(frame, sequence)
+            self._busy_slots[kind] = slot
+            self._dispatched[kind] = sequence
+            conn.send((slot, sequence, timestamp))
+            progressed = True
+        return progressed
+
+    def request_quality(self, level):
+        """
+        Asks the worker to switch to a quality level. The hand process rebuilds its model in the background.
+
+        Args:
+            level (QualityLevel): The quality level to switch to.
+        """
+        with self._quality_lock:
+            self._pending_quality = level
+
+    def _apply_quality(self):
+        """
+        Sends a requested quality level to the hand process.
+        """
+        with self._quality_lock:
+            level, self._pending_quality = self._pending_quality, None
+        if level is None:
+            return
+        self.face_scheduler.interval = level.face_interval
+        self._connections["hand"].send(
+            ("quality", level.model_complexity, level.inference_width)
+        )
+
+    def _publish(self):
+        """
+        Combines the newest hand and face arrays into a TrackerResult.
+
+        The result carries the timestamp of the hand frame, since that is what the paddles use, and the
+        face keypoints are extrapolated to it.
+        """
+        hand_sequence, hand_timestamp, hand_arrays, hand_latency = self._latest["hand"]
+        hands, handedness, hand_scores = hand_arrays or (None, None, None)
+        self.result = TrackerResult(
+            hands,
+            handedness,
+            hand_scores,
+            self.face_scheduler.predict(hand_timestamp),
+            self.face_scheduler.scores,
+            hand_timestamp,
+            hand_sequence,
+            hand_latency,
+        )
+
+    def latest(self):
+        """
+        Returns the newest tracker result without blocking.
+
+        Returns:
+            TrackerResult: The newest result.
+        """
+        return self.result
+
+    def stop(self):
+        """
+        Stops the dispatcher thread and the tracker processes and frees the frame ring.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._shutdown()
+
+    def _shutdown(self):
+        """
+        Stops the tracker processes and frees the frame ring. Safe to call more than once.
+        """
+        for kind, conn in self._connections.items():
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._processes[kind].join(timeout=2.0)
+            if self._processes[kind].is_alive():
+                self._processes[kind].terminate()
+            conn.close()
+        self._processes.clear()
+        self._connections.clear()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
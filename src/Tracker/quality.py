@@ -0,0 +1,137 @@
+class QualityLevel:
+    """
+    One step on the tracker quality ladder.
+
+    Args:
+        model_complexity (int): The hand landmark model complexity, 0 or 1.
+        inference_width (int): The width frames are downscaled to before hand inference, or None for full resolution.
+        face_interval (int): Run face detection on every n-th tracked frame.
+    """
+
+    def __init__(self, model_complexity, inference_width, face_interval):
+        self.model_complexity = model_complexity
+        self.inference_width = inference_width
+        self.face_interval = face_interval
+
+    def __repr__(self):
+        return (
+            f"QualityLevel(model_complexity={self.model_complexity}, "
+            f"inference_width={self.inference_width}, face_interval={self.face_interval})"
+        )
+
+
+# Ordered from best looking to cheapest.
+DEFAULT_LEVELS = [
+    QualityLevel(1, None, 1),
+    QualityLevel(1, 640, 2),
+    QualityLevel(0, 480, 3),
+    QualityLevel(0, 320, 6),
+]
+
+
+class QualityController:
+    """
+    Moves the tracker between quality levels to hold a target frame rate.
+
+    The controller keeps smoothed averages of the game loop's frame time and the tracker's inference
+    latency. It steps down a level when either stays over budget and steps back up only when both have
+    stayed well under budget for longer. The separate thresholds and dwell times act as hysteresis so
+    the level does not oscillate.
+
+    Args:
+        worker (TrackerWorker): The worker whose quality is controlled. It must have request_quality().
+        target_fps (float): The game loop frame rate to hold. Default is 60.
+        tracker_fps (float): The tracker rate to hold. Default is 30.
+        levels (list): The QualityLevel ladder, best first. Default is DEFAULT_LEVELS.
+        smoothing (float): The weight of a new sample in the moving averages. Default is 0.1.
+        downgrade_after (int): Frames over budget before stepping down. Default is 30.
+        upgrade_after (int): Frames under budget before stepping up. Default is 180.
+        headroom (float): The fraction of the budget both averages must be under to step up. Default is 0.7.
+    """
+
+    def __init__(
+        self,
+        worker,
+        target_fps=60,
+        tracker_fps=30,
+        levels=None,
+        smoothing=0.1,
+        downgrade_after=30,
+        upgrade_after=180,
+        headroom=0.7,
+    ):
+        self.worker = worker
+        self.frame_budget = 1.0 / target_fps
+        self.latency_budget = 1.0 / tracker_fps
+        self.levels = levels if levels is not None else DEFAULT_LEVELS
+        self.smoothing = smoothing
+        self.downgrade_after = downgrade_after
+        self.upgrade_after = upgrade_after
+        self.headroom = headroom
+
+        self.level = 0
+        self.frame_time = None
+        self.latency = None
+        self.over_count = 0
+        self.under_count = 0
+        self._last_sequence = 0
+
+    def _smooth(self, average, sample):
+        """
+        Returns the exponential moving average updated with a new sample.
+        """
+        if average is None:
+            return sample
+        return average + self.smoothing * (sample - average)
+
+    def observe(self, frame_time):
+        """
+        Records one game loop frame and changes the quality level if needed.
+
+        Args:
+            frame_time (float): The seconds the game loop spent working on the frame, without the frame cap delay.
+
+        Returns:
+            QualityLevel: The current quality level.
+        """
+        self.frame_time = self._smooth(self.frame_time, frame_time)
+        result = self.worker.latest()
+        if result.sequence != self._last_sequence:
+            self._last_sequence = result.sequence
+            self.latency = self._smooth(self.latency, result.latency)
+        latency = self.latency if self.latency is not None else 0.0
+
+        if self.frame_time > self.frame_budget or latency > self.latency_budget:
+            self.over_count += 1
+            self.under_count = 0
+        elif (
+            self.frame_time < self.frame_budget * self.headroom
+            and latency < self.latency_budget * self.headroom
+        ):
+            self.under_count += 1
+            self.over_count = 0
+        else:
+            self.over_count = 0
+            self.under_count = 0
+
+        if self.over_count >= self.downgrade_after and self.level < len(self.levels) - 1:
+            self.set_level(self.level + 1)
+        elif self.under_count >= self.upgrade_after and self.level > 0:
+            self.set_level(self.level - 1)
+        return self.levels[self.level]
+
+    def set_level(self, level):
+        """
+        Switches to a quality level and asks the worker to apply it.
+
+        The worker applies the level on its own thread, so this never blocks the game loop.
+
+        Args:
+            level (int): The index into levels.
+        """
+        self.level = level
+        self.over_count = 0
+        self.under_count = 0
+        # Forget the old latency, it was measured at a different quality.
+        self.latency = None
+        self.worker.request_quality(self.levels[level])
@@ -0,0 +1,91 @@
+import time
+import numpy as np
+
+HAND_LANDMARK_COUNT = 21
+FACE_KEYPOINT_COUNT = 6
+
+# Values of TrackerResult.handedness
+LEFT_HAND = 0
+RIGHT_HAND = 1
+
+
+def empty_hands():
+    """
+    Returns an empty hand landmark array of shape (0, 21, 3).
+    """
+    return np.zeros((0, HAND_LANDMARK_COUNT, 3), dtype=np.float32)
+
+
+def empty_faces():
+    """
+    Returns an empty face keypoint array of shape (0, 6, 2).
+    """
+    return np.zeros((0, FACE_KEYPOINT_COUNT, 2), dtype=np.float32)
+
+
+class TrackerResult:
+    """
+    The hands and faces found in one camera frame, stored as compact NumPy arrays.
+
+    Coordinates are relative to the frame, between 0 and 1. The result only holds arrays and numbers,
+    so it pickles cheaply and can be sent between processes as is.
+
+    Args:
+        hands (numpy.ndarray): Hand landmarks, float32 of shape (n_hands, 21, 3) holding x, y and z. Default is no hands.
+        handedness (numpy.ndarray): LEFT_HAND or RIGHT_HAND per hand, int8 of shape (n_hands,). Default is all LEFT_HAND.
+        hand_scores (numpy.ndarray): The handedness confidence per hand, float32 of shape (n_hands,). Default is all 1.
+        faces (numpy.ndarray): Face keypoints, float32 of shape (n_faces, 6, 2) holding x and y. Default is no faces.
+        face_scores (numpy.ndarray): The detection confidence per face, float32 of shape (n_faces,). Default is all 1.
+        timestamp (float): The time.perf_counter() value when the source frame was captured. Default is 0.0.
+        sequence (int): The sequence number of the source frame. Default is 0.
+        latency (float): The seconds spent running hand inference on the frame. Default is 0.0.
+    """
+
+    def __init__(
+        self,
+        hands=None,
+        handedness=None,
+        hand_scores=None,
+        faces=None,
+        face_scores=None,
+        timestamp=0.0,
+        sequence=0,
+        latency=0.0,
+    ):
+        self.hands = empty_hands() if hands is None else hands
+        self.handedness = (
+            np.zeros(len(self.hands), dtype=np.int8) if handedness is None else handedness
+        )
+        self.hand_scores = (
+            np.ones(len(self.hands), dtype=np.float32) if hand_scores is None else hand_scores
+        )
+        self.faces = empty_faces() if faces is None else faces
+        self.face_scores = (
+            np.ones(len(self.faces), dtype=np.float32) if face_scores is None else face_scores
+        )
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.latency = latency
+
+    def wrists(self):
+        """
+        Returns the wrist (landmark 0) position of every hand.
+
+        Returns:
+            numpy.ndarray: A view of shape (n_hands, 2) holding x and y.
+        """
+        return self.hands[:, 0, :2]
+
+    def age(self, now=None):
+        """
+        Returns how old the source frame is.
+
+        Args:
+            now (float): The current time.perf_counter() value. Default is the current time.
+
+        Returns:
+            float: The seconds since the source frame was captured.
+        """
+        if now is None:
+            now = time.perf_counter()
+        return now - self.timestamp
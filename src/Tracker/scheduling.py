@@ -0,0 +1,89 @@
+import numpy as np
+from Tracker.results import empty_faces
+
+
+class FaceScheduler:
+    """
+    Decides which frames face detection runs on and fills in the keypoints for the frames in between.
+
+    Detection runs on every interval-th frame, or when a time budget is given, only as often as keeps
+    the time spent detecting under that fraction of wall time. Between detections the relative keypoints
+    are extrapolated linearly from the last two detections, so the face keeps moving smoothly.
+
+    Args:
+        interval (int): Run face detection on every n-th frame. Default is 1.
+        budget (float): The fraction of time face detection may use, e.g. 0.1. Default is None, which only uses interval.
+        max_extrapolation (float): The longest time in seconds keypoints are extrapolated past the last detection. Default is 0.25.
+    """
+
+    def __init__(self, interval=1, budget=None, max_extrapolation=0.25):
+        self.interval = interval
+        self.budget = budget
+        self.max_extrapolation = max_extrapolation
+        self.frames_since_detection = None
+        self.next_detection_time = None
+        self.scores = np.zeros(0, dtype=np.float32)
+        self._previous = None
+        self._last = None
+
+    def should_detect(self, timestamp):
+        """
+        Returns whether face detection should run on a frame and counts the frame.
+
+        Args:
+            timestamp (float): The capture time of the frame.
+
+        Returns:
+            bool: True if detection should run on this frame.
+        """
+        if self.frames_since_detection is None:
+            return True
+        self.frames_since_detection += 1
+        if self.frames_since_detection < self.interval:
+            return False
+        return self.next_detection_time is None or timestamp >= self.next_detection_time
+
+    def add_detection(self, timestamp, keypoints, duration=0.0, scores=None):
+        """
+        Records the result of a face detection.
+
+        Args:
+            timestamp (float): The capture time of the frame the detection ran on.
+            keypoints (numpy.ndarray): The keypoints, shape (n_faces, 6, 2).
+            duration (float): The seconds the detection took. Used for the time budget. Default is 0.0.
+            scores (numpy.ndarray): The detection confidence per face, shape (n_faces,). Default is all 1.
+        """
+        self.frames_since_detection = 0
+        self.scores = (
+            np.ones(len(keypoints), dtype=np.float32) if scores is None else scores
+        )
+        if self.budget is not None:
+            self.next_detection_time = timestamp + duration / self.budget
+        self._previous = self._last
+        self._last = (timestamp, keypoints)
+
+    def predict(self, timestamp):
+        """
+        Returns the keypoints for a frame.
+
+        Args:
+            timestamp (float): The capture time of the frame.
+
+        Returns:
+            numpy.ndarray: The keypoints, shape (n_faces, 6, 2), matching scores. Empty before the first detection.
+        """
+        if self._last is None:
+            return empty_faces()
+        last_time, last = self._last
+        if self._previous is None:
+            return last
+        previous_time, previous = self._previous
+        # Extrapolation needs the same faces in both detections.
+        if previous.shape != last.shape or last_time <= previous_time:
+            return last
+
+        elapsed = min(timestamp - last_time, self.max_extrapolation)
+        if elapsed <= 0:
+            return last
+        velocity = (last - previous) / (last_time - previous_time)
+        return (last + velocity * elapsed).astype(np.float32)
@@ -0,0 +1,208 @@
+import atexit
+import struct
+import time
+import numpy as np
+
+
+class FrameSource:
+    """
+    Base class for anything frames can be read from.
+
+    The interface matches cv2.VideoCapture, so a VideoCapture can be used wherever a FrameSource is expected.
+
+    Methods:
+        read(): Returns (ret, frame).
+        release(): Frees the source.
+    """
+
+    def read(self):
+        """
+        Reads the next frame.
+
+        Returns:
+            tuple: (ret, frame). ret is False and frame is None when no frame could be read.
+        """
+        return False, None
+
+    def release(self):
+        """
+        Frees the source.
+        """
+        pass
+
+
+# Recording layout: a fixed size header, the raw frames back to back, then one float64 timestamp per frame.
+# The header is rewritten on close, so a recording that was never closed has a count of 0.
+RECORDING_MAGIC = b"HPFRAME1"
+HEADER_FORMAT = "<8sIIIQQ"
+HEADER_SIZE = 64
+
+
+class FrameRecorder(FrameSource):
+    """
+    Records every frame read from another source to a file that FramePlayer can memory-map.
+
+    Args:
+        source (FrameSource): The source to read from, e.g. a cv2.VideoCapture.
+        path (str): The file to record to. It is overwritten.
+    """
+
+    def __init__(self, source, path):
+        self.source = source
+        self.path = path
+        self.file = open(path, "wb")
+        self.shape = None
+        self.count = 0
+        self.timestamps = []
+        # Finish the file even if the program exits without releasing the recorder.
+        atexit.register(self.close)
+
+    def read(self):
+        """
+        Reads a frame from the source and appends it to the recording.
+
+        Returns:
+            tuple: (ret, frame) from the source.
+        """
+        ret, frame = self.source.read()
+        if ret:
+            self.write(frame, time.perf_counter())
+        return ret, frame
+
+    def write(self, frame, timestamp):
+        """
+        Appends a frame to the recording.
+
+        Args:
+            frame (numpy.ndarray): A uint8 frame. Every frame must have the shape of the first one.
+            timestamp (float): The capture time of the frame in seconds.
+        """
+        if self.shape is None:
+            self.shape = frame.shape
+            self._write_header()
+        elif frame.shape != self.shape:
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match the recording's {self.shape}"
+            )
+        self.file.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        self.timestamps.append(timestamp)
+        self.count += 1
+
+    def _write_header(self, timestamps_offset=0):
+        """
+        Writes the header at the start of the file and returns to the previous position.
+        """
+        height, width = self.shape[:2]
+        channels = self.shape[2] if len(self.shape) > 2 else 1
+        header = struct.pack(
+            HEADER_FORMAT,
+            RECORDING_MAGIC,
+            height,
+            width,
+            channels,
+            self.count,
+            timestamps_offset,
+        )
+        position = self.file.tell()
+        self.file.seek(0)
+        self.file.write(header.ljust(HEADER_SIZE, b"\0"))
+        self.file.seek(max(position, HEADER_SIZE))
+
+    def close(self):
+        """
+        Writes the timestamps and the final header and closes the file.
+        """
+        if self.file.closed:
+            return
+        if self.shape is not None:
+            timestamps_offset = self.file.tell()
+            self.file.write(np.asarray(self.timestamps, dtype="<f8").tobytes())
+            self._write_header(timestamps_offset)
+        self.file.close()
+        atexit.unregister(self.close)
+
+    def release(self):
+        """
+        Finishes the recording and releases the source.
+        """
+        self.close()
+        self.source.release()
+
+
+class FramePlayer(FrameSource):
+    """
+    Plays back a recording made by FrameRecorder.
+
+    The frames are memory-mapped, so opening a recording is instant and reading a frame does not copy it.
+
+    Args:
+        path (str): The recording to play.
+        realtime (bool): Whether to wait between frames to match the recorded timing. If False, frames are returned as fast as they are read. Default is True.
+        loop (bool): Whether to start over at the end of the recording. Default is False.
+    """
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        with open(path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE:
+            raise ValueError(f"{path} is too short to be a frame recording")
+        magic, height, width, channels, count, timestamps_offset = struct.unpack_from(
+            HEADER_FORMAT, header
+        )
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not a frame recording")
+
+        self.count = count
+        shape = (height, width, channels) if channels > 1 else (height, width)
+        if count:
+            self.frames = np.memmap(
+                path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=(count,) + shape
+            )
+            self.timestamps = np.memmap(
+                path, dtype="<f8", mode="r", offset=timestamps_offset, shape=(count,)
+            )
+        else:
+            # np.memmap cannot map zero bytes.
+            self.frames = np.zeros((0,) + shape, dtype=np.uint8)
+            self.timestamps = np.zeros(0)
+        self.index = 0
+        self._start_time = None
+
+    def __len__(self):
+        return self.count
+
+    def read(self):
+        """
+        Returns the next recorded frame.
+
+        Returns:
+            tuple: (ret, frame). ret is False at the end of a recording that does not loop.
+            The frame is a read-only view into the recording.
+        """
+        if self.index >= self.count:
+            if not self.loop or self.count == 0:
+                return False, None
+            self.index = 0
+            self._start_time = None
+
+        if self.realtime:
+            now = time.perf_counter()
+            if self._start_time is None:
+                self._start_time = now
+            due = self._start_time + self.timestamps[self.index] - self.timestamps[0]
+            if due > now:
+                time.sleep(due - now)
+
+        frame = self.frames[self.index]
+        self.index += 1
+        return True, frame
+
+    def release(self):
+        """
+        Closes the memory maps.
+        """
+        self.frames = None
+        self.timestamps = None
@@ -1,5 +1,72 @@
 import cv2
 import mediapipe as mp
+import numpy as np
+from Tracker.results import LEFT_HAND, RIGHT_HAND, empty_faces, empty_hands
+
+
+def hands_to_array(hand_landmarks):
+    """
+    Packs hand landmarks into a compact array.
+
+    Args:
+        hand_landmarks (list): Hand landmarks as returned by HandTracker.get_landmarks(), or None.
+
+    Returns:
+        numpy.ndarray: A float32 array of shape (n_hands, 21, 3) holding x, y and z of every landmark.
+    """
+    if not hand_landmarks:
+        return empty_hands()
+    return np.array(
+        [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in hand_landmarks],
+        dtype=np.float32,
+    )
+
+
+def faces_to_array(detections):
+    """
+    Packs face detection keypoints into a compact array.
+
+    Args:
+        detections (list): Face detections as returned by FaceTracker.get_landmarks(), or None.
+
+    Returns:
+        numpy.ndarray: A float32 array of shape (n_faces, 6, 2) holding the relative x and y of every keypoint.
+    """
+    if not detections:
+        return empty_faces()
+    return np.array(
+        [
+            [(kp.x, kp.y) for kp in detection.location_data.relative_keypoints]
+            for detection in detections
+        ],
+        dtype=np.float32,
+    )
+
+
+class HandModels:
+    """
+    The MediaPipe Hands objects a HandTracker runs, made together by HandTracker.create_hands().
+
+    In video mode MediaPipe tracks a hand from the landmarks it found in the previous image, which
+    only works if every image shows the same region. ROI crops move around, so they get their own
+    Hands object in static image mode and the whole frames keep the video mode one.
+
+    Args:
+        full (mediapipe.solutions.hands.Hands): The Hands object for whole frames.
+        crop (mediapipe.solutions.hands.Hands): The static image mode Hands object for ROI crops, or None without ROI mode.
+    """
+
+    def __init__(self, full, crop=None):
+        self.full = full
+        self.crop = crop
+
+    def close(self):
+        """
+        Closes both Hands objects.
+        """
+        self.full.close()
+        if self.crop is not None:
+            self.crop.close()
 
 
 class HandTracker:
@@ -9,32 +76,92 @@ class HandTracker:
     Args:
         static_image_mode (bool): Whether to treat the input as a static image or a video stream. Default is False.
         max_num_hands (int): Maximum number of hands to detect. Default is 2.
+        model_complexity (int): 0 for the faster landmark model, 1 for the more accurate one. Default is 1.
         min_detection_confidence (float): Minimum confidence value for hand detection to be considered successful. Default is 0.5.
         min_tracking_confidence (float): Minimum confidence value for hand tracking to be considered successful. Default is 0.5.
+        inference_width (int): Frames wider than this are downscaled before inference. Default is None, which keeps the full resolution.
+        roi (bool): Whether to only run inference on the area around the last known hands. Default is False.
+        roi_margin (float): How far to grow the hand bounding box on each side in ROI mode, relative to its size. Default is 0.5.
+        roi_refresh (int): In ROI mode, look at the whole frame every this many frames so hands that come into view are found. Default is 10.
     """
 
+    # ROI crops are snapped to this many pixels so the crop stays put while the hands move a little.
+    ROI_STEP = 32
+    # ROI crops never get smaller than this fraction of the frame, so the palm detector has some context.
+    ROI_MIN_SIZE = 0.3
+
     def __init__(
         self,
         static_image_mode=False,
         max_num_hands=2,
+        model_complexity=1,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5,
+        inference_width=None,
+        roi=False,
+        roi_margin=0.5,
+        roi_refresh=10,
     ):
         self.static_image_mode = static_image_mode
         self.max_num_hands = max_num_hands
+        self.model_complexity = model_complexity
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
+        self.inference_width = inference_width
+        self.roi = roi
+        self.roi_margin = roi_margin
+        self.roi_refresh = roi_refresh
+        self.roi_box = None
+        self.roi_hands = 0
+        self.roi_frames = 0
 
-        # If game is slow, change model_complexity to 0
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=self.static_image_mode,
+        models = self.create_hands(self.model_complexity)
+        self.hands = models.full
+        self.crop_hands = models.crop
+        self.mp_draw = mp.solutions.drawing_utils
+
+    def create_hands(self, model_complexity):
+        """
+        Creates the MediaPipe Hands objects with this tracker's settings.
+
+        Creating them loads the model and takes a while, so it can be done on another thread and
+        installed with set_hands(). In ROI mode a second, static image mode object is made for the crops.
+
+        Args:
+            model_complexity (int): The landmark model complexity, 0 or 1.
+
+        Returns:
+            HandModels: The new Hands objects.
+        """
+        full = self._new_hands(model_complexity, self.static_image_mode)
+        crop = self._new_hands(model_complexity, True) if self.roi else None
+        return HandModels(full, crop)
+
+    def _new_hands(self, model_complexity, static_image_mode):
+        return self.mp_hands.Hands(
+            static_image_mode=static_image_mode,
             max_num_hands=self.max_num_hands,
-            model_complexity=1,
+            model_complexity=model_complexity,
             min_detection_confidence=self.min_detection_confidence,
             min_tracking_confidence=self.min_tracking_confidence,
         )
-        self.mp_draw = mp.solutions.drawing_utils
+
+    def set_hands(self, models, model_complexity):
+        """
+        Replaces the MediaPipe Hands objects and closes the old ones.
+
+        Args:
+            models (HandModels): The Hands objects made by create_hands().
+            model_complexity (int): The model complexity they were created with.
+        """
+        old_models = HandModels(self.hands, self.crop_hands)
+        self.hands = models.full
+        self.crop_hands = models.crop
+        self.model_complexity = model_complexity
+        self.roi_box = None
+        self.roi_hands = 0
+        old_models.close()
 
     def find_hands(self, frame, draw=True):
         """
@@ -44,14 +171,114 @@ class HandTracker:
             frame (numpy.ndarray): The input frame in BGR format.
             draw (bool): Whether to draw the hand landmarks on the frame. Default is True.
         """
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        self.results = self.hands.process(frame_rgb)
+        self.process_rgb(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
         if self.results.multi_hand_landmarks and draw:
             for hand_landmarks in self.results.multi_hand_landmarks:
                 self.mp_draw.draw_landmarks(
                     frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
                 )
 
+    def process_rgb(self, frame_rgb):
+        """
+        Tracks hands in a frame that is already in RGB format, e.g. one prepared by FramePreprocessor.
+
+        The frame is passed to MediaPipe as is unless it needs to be cropped for ROI mode or downscaled
+        to inference_width. Landmarks are always relative to the whole frame. In ROI mode the whole
+        frame is searched again when the crop loses a hand, when fewer than max_num_hands are tracked
+        and roi_refresh frames have gone by, or when there is nothing to crop to. Crops go to the
+        static image mode crop_hands, so moving crops do not throw off the video mode tracking.
+
+        Args:
+            frame_rgb (numpy.ndarray): The input frame in RGB format.
+        """
+        height, width = frame_rgb.shape[:2]
+        region = None
+        if self.roi:
+            self.roi_frames += 1
+            # New hands can only show up outside the crop, so every so often look everywhere.
+            if self.roi_hands >= self.max_num_hands or self.roi_frames < self.roi_refresh:
+                region = self._roi_region(width, height)
+        if region is not None:
+            x0, y0, x1, y1 = region
+            self.results = self.crop_hands.process(
+                self._fit_inference_width(frame_rgb[y0:y1, x0:x1])
+            )
+            found = len(self.results.multi_hand_landmarks or ())
+            if found >= self.roi_hands:
+                self._remap_landmarks(region, width, height)
+            else:
+                # A hand was lost inside the crop, look at the whole frame again.
+                region = None
+        if region is None:
+            self.results = self.hands.process(self._fit_inference_width(frame_rgb))
+            self.roi_frames = 0
+        if self.roi:
+            self._update_roi_box()
+
+    def _fit_inference_width(self, image):
+        """
+        Downscales an image to inference_width, keeping its aspect ratio.
+
+        Returns:
+            numpy.ndarray: A C-contiguous image no wider than inference_width.
+        """
+        height, width = image.shape[:2]
+        if self.inference_width is None or width <= self.inference_width:
+            return np.ascontiguousarray(image)
+        scaled_height = max(1, int(round(height * self.inference_width / width)))
+        return cv2.resize(
+            image, (self.inference_width, scaled_height), interpolation=cv2.INTER_AREA
+        )
+
+    def _roi_region(self, width, height):
+        """
+        Returns the pixel region to crop to around the last known hands.
+
+        Returns:
+            tuple: (x0, y0, x1, y1), or None if there are no known hands or the crop would be the whole frame.
+        """
+        if self.roi_box is None:
+            return None
+        min_x, min_y, max_x, max_y = self.roi_box
+        box_w, box_h = max_x - min_x, max_y - min_y
+        pad_x = max(box_w * self.roi_margin, (self.ROI_MIN_SIZE - box_w) / 2)
+        pad_y = max(box_h * self.roi_margin, (self.ROI_MIN_SIZE - box_h) / 2)
+
+        step = self.ROI_STEP
+        x0 = max(0, int((min_x - pad_x) * width) // step * step)
+        y0 = max(0, int((min_y - pad_y) * height) // step * step)
+        x1 = min(width, -(-int((max_x + pad_x) * width) // step) * step)
+        y1 = min(height, -(-int((max_y + pad_y) * height) // step) * step)
+        if x1 - x0 >= width and y1 - y0 >= height:
+            return None
+        return x0, y0, x1, y1
+
+    def _remap_landmarks(self, region, width, height):
+        """
+        Converts landmarks found in a crop to coordinates relative to the whole frame.
+        """
+        x0, y0, x1, y1 = region
+        crop_w, crop_h = x1 - x0, y1 - y0
+        for hand_landmarks in self.results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = (x0 + landmark.x * crop_w) / width
+                landmark.y = (y0 + landmark.y * crop_h) / height
+                # z uses the same scale as x.
+                landmark.z = landmark.z * crop_w / width
+
+    def _update_roi_box(self):
+        """
+        Stores the normalized bounding box of all tracked hands, or None if no hands were found.
+        """
+        self.roi_hands = len(self.results.multi_hand_landmarks or ())
+        if not self.results.multi_hand_landmarks:
+            self.roi_box = None
+            return
+        points = hands_to_array(self.results.multi_hand_landmarks)
+        min_x, min_y = points[:, :, :2].reshape(-1, 2).min(axis=0)
+        max_x, max_y = points[:, :, :2].reshape(-1, 2).max(axis=0)
+        self.roi_box = (float(min_x), float(min_y), float(max_x), float(max_y))
+
     def get_landmarks(self):
         """
         Returns the landmarks of the detected hands.
@@ -62,6 +289,25 @@ class HandTracker:
         if self.results.multi_hand_landmarks:
             return self.results.multi_hand_landmarks
 
+    def get_arrays(self):
+        """
+        Returns the detected hands as compact arrays, the way TrackerResult stores them.
+
+        Returns:
+            tuple: (hands, handedness, hand_scores) with shapes (n_hands, 21, 3), (n_hands,) and (n_hands,).
+        """
+        hands = hands_to_array(self.results.multi_hand_landmarks)
+        classifications = [
+            handedness.classification[0]
+            for handedness in (self.results.multi_handedness or [])
+        ]
+        handedness = np.array(
+            [RIGHT_HAND if c.label == "Right" else LEFT_HAND for c in classifications],
+            dtype=np.int8,
+        )
+        scores = np.array([c.score for c in classifications], dtype=np.float32)
+        return hands, handedness, scores
+
     def display_image(self, frame, window_name="Hand Tracking"):
         """
         Displays the image frame in a window.
@@ -104,12 +350,22 @@ class FaceTracker:
             frame (numpy.ndarray): The input frame in BGR format.
             draw (bool): Whether to draw the face detections on the frame. Default is True.
         """
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        self.results = self.face_detection.process(frame_rgb)
+        self.process_rgb(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
         if self.results.detections and draw:
             for detection in self.results.detections:
                 self.mp_draw.draw_detection(frame, detection)
 
+    def process_rgb(self, frame_rgb):
+        """
+        Detects faces in a frame that is already in RGB format, e.g. one prepared by FramePreprocessor.
+
+        The frame is passed to MediaPipe as is, without another copy.
+
+        Args:
+            frame_rgb (numpy.ndarray): The input frame in RGB format.
+        """
+        self.results = self.face_detection.process(frame_rgb)
+
     def get_landmarks(self):
         """
         Returns the landmarks of the detected faces.
@@ -120,6 +376,18 @@ class FaceTracker:
         if self.results.detections:
             return self.results.detections
 
+    def get_arrays(self):
+        """
+        Returns the detected faces as compact arrays, the way TrackerResult stores them.
+
+        Returns:
+            tuple: (faces, face_scores) with shapes (n_faces, 6, 2) and (n_faces,).
+        """
+        detections = self.results.detections or []
+        faces = faces_to_array(detections)
+        scores = np.array([d.score[0] for d in detections], dtype=np.float32)
+        return faces, scores
+
     def display_image(self, frame, window_name="Face Detection"):
         """
         Displays the image frame in a window.
@@ -0,0 +1,170 @@
+import threading
+import time
+from Tracker.preprocess import FramePreprocessor
+from Tracker.results import TrackerResult
+from Tracker.scheduling import FaceScheduler
+
+
+class TrackerWorker:
+    """
+    Runs the hand and face trackers on a background thread.
+
+    The worker takes the newest frame from a CameraStream, prepares it once with a FramePreprocessor,
+    runs both trackers on the prepared RGB frame and publishes a TrackerResult. The game loop reads
+    the newest result with latest() and never waits on inference.
+
+    Args:
+        camera (CameraStream): The stream to read frames from.
+        hand_tracker (HandTracker): The hand tracker.
+        face_tracker (FaceTracker): The face tracker.
+        flip (bool): Whether to mirror frames horizontally before tracking. Default is True.
+        scale (float): The factor to resize frames by before tracking. Default is 1.0.
+        face_scheduler (FaceScheduler): Decides which frames face detection runs on. Default is None,
+            which runs it on every frame.
+    """
+
+    def __init__(
+        self, camera, hand_tracker, face_tracker, flip=True, scale=1.0, face_scheduler=None
+    ):
+        self.camera = camera
+        self.hand_tracker = hand_tracker
+        self.face_tracker = face_tracker
+        self.preprocessor = FramePreprocessor(flip, scale)
+        self.face_scheduler = face_scheduler if face_scheduler is not None else FaceScheduler()
+        self.result = TrackerResult()
+        self._quality_lock = threading.Lock()
+        self._pending_quality = None
+        self._target_complexity = None
+        self._pending_hands = None
+        self._builder = None
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """
+        Starts the inference thread. Does nothing if it is already running.
+        """
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._inference_loop, daemon=True)
+        self._thread.start()
+
+    def _inference_loop(self):
+        """
+        Processes frames until the worker is stopped, idling briefly when there is no new frame.
+        """
+        while self._running:
+            if not self.process_latest():
+                time.sleep(0.002)
+
+    def process_latest(self):
+        """
+        Runs the trackers on the newest camera frame if it has not been processed yet.
+
+        Returns:
+            bool: True if a new frame was processed, otherwise False.
+        """
+        frame, timestamp, sequence = self.camera.read_latest()
+        if frame is None or sequence == self.result.sequence:
+            return False
+
+        self._apply_quality()
+
+        start = time.perf_counter()
+        frame_rgb = self.preprocessor.process(frame)
+        self.hand_tracker.process_rgb(frame_rgb)
+        hand_latency = time.perf_counter() - start
+        hands, handedness, hand_scores = self.hand_tracker.get_arrays()
+        if self.face_scheduler.should_detect(timestamp):
+            face_start = time.perf_counter()
+            self.face_tracker.process_rgb(frame_rgb)
+            faces, face_scores = self.face_tracker.get_arrays()
+            self.face_scheduler.add_detection(
+                timestamp, faces, time.perf_counter() - face_start, face_scores
+            )
+
+        # Publishing is a single reference swap so readers always see a complete result.
+        self.result = TrackerResult(
+            hands,
+            handedness,
+            hand_scores,
+            self.face_scheduler.predict(timestamp),
+            self.face_scheduler.scores,
+            timestamp,
+            sequence,
+            hand_latency,
+        )
+        return True
+
+    def request_quality(self, level):
+        """
+        Asks the worker to switch to a quality level before its next frame.
+
+        Args:
+            level (QualityLevel): The quality level to switch to.
+        """
+        with self._quality_lock:
+            self._pending_quality = level
+
+    def _apply_quality(self):
+        """
+        Applies the newest requested quality level on the inference thread.
+
+        A new MediaPipe Hands object is built on a helper thread, the current one keeps tracking until
+        the new one is ready and is swapped in. A build that finishes after a newer level asked for
+        another model complexity is thrown away.
+        """
+        with self._quality_lock:
+            level, self._pending_quality = self._pending_quality, None
+        if level is not None:
+            self.hand_tracker.inference_width = level.inference_width
+            self.face_scheduler.interval = level.face_interval
+            self._target_complexity = level.model_complexity
+
+        if self._pending_hands is not None:
+            hands, model_complexity = self._pending_hands
+            self._pending_hands = None
+            self._builder = None
+            if model_complexity == self._target_complexity:
+                self.hand_tracker.set_hands(hands, model_complexity)
+            else:
+                hands.close()
+
+        target = self._target_complexity
+        if (
+            target is not None
+            and target != self.hand_tracker.model_complexity
+            and self._builder is None
+        ):
+            self._builder = threading.Thread(
+                target=self._build_hands, args=(target,), daemon=True
+            )
+            self._builder.start()
+
+    def _build_hands(self, model_complexity):
+        """
+        Creates a Hands object on the helper thread and hands it to the inference thread.
+        """
+        self._pending_hands = (
+            self.hand_tracker.create_hands(model_complexity),
+            model_complexity,
+        )
+
+    def latest(self):
+        """
+        Returns the newest tracker result without blocking.
+
+        Returns:
+            TrackerResult: The newest result. It has no hands or faces until the first frame is processed.
+        """
+        return self.result
+
+    def stop(self):
+        """
+        Stops the inference thread.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
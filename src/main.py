@@ -1,9 +1,18 @@
+import argparse
+import os
+import random
 import pygame
 import sys
 from Pong.components import Ball, Arena, Paddle, Scorer
 from Pong.gamelogic import Game, StateManager, Menu, SoundManager
 from Pong.graphics import Animation
+from Pong.replay import MAX_SEED, InputLog
 from Tracker.trackers import HandTracker, FaceTracker
+from Tracker.camera import CameraStream
+from Tracker.worker import TrackerWorker
+from Tracker.process import ProcessTrackerWorker
+from Tracker.quality import QualityController
+from Tracker.sources import FramePlayer, FrameRecorder
 import cv2
 
 import cProfile
@@ -13,6 +22,25 @@ HEIGHT = 768
 FPS = 60
 
 
+def seed_argument(text):
+    """
+    Parses the --seed option.
+
+    The game states use the seed plus one and two, and input logs store seeds as unsigned 64 bit
+    numbers, so the seed must leave room for both.
+
+    Args:
+        text (str): The option value.
+
+    Returns:
+        int: The seed.
+    """
+    seed = int(text)
+    if not 0 <= seed <= MAX_SEED - 2:
+        raise argparse.ArgumentTypeError(f"must be between 0 and {MAX_SEED - 2}")
+    return seed
+
+
 class App:
     """
     Represents the main application for the Hand Pong game.
@@ -24,13 +52,17 @@ class App:
     - right_paddle (Paddle): The right paddle in the game.
     - scorer (Scorer): The scorer for the game.
     - components (list): A list of game components.
-    - cap (cv2.VideoCapture): The camera capture object.
+    - cap (FrameSource): The frame source, by default a cv2.VideoCapture of the first camera.
+    - camera (CameraStream): The threaded stream that reads frames from cap.
     - graphic_one (Animation): The one player game graphic.
     - graphic_two (Animation): The two player game graphic.
     - menu_animation (Animation): The menu animation graphic.
     - sound_manager (SoundManager): The sound manager for the game.
-    - hand_tracker (HandTracker): The hand tracker object.
-    - face_tracker (FaceTracker): The face tracker object.
+    - hand_tracker (HandTracker): The hand tracker object. None with the process backend.
+    - face_tracker (FaceTracker): The face tracker object. None with the process backend.
+    - tracker (TrackerWorker or ProcessTrackerWorker): The worker that runs the hand and face trackers in the background.
+    - quality (QualityController): Adjusts the tracker quality to hold the frame rate. None if disabled.
+    - seed (int): The seed the menu and game states derive their random number generators from.
     - menu (Menu): The game menu state.
     - one_player (Game): The one-player game state.
     - two_player (Game): The two-player game state.
@@ -41,12 +73,28 @@ class App:
     - profiler (cProfile.Profile): The profiler object.
     """
 
-    def __init__(self, profile=False):
+    def __init__(
+        self,
+        profile=False,
+        tracker_backend="thread",
+        adaptive_quality=True,
+        source=None,
+        seed=None,
+        input_log=None,
+        arena_style="ellipse",
+    ):
         """
         Initializes the App object.
 
         Parameters:
         - profile (bool): Flag indicating if profiling is enabled.
+        - tracker_backend (str): "thread" runs both trackers on one background thread,
+          "process" runs them in separate processes that share frames through shared memory.
+        - adaptive_quality (bool): Flag indicating if the tracker quality adapts to the measured frame time.
+        - source (FrameSource): Where camera frames come from, e.g. a FramePlayer. Defaults to the first camera.
+        - seed (int): The seed for the random balls. Defaults to None, which picks one at random.
+        - input_log (str): Records the paddle inputs of each game to this path, with "-one" or "-two" added to the name, for replaying with Pong.replay.
+        - arena_style (str): How the Game of Life cells are drawn, one of Animation.ARENA_STYLES.
         """
         # start pygame
         pygame.init()
@@ -74,38 +122,60 @@ class App:
         ]
 
         # Initialize Camera
-        self.cap = cv2.VideoCapture(0)
+        self.cap = source if source is not None else cv2.VideoCapture(0)
+        self.camera = CameraStream(self.cap)
 
         # Create Game Graphics
-        self.graphic_one = Animation(HEIGHT, WIDTH)
-        self.graphic_two = Animation(HEIGHT, WIDTH)
+        self.graphic_one = Animation(HEIGHT, WIDTH, arena_style)
+        self.graphic_two = Animation(HEIGHT, WIDTH, arena_style)
         self.menu_animation = Animation(HEIGHT, WIDTH)
 
         # Load sounds
         self.sound_manager = SoundManager()
 
         # Create Hand and Face Trackers
-        self.hand_tracker = HandTracker()
-        self.face_tracker = FaceTracker()
+        if tracker_backend == "process":
+            # The trackers are created inside the worker processes.
+            self.hand_tracker = None
+            self.face_tracker = None
+            self.tracker = ProcessTrackerWorker(self.camera)
+        else:
+            self.hand_tracker = HandTracker()
+            self.face_tracker = FaceTracker()
+            self.tracker = TrackerWorker(
+                self.camera, self.hand_tracker, self.face_tracker
+            )
+
+        self.quality = (
+            QualityController(self.tracker, target_fps=FPS) if adaptive_quality else None
+        )
 
         # Create Game States
-        self.menu = Menu(self.menu_animation, self.sound_manager)
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        logs = [None, None]
+        if input_log is not None:
+            root, ext = os.path.splitext(input_log)
+            logs = [
+                InputLog(f"{root}-{name}{ext}", self.seed + i, paddles, WIDTH, HEIGHT)
+                for i, (name, paddles) in enumerate((("one", 1), ("two", 2)), start=1)
+            ]
+        self.menu = Menu(self.menu_animation, self.sound_manager, seed=self.seed)
         self.one_player = Game(
             self.graphic_one,
             self.components,
             self.sound_manager,
-            self.hand_tracker,
-            self.face_tracker,
-            self.cap,
+            self.tracker,
             one_player=True,
+            seed=self.seed + 1,
+            input_log=logs[0],
         )
         self.two_player = Game(
             self.graphic_two,
             self.components,
             self.sound_manager,
-            self.hand_tracker,
-            self.face_tracker,
-            self.cap,
+            self.tracker,
+            seed=self.seed + 2,
+            input_log=logs[1],
         )
         self.state_manager = StateManager(
             self.one_player, self.two_player, menu=self.menu
@@ -120,14 +190,20 @@ class App:
 
     def exit_game(self):
         """
-        Exits the game by quitting pygame, releasing the camera capture, closing the hand and face trackers, closing the sound manager,
+        Exits the game by quitting pygame, stopping the tracker worker and camera stream, releasing the camera capture, closing the hand and face trackers, closing the sound manager,
         and exiting the program.
         """
         pygame.quit()
-        self.cap.release()
+        self.tracker.stop()
+        self.camera.release()
         cv2.destroyAllWindows()
-        self.hand_tracker.close()
-        self.face_tracker.close()
+        if self.hand_tracker is not None:
+            self.hand_tracker.close()
+        if self.face_tracker is not None:
+            self.face_tracker.close()
+        for game in (self.one_player, self.two_player):
+            if game.input_log is not None:
+                game.input_log.close()
         sys.exit()
 
     def run(self):
@@ -137,6 +213,9 @@ class App:
         if self.profile:
             self.profiler.enable()
 
+        self.camera.start()
+        self.tracker.start()
+
         while self.is_running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -147,6 +226,9 @@ class App:
             self.state_manager.update()
             self.state_manager.draw()
             self.clock.tick(FPS)
+            if self.quality is not None:
+                # get_rawtime() leaves out the delay added to cap the frame rate.
+                self.quality.observe(self.clock.get_rawtime() / 1000)
 
         if self.profile:
             self.profiler.disable()
@@ -156,5 +238,48 @@ class App:
 
 
 if __name__ == "__main__":
-    app = App(profile=False)
+    parser = argparse.ArgumentParser(description="Hand Pong")
+    parser.add_argument("--profile", action="store_true", help="print profiler stats on exit")
+    parser.add_argument(
+        "--tracker",
+        choices=["thread", "process"],
+        default="thread",
+        help="run the trackers on a background thread or in separate processes",
+    )
+    parser.add_argument(
+        "--fixed-quality",
+        action="store_true",
+        help="keep the best tracker quality instead of adapting it to the frame rate",
+    )
+    parser.add_argument("--record", metavar="PATH", help="record the camera frames to a file")
+    parser.add_argument(
+        "--replay", metavar="PATH", help="play recorded frames instead of using the camera"
+    )
+    parser.add_argument("--seed", type=seed_argument, help="seed the random balls")
+    parser.add_argument(
+        "--log-inputs", metavar="PATH", help="record the paddle inputs for python -m Pong.replay"
+    )
+    parser.add_argument(
+        "--arena-style",
+        choices=Animation.ARENA_STYLES,
+        default="ellipse",
+        help="draw the Game of Life cells as ellipses, scaled squares or stamped sprites",
+    )
+    args = parser.parse_args()
+
+    source = None
+    if args.replay:
+        source = FramePlayer(args.replay, loop=True)
+    elif args.record:
+        source = FrameRecorder(cv2.VideoCapture(0), args.record)
+
+    app = App(
+        profile=args.profile,
+        tracker_backend=args.tracker,
+        adaptive_quality=not args.fixed_quality,
+        source=source,
+        seed=args.seed,
+        input_log=args.log_inputs,
+        arena_style=args.arena_style,
+    )
     app.run()
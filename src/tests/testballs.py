@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+
+from Pong.balls import BallSystem, elastic_collisions
+from Pong.broadphase import SpatialHash
+
+
+class TestElasticCollisions(unittest.TestCase):
+    def test_matches_pairwise_formula(self):
+        pos = np.array([[0.0, 0.0], [15.0, 0.0]])
+        vel = np.array([[3.0, 1.0], [-2.0, 4.0]])
+        radius = np.array([10.0, 6.0])
+        hit = np.zeros(2, dtype=bool)
+
+        m1, m2 = radius**2
+        v1, v2 = vel.copy()
+        v1f = ((m1 - m2) * v1 + 2 * m2 * v2) / (m1 + m2)
+        v2f = ((m2 - m1) * v2 + 2 * m1 * v1) / (m1 + m2)
+
+        i, j = elastic_collisions(pos, vel, radius, hit)
+        self.assertEqual((i.tolist(), j.tolist()), ([0], [1]))
+        np.testing.assert_allclose(vel, [v1f, v2f])
+        self.assertTrue(hit.all())
+
+    def test_conserves_momentum(self):
+        rng = np.random.default_rng(1)
+        pos = rng.uniform(0, 60, (40, 2))
+        vel = rng.uniform(-5, 5, (40, 2))
+        radius = rng.uniform(4, 15, 40)
+        hit = np.zeros(40, dtype=bool)
+        mass = radius[:, None] ** 2
+        before = (mass * vel).sum(axis=0)
+
+        i, _ = elastic_collisions(pos, vel, radius, hit)
+        self.assertGreater(len(i), 0)
+        np.testing.assert_allclose((mass * vel).sum(axis=0), before)
+
+    def test_skips_pairs_that_were_both_hit(self):
+        pos = np.array([[0.0, 0.0], [5.0, 0.0]])
+        vel = np.array([[1.0, 0.0], [-1.0, 0.0]])
+        hit = np.ones(2, dtype=bool)
+        i, _ = elastic_collisions(pos, vel, np.array([4.0, 4.0]), hit)
+        self.assertEqual(len(i), 0)
+        np.testing.assert_array_equal(vel, [[1.0, 0.0], [-1.0, 0.0]])
+
+
+class TestBallSystem(unittest.TestCase):
+    def test_update_and_tails(self):
+        balls = BallSystem(capacity=1)
+        balls.add(10, 20, radius=5, vel_x=1, vel_y=-2)
+        balls.add([0, 5], [0, 5], radius=3, vel_x=0, vel_y=0)
+        self.assertEqual(len(balls), 3)
+
+        for _ in range(BallSystem.MAX_TAILS + 5):
+            balls.update(1.0)
+        np.testing.assert_allclose(balls.pos[0], [35, -30])
+        newest = balls.tails[0, balls.tail_order()[-1]]
+        oldest = balls.tails[0, balls.tail_order()[0]]
+        np.testing.assert_allclose(newest, [35, -30])
+        np.testing.assert_allclose(oldest, [35 - 19, -30 + 38])
+
+
+def touching_pairs(pos, radius, i, j):
+    delta = pos[i] - pos[j]
+    touching = (delta**2).sum(axis=1) < (radius[i] + radius[j]) ** 2
+    return {tuple(sorted(pair)) for pair in zip(i[touching].tolist(), j[touching].tolist())}
+
+
+class TestSpatialHash(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(2)
+        broadphase = SpatialHash()
+        pos = rng.uniform(-50, 400, (300, 2))
+        vel = rng.uniform(-8, 8, (300, 2))
+        radius = rng.uniform(3, 20, 300)
+        for _ in range(5):
+            i, j = broadphase.pairs(pos, radius)
+            # Every candidate pair is found once.
+            candidates = [tuple(sorted(pair)) for pair in zip(i.tolist(), j.tolist())]
+            self.assertEqual(len(candidates), len(set(candidates)))
+            self.assertTrue(all(a != b for a, b in candidates))
+            expected = touching_pairs(pos, radius, *np.triu_indices(len(pos), 1))
+            self.assertEqual(touching_pairs(pos, radius, i, j), expected)
+            pos += vel
+
+    def test_small_and_fixed_cells(self):
+        i, j = SpatialHash().pairs(np.zeros((1, 2)), np.ones(1))
+        self.assertEqual(len(i), 0)
+        pos = np.array([[0.0, 0.0], [9.0, 9.0], [40.0, 0.0]])
+        radius = np.array([7.0, 7.0, 7.0])
+        i, j = SpatialHash(cell_size=20).pairs(pos, radius)
+        self.assertEqual(touching_pairs(pos, radius, i, j), {(0, 1)})
+
+
+if __name__ == "__main__":
+    unittest.main()
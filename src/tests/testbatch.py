@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from Pong.batch import BatchSimulator, run_parallel
+from Pong.components import Ball
+from Pong.headless import HeadlessGame
+
+
+class TestBatchSimulator(unittest.TestCase):
+    def test_matches_game(self):
+        for one_player in (False, True):
+            headless = HeadlessGame(script=lambda tick: (None, None), one_player=one_player)
+            sim = BatchSimulator(3, one_player=one_player, difficulty=False)
+            for _ in range(400):
+                headless.run(1)
+                sim.step(1.0)
+                ball = headless.game.balls[0]
+                for arena in range(3):
+                    np.testing.assert_allclose(sim.ball_pos[arena, 0], (ball.x, ball.y))
+            np.testing.assert_array_equal(sim.scores, [headless.scores] * 3)
+
+    def test_goal_before_ball_collision(self):
+        # A ball scoring in the left goal overlaps a second ball, which must not be hit by it.
+        headless = HeadlessGame(script=lambda tick: (None, None))
+        sim = BatchSimulator(1, difficulty=False)
+        game = headless.game
+        y = sim.y + sim.height - 100
+        ball = game.balls[0]
+        ball.x, ball.y, ball.vel_x, ball.vel_y = sim.x + 13, y, -3, 0
+        game.add_ball(Ball(sim.x + 30, y, radius=12, vel_x=-5, vel_y=0))
+        sim.ball_pos[0, :2] = [(sim.x + 13, y), (sim.x + 30, y)]
+        sim.ball_vel[0, :2] = [(-3, 0), (-5, 0)]
+        sim.ball_radius[0, 1] = 12
+        sim.ball_active[0, 1] = True
+
+        headless.run(1)
+        sim.step(1.0)
+        for index, ball in enumerate(game.balls):
+            np.testing.assert_allclose(sim.ball_pos[0, index], (ball.x, ball.y))
+            np.testing.assert_allclose(sim.ball_vel[0, index], (ball.vel_x, ball.vel_y))
+        np.testing.assert_allclose(sim.ball_vel[0, 1], (-5, 0))
+        np.testing.assert_array_equal(sim.scores[0], headless.scores)
+
+    def test_difficulty_adds_balls(self):
+        sim = BatchSimulator(2, seed=1)
+        sim.scores[0, 0] = 3
+        sim.step(1.0)
+        self.assertEqual(sim.ball_active.sum(axis=1).tolist(), [2, 1])
+
+    def test_parallel(self):
+        scores = run_parallel(5, 50, processes=2, policy="idle")
+        self.assertEqual(scores.shape, (5, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
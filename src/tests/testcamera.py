@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from Tracker.camera import CameraStream
+
+
+class FakeCapture:
+    """
+    Hands out a fixed list of frames, then stops the stream that reads it.
+    """
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.stream = None
+        self.released = False
+
+    def read(self):
+        if not self.frames:
+            self.stream._running = False
+            return False, None
+        return True, self.frames.pop(0)
+
+    def release(self):
+        self.released = True
+
+
+def run_capture(stream, frames):
+    # Runs the capture loop on the calling thread until the frames run out.
+    stream.capture.frames = list(frames)
+    stream._running = True
+    stream._capture_loop()
+
+
+class TestCameraStream(unittest.TestCase):
+    def setUp(self):
+        self.frames = [np.full((2, 3, 3), i, dtype=np.uint8) for i in range(4)]
+        self.capture = FakeCapture([])
+        self.stream = CameraStream(self.capture)
+        self.capture.stream = self.stream
+
+    def test_nothing_before_first_frame(self):
+        frame, timestamp, sequence = self.stream.read_latest()
+        self.assertIsNone(frame)
+        self.assertEqual(sequence, 0)
+
+    def test_drops_unread_frames(self):
+        run_capture(self.stream, self.frames[:3])
+        frame, timestamp, sequence = self.stream.read_latest()
+        # Only the newest frame is kept, the two before it were never read.
+        self.assertIs(frame, self.frames[2])
+        self.assertEqual(sequence, 3)
+        self.assertEqual(self.stream.dropped_frames, 2)
+        self.assertEqual(self.stream.failed_reads, 1)
+        self.assertGreater(timestamp, 0)
+
+        # A frame that replaces one that was read is not dropped.
+        run_capture(self.stream, self.frames[3:])
+        frame, _, sequence = self.stream.read_latest()
+        self.assertIs(frame, self.frames[3])
+        self.assertEqual(sequence, 4)
+        self.assertEqual(self.stream.dropped_frames, 2)
+
+    def test_thread(self):
+        self.capture.frames = list(self.frames)
+        self.stream.start()
+        self.stream._thread.join(timeout=1.0)
+        self.assertEqual(self.stream.read_latest()[2], len(self.frames))
+        self.stream.release()
+        self.assertTrue(self.capture.released)
+        self.assertIsNone(self.stream._thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from Pong.components import Ball
+
+
+class TestBall(unittest.TestCase):
+    def test_tail_ring(self):
+        ball = Ball(0, 0, vel_x=1, vel_y=2)
+        for _ in range(Ball.MAX_TAILS + 4):
+            ball.update(1.0)
+        order = ball.tail_order()
+        self.assertEqual(len(order), Ball.MAX_TAILS)
+        tail = [(ball.tails[2 * k], ball.tails[2 * k + 1]) for k in order]
+        self.assertEqual(tail[-1], (ball.x, ball.y))
+        self.assertEqual(tail[0], (ball.x - 19, ball.y - 38))
+
+        ball.resize(2, 0.5)
+        self.assertEqual((ball.tails[2 * order[-1]], ball.tails[2 * order[-1] + 1]), (ball.x, ball.y))
+
+    def test_slots(self):
+        ball = Ball(0, 0)
+        with self.assertRaises(AttributeError):
+            ball.colour = "red"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from Tracker.filters import AlphaBetaFilter
+
+
+class TestAlphaBetaFilter(unittest.TestCase):
+    def track(self, hand_filter, speed, start, count, dt=1 / 30):
+        for i in range(count):
+            t = start + i * dt
+            hand_filter.update(100 + speed * t, t)
+        return start + count * dt
+
+    def test_follows_constant_speed(self):
+        hand_filter = AlphaBetaFilter()
+        end = self.track(hand_filter, 600, 0.0, 60)
+        self.assertAlmostEqual(hand_filter.velocity, 600, delta=1)
+        # The prediction runs ahead of the last frame, but no further than max_lead.
+        last = end - 1 / 30
+        self.assertAlmostEqual(hand_filter.predict(last + 0.05), 100 + 600 * (last + 0.05), delta=1)
+        self.assertAlmostEqual(hand_filter.predict(last + 1.0), 100 + 600 * (last + 0.1), delta=1)
+
+    def test_gap_resets(self):
+        hand_filter = AlphaBetaFilter()
+        end = self.track(hand_filter, 600, 0.0, 60)
+        # The hand was lost for two seconds and shows up somewhere else.
+        self.assertEqual(hand_filter.update(250, end + 2.0), 250)
+        self.assertEqual(hand_filter.velocity, 0.0)
+        self.assertEqual(hand_filter.predict(end + 2.05), 250)
+
+    def test_same_frame(self):
+        hand_filter = AlphaBetaFilter()
+        hand_filter.update(10, 1.0)
+        hand_filter.update(20, 1.1)
+        position = hand_filter.position
+        self.assertEqual(hand_filter.update(40, 1.1), position)
+        hand_filter.reset()
+        self.assertIsNone(hand_filter.predict(1.2))
+
+
+if __name__ == "__main__":
+    unittest.main()
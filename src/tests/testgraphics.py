@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+import pygame
+
+from Pong.components import Arena
+from Pong.graphics import Animation
+
+
+class TestArenaStyles(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+
+    def test_styles_draw_the_grid(self):
+        surfaces = {}
+        for style in Animation.ARENA_STYLES:
+            animation = Animation(300, 400, arena_style=style)
+            arena = Arena(400, 300)
+            rng = np.random.default_rng(5)
+            for row, col in zip(*np.nonzero(rng.random((arena.rows, arena.cols)) < 0.3)):
+                arena.set_cell(int(row), int(col))
+            animation.draw_arena(arena)
+            arena.update(Arena.UPDATE_RATE)
+            animation.draw_arena(arena)
+            self.assertEqual(len(arena.dirty_cells), 0)
+
+            # The middle pixel of every cell shows whether it is alive.
+            pixels = pygame.surfarray.array3d(animation.arena_surf)
+            width, height = arena.cell_size
+            x = arena.x + np.arange(arena.cols) * width + width // 2
+            y = arena.y + np.arange(arena.rows) * height + height // 2
+            np.testing.assert_array_equal(pixels[x[None, :], y[:, None], 1] > 0, arena.grid)
+            surfaces[style] = pixels
+
+        # Sprites keep the look of the round cells.
+        np.testing.assert_array_equal(surfaces["sprite"], surfaces["ellipse"])
+
+    def test_unknown_style(self):
+        with self.assertRaises(ValueError):
+            Animation(300, 400, arena_style="hexagon")
+
+
+if __name__ == "__main__":
+    unittest.main()
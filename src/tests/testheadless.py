@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+
+from Pong.components import Arena
+from Pong.headless import HeadlessGame
+
+
+class TestHeadlessGame(unittest.TestCase):
+    def test_scripted_paddles(self):
+        headless = HeadlessGame(script=lambda tick: (0.5, None))
+        headless.run(200)
+        left, right = sorted(headless.game.paddles, key=lambda p: p.x)
+        arena = headless.game.arena
+        self.assertAlmostEqual(left.y, 0.5 * arena.height, delta=1)
+        self.assertEqual(right.vel, 0)
+        self.assertEqual(headless.tracker.ticks, 200)
+        self.assertAlmostEqual(headless.clock(), headless.simulated_time())
+
+    def test_match_scores(self):
+        # Nobody moves the paddles, so the ball gets past them.
+        headless = HeadlessGame(script=lambda tick: (None, None))
+        left, right = headless.run(3000)
+        self.assertGreater(left + right, 0)
+
+        # A follower on both sides keeps the ball in play.
+        follower = HeadlessGame()
+        follower.run(3000)
+        self.assertGreater(follower.mixer.played["paddle"], 0)
+
+    def test_sounds_once_per_frame(self):
+        headless = HeadlessGame()
+        game = headless.game
+        # Several physics steps of one frame all hit a wall.
+        for _ in range(4):
+            game.queue_sound("wall")
+            game.check_collisions()
+        self.assertNotIn("wall", headless.mixer.played)
+        game.play_sounds()
+        game.play_sounds()
+        self.assertEqual(headless.mixer.played["wall"], 1)
+
+    def test_background_skips_pause(self):
+        for background in (True, False):
+            game = HeadlessGame(background=background).game
+            for col in range(10, 13):
+                game.arena.set_cell(20, col)
+            # Three generations and a bit, a blinker turns on its side.
+            game.on_resume(3.5 * game.arena.UPDATE_RATE)
+            self.assertEqual(game.arena.get_cell(19, 11), background)
+            self.assertEqual(game.arena.get_cell(20, 10), not background)
+
+    def test_background_skip_time(self):
+        game = HeadlessGame(background=True).game
+        with patch.object(Arena, "fast_forward", autospec=True) as fast_forward:
+            game.on_resume(game.MAX_BACKGROUND_SKIP * game.arena.UPDATE_RATE)
+            chunks = [call.args[1] for call in fast_forward.call_args_list]
+            self.assertEqual(chunks[:4], [1, 2, 4, 8])
+            self.assertEqual(sum(chunks), game.MAX_BACKGROUND_SKIP)
+            # Out of time after the first generation.
+            game.BACKGROUND_SKIP_TIME = 0
+            fast_forward.reset_mock()
+            game.on_resume(game.MAX_BACKGROUND_SKIP * game.arena.UPDATE_RATE)
+            fast_forward.assert_called_once_with(game.arena, 1, exact=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
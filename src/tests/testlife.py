@@ -0,0 +1,153 @@
+import unittest
+
+import numpy as np
+
+from Pong.components import Arena
+from Pong.life import (
+    LIFE_BACKENDS,
+    NODE_CACHE_SIZE,
+    ConvolveLife,
+    DirtyCells,
+    HashLife,
+    SparseLife,
+    _join,
+)
+
+
+def seeded(backend, cells):
+    for row, col in zip(*np.nonzero(cells)):
+        backend.set(int(row), int(col))
+    return backend
+
+
+def dirty_list(arena):
+    return list(zip(arena.dirty_cells.rows.tolist(), arena.dirty_cells.cols.tolist()))
+
+
+class TestLifeBackends(unittest.TestCase):
+    def test_blinker(self):
+        for backend in LIFE_BACKENDS.values():
+            life = backend(5, 5)
+            for col in range(1, 4):
+                life.set(2, col)
+            rows, cols = life.step()
+            changed = sorted(zip(rows.tolist(), cols.tolist()))
+            self.assertEqual(changed, [(1, 2), (2, 1), (2, 3), (3, 2)])
+            self.assertEqual(np.flatnonzero(life.cells()[:, 2]).tolist(), [1, 2, 3])
+            self.assertTrue(life.get(1, 2))
+            self.assertFalse(life.set(1, 2))
+
+    def test_backends_match_convolve(self):
+        rng = np.random.default_rng(7)
+        # Widths around the 64 bit word boundary exercise the carries between words, and sizes
+        # that are not whole tiles exercise the padding of the sparse backend.
+        for rows, cols in ((92, 122), (9, 63), (9, 64), (9, 65), (30, 200), (1, 1), (17, 33)):
+            cells = rng.random((rows, cols)) < 0.35
+            dense = seeded(ConvolveLife(rows, cols), cells)
+            others = [seeded(backend(rows, cols), cells) for backend in LIFE_BACKENDS.values()]
+            probe_rows = rng.integers(0, rows, 50)
+            probe_cols = rng.integers(0, cols, 50)
+            for _ in range(40):
+                expected = sorted(zip(*dense.step()))
+                for life in others:
+                    self.assertEqual(sorted(zip(*life.step())), expected)
+                    np.testing.assert_array_equal(life.cells(), dense.cells())
+                    np.testing.assert_array_equal(
+                        life.get_many(probe_rows, probe_cols),
+                        dense.cells()[probe_rows, probe_cols],
+                    )
+
+    def test_sparse_skips_still_areas(self):
+        life = SparseLife(200, 300)
+        # A block is a still life, so after one generation nothing is active any more.
+        for row, col in ((100, 150), (100, 151), (101, 150), (101, 151)):
+            life.set(row, col)
+        self.assertEqual(len(life.active_tiles()[0]), 9)
+        rows, _ = life.step()
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(life.active_tiles()[0]), 0)
+        self.assertEqual(life.cells().sum(), 4)
+
+
+class TestHashLife(unittest.TestCase):
+    def test_fast_forward(self):
+        rng = np.random.default_rng(11)
+        cells = rng.random((40, 70)) < 0.3
+        dense = seeded(ConvolveLife(40, 70), cells)
+        hashlife = seeded(HashLife(40, 70), cells)
+        for _ in range(50):
+            dense.step()
+        rows, cols = hashlife.fast_forward(50)
+        np.testing.assert_array_equal(hashlife.cells(), dense.cells())
+        expected_rows, expected_cols = np.nonzero(cells != dense.cells())
+        self.assertEqual(
+            sorted(zip(rows.tolist(), cols.tolist())),
+            sorted(zip(expected_rows.tolist(), expected_cols.tolist())),
+        )
+        self.assertEqual(_join.cache_info().maxsize, NODE_CACHE_SIZE)
+
+    def test_jumps_match_steps(self):
+        # A glider far from the edges moves the same with or without them.
+        exact = HashLife(500, 500)
+        jumping = HashLife(500, 500)
+        for row, col in ((100, 101), (101, 102), (102, 100), (102, 101), (102, 102)):
+            exact.set(row, col)
+            jumping.set(row, col)
+        exact.fast_forward(100)
+        jumping.fast_forward(100, exact=False)
+        np.testing.assert_array_equal(jumping.cells(), exact.cells())
+        self.assertEqual(np.argwhere(exact.cells()).min(axis=0).tolist(), [125, 125])
+
+
+class TestDirtyCells(unittest.TestCase):
+    def test_add_and_grow(self):
+        dirty = DirtyCells(capacity=2)
+        dirty.add(1, 2)
+        dirty.extend(np.array([3, 4, 5]), np.array([6, 7, 8]))
+        self.assertEqual(len(dirty), 4)
+        self.assertEqual(dirty.rows.tolist(), [1, 3, 4, 5])
+        self.assertEqual(dirty.cols.tolist(), [2, 6, 7, 8])
+        dirty.clear()
+        self.assertEqual(len(dirty.rows), 0)
+
+
+class TestArenaLife(unittest.TestCase):
+    def test_backends(self):
+        for name in LIFE_BACKENDS:
+            arena = Arena(400, 300, life_backend=name)
+            self.assertEqual(arena.copy().life_backend, name)
+            arena.set_cell(3, 4)
+            arena.set_cell(3, 4)
+            self.assertEqual(dirty_list(arena), [(3, 4)])
+            self.assertTrue(arena.grid[3, 4])
+            # The cell dies in the next generation and stays listed until it is drawn.
+            arena.update(Arena.UPDATE_RATE)
+            self.assertEqual(dirty_list(arena), [(3, 4), (3, 4)])
+            self.assertFalse(arena.get_cell(3, 4))
+            arena.dirty_cells.clear()
+
+            # A blinker has turned on its side after an odd number of generations.
+            for col in range(10, 13):
+                arena.set_cell(5, col)
+            arena.fast_forward(3)
+            self.assertEqual(
+                sorted(set(dirty_list(arena))),
+                [(4, 11), (5, 10), (5, 11), (5, 12), (6, 11)],
+            )
+            arena.dirty_cells.clear()
+            # Jumping ahead gives the same blinker away from the edges.
+            arena.fast_forward(6, exact=False)
+            self.assertEqual(dirty_list(arena), [])
+            self.assertEqual(np.argwhere(arena.grid).tolist(), [[4, 11], [5, 11], [6, 11]])
+
+    def test_undrawn_dirty_cells(self):
+        arena = Arena(400, 300)
+        for _ in range(arena.rows * arena.cols // 2 + 1):
+            arena.set_cell(0, 0)
+            arena.update(Arena.UPDATE_RATE)
+        self.assertEqual(len(arena.dirty_cells), arena.rows * arena.cols)
+        self.assertEqual(len(set(dirty_list(arena))), arena.rows * arena.cols)
+
+
+if __name__ == "__main__":
+    unittest.main()
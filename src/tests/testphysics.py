@@ -0,0 +1,198 @@
+import unittest
+
+import numpy as np
+
+from Pong.balls import BallSystem
+from Pong.components import Ball
+from Pong.physics import (
+    EventQueue,
+    PhysicsWorld,
+    bounce_circles_off_aabbs,
+    bounce_circles_off_walls,
+    reflect_off_wall,
+    separate_circle_aabb,
+    separate_circles_aabbs,
+    sweep_circle_aabb,
+    sweep_circle_wall,
+    sweep_circles_aabbs,
+    sweep_circles_wall,
+)
+
+
+class TestSweptWalls(unittest.TestCase):
+    def test_time_of_impact(self):
+        # Moving up from 50 to -10 with radius 5 against a wall at 0 touches at y = 5.
+        self.assertAlmostEqual(sweep_circle_wall(50, -10, 5, 0, -1), 45 / 60)
+        self.assertIsNone(sweep_circle_wall(50, 10, 5, 0, -1))
+        self.assertIsNone(sweep_circle_wall(50, 10, 5, 100, 1))
+        self.assertIsNone(sweep_circle_wall(3, 4, 5, 0, -1))
+        self.assertEqual(sweep_circle_wall(3, 2, 5, 0, -1), 0.0)
+
+    def test_tunnelling(self):
+        # The end position is past the wall, a position only test would miss it.
+        self.assertIsNotNone(sweep_circle_wall(90, 130, 5, 100, 1))
+        self.assertEqual(reflect_off_wall(130, 5, 100, 1, offset=0), 60)
+        self.assertEqual(reflect_off_wall(96, 5, 100, 1, offset=1), 94)
+
+
+class TestSweptRectangles(unittest.TestCase):
+    rect = (100, 0, 120, 100)
+
+    def test_fast_ball_through_paddle(self):
+        hit = sweep_circle_aabb((150, 50), (60, 50), 5, self.rect)
+        self.assertIsNotNone(hit)
+        t, normal = hit
+        self.assertAlmostEqual(t, 25 / 90)
+        self.assertEqual(normal, (1.0, 0.0))
+
+    def test_misses_and_moving_away(self):
+        self.assertIsNone(sweep_circle_aabb((150, 150), (60, 150), 5, self.rect))
+        self.assertIsNone(sweep_circle_aabb((126, 50), (150, 50), 10, self.rect))
+        self.assertIsNone(sweep_circle_aabb((130, 50), (130, 50), 5, self.rect))
+
+    def test_rounded_corner(self):
+        # Passes the corner diagonally, inside the grown box but outside the rounded corner.
+        self.assertIsNone(sweep_circle_aabb((127, -10), (117, -20), 5, self.rect))
+        hit = sweep_circle_aabb((130, -10), (110, -10), 12, self.rect)
+        self.assertIsNotNone(hit)
+        t, (nx, ny) = hit
+        self.assertAlmostEqual(nx**2 + ny**2, 1.0)
+        self.assertGreater(nx, 0)
+        self.assertLess(ny, 0)
+
+    def test_separate(self):
+        self.assertEqual(separate_circle_aabb(123, 50, 5, self.rect, offset=1), (126, 50))
+        self.assertEqual(separate_circle_aabb(150, 50, 5, self.rect), (150, 50))
+        self.assertEqual(separate_circle_aabb(118, 50, 5, self.rect, offset=0), (125, 50))
+
+
+class TestArrayVersions(unittest.TestCase):
+    def test_match_scalar(self):
+        rng = np.random.default_rng(3)
+        n = 500
+        start = rng.uniform(-40, 160, (n, 2))
+        end = start + rng.uniform(-60, 60, (n, 2))
+        end[:20] = start[:20]
+        radius = rng.uniform(2, 15, n)
+        rect = np.tile([40.0, 30.0, 60.0, 90.0], (n, 1))
+
+        t, normal = sweep_circles_aabbs(start, end, radius, rect)
+        for k in range(n):
+            hit = sweep_circle_aabb(start[k], end[k], radius[k], rect[k])
+            if hit is None:
+                self.assertTrue(np.isnan(t[k]))
+            else:
+                self.assertAlmostEqual(t[k], hit[0])
+                np.testing.assert_allclose(normal[k], hit[1], atol=1e-9)
+
+        walls = sweep_circles_wall(start[:, 1], end[:, 1], radius, 0.0, -1)
+        for k in range(n):
+            expected = sweep_circle_wall(start[k, 1], end[k, 1], radius[k], 0.0, -1)
+            if expected is None:
+                self.assertTrue(np.isnan(walls[k]))
+            else:
+                self.assertAlmostEqual(walls[k], expected)
+
+        pos = end.copy()
+        separate_circles_aabbs(pos, radius, rect)
+        for k in range(n):
+            np.testing.assert_allclose(pos[k], separate_circle_aabb(*end[k], radius[k], rect[k]))
+
+    def test_bounce(self):
+        # The first two cross the top and bottom walls, the third is masked out and the last misses.
+        start = np.array([[0.0, 8.0], [0.0, 92.0], [0.0, 8.0], [0.0, 50.0]])
+        end = np.array([[0.0, 2.0], [0.0, 98.0], [0.0, 2.0], [0.0, 52.0]])
+        vel = np.array([[0.0, -6.0], [0.0, 6.0], [0.0, -6.0], [0.0, 2.0]])
+        radius = np.full(4, 5.0)
+        mask = np.array([True, True, False, True])
+        bounced = bounce_circles_off_walls(
+            start[:, 1], end[:, 1], vel[:, 1], radius, ((0, -1), (100, 1)), mask=mask
+        )
+        self.assertEqual(bounced.tolist(), [True, True, False, False])
+        np.testing.assert_allclose(end[:, 1], [8, 92, 2, 52])
+        np.testing.assert_allclose(vel[:, 1], [6, -6, -6, 2])
+
+        # A paddle moving up into a ball that stands still still knocks it away.
+        start = np.array([[50.0, 20.0], [50.0, 200.0]])
+        end = start.copy()
+        vel = np.zeros((2, 2))
+        rect = np.tile([40.0, 24.0, 60.0, 84.0], (2, 1))
+        hit = bounce_circles_off_aabbs(start, end, vel, np.full(2, 5.0), rect, shift=-10.0)
+        self.assertEqual(hit.tolist(), [0])
+        self.assertLessEqual(end[0, 1], 24 - 5)
+        np.testing.assert_array_equal(end[1], [50, 200])
+
+
+class TestEventQueue(unittest.TestCase):
+    def test_push_and_grow(self):
+        queue = EventQueue(capacity=2)
+        queue.push(EventQueue.WALL, 3)
+        queue.extend(EventQueue.BALL, np.array([0, 1, 2]), np.array([4, 5, 6]))
+        queue.extend(EventQueue.GOAL, [7], 2)
+        self.assertEqual(len(queue), 5)
+        self.assertEqual(queue.counts().tolist(), [1, 0, 1, 3])
+        self.assertEqual(
+            queue.events.tolist(),
+            [(0, 3, -1), (3, 0, 4), (3, 1, 5), (3, 2, 6), (2, 7, 2)],
+        )
+        queue.clear()
+        self.assertEqual(len(queue.events), 0)
+
+
+class TestPhysicsWorld(unittest.TestCase):
+    def test_events(self):
+        world = PhysicsWorld((0, 0, 100, 100), goals=("left",))
+        events = []
+        for event in ("wall", "goal", "ball"):
+            world.on(event, lambda *args, event=event: events.append((event, args)))
+
+        # One ball crosses the bottom wall and one reaches the left goal.
+        bouncing = Ball(50, 99, radius=5, vel_y=10)
+        bouncing.prev_y = 89
+        scoring = Ball(3, 20, radius=5, vel_x=-10)
+        scoring.prev_x = 13
+        world.add_balls([bouncing, scoring])
+        world.step()
+        # Goals are reported by the step, everything else once the events are dispatched.
+        self.assertEqual(events, [("goal", (scoring, "left"))])
+        self.assertEqual(world.events.counts().tolist(), [1, 0, 1, 0])
+        world.dispatch()
+        self.assertEqual(events, [("goal", (scoring, "left")), ("wall", (bouncing,))])
+        self.assertEqual(bouncing.vel_y, -10)
+        self.assertLess(bouncing.y, 95)
+
+        # Two touching balls moving towards each other collide.
+        events.clear()
+        world = PhysicsWorld((0, 0, 100, 100))
+        world.on("ball", lambda a, b: events.append((a, b)))
+        world.add_ball(Ball(45, 50, radius=6, vel_x=1))
+        world.add_ball(Ball(55, 50, radius=6, vel_x=-1))
+        world.step()
+        world.dispatch()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(world.balls[0].vel_x, -1)
+
+    def test_pair_backends_agree(self):
+        rng = np.random.default_rng(3)
+        results = []
+        for pairs in PhysicsWorld.PAIR_BACKENDS:
+            balls = BallSystem(60)
+            balls.add(
+                rng.uniform(0, 200, 60),
+                rng.uniform(0, 200, 60),
+                radius=rng.uniform(3, 8, 60),
+                vel_x=rng.uniform(-5, 5, 60),
+                vel_y=rng.uniform(-5, 5, 60),
+            )
+            world = PhysicsWorld((0, 0, 200, 200), pairs=pairs)
+            world.add_balls(balls)
+            for _ in range(50):
+                balls.update(1.0)
+                world.step()
+            results.append(balls.pos.copy())
+            rng = np.random.default_rng(3)
+        np.testing.assert_allclose(results[0], results[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from Tracker.preprocess import FramePreprocessor
+
+
+class TestFramePreprocessor(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.frame = rng.integers(0, 255, (8, 12, 3), dtype=np.uint8)
+
+    def test_flip_and_rgb(self):
+        prepared = FramePreprocessor().process(self.frame)
+        # Mirrored horizontally and BGR turned into RGB.
+        np.testing.assert_array_equal(prepared, self.frame[:, ::-1, ::-1])
+
+        unflipped = FramePreprocessor(flip=False).process(self.frame)
+        np.testing.assert_array_equal(unflipped, self.frame[:, :, ::-1])
+
+    def test_scale(self):
+        preprocessor = FramePreprocessor(flip=False, scale=0.5)
+        self.assertEqual(preprocessor.output_shape(self.frame.shape), (4, 6, 3))
+        flat = np.zeros((8, 12, 3), dtype=np.uint8)
+        flat[..., 0] = 10
+        flat[..., 2] = 200
+        prepared = preprocessor.process(flat)
+        self.assertEqual(prepared.shape, (4, 6, 3))
+        self.assertTrue((prepared[..., 0] == 200).all())
+        self.assertTrue((prepared[..., 2] == 10).all())
+
+    def test_buffers(self):
+        preprocessor = FramePreprocessor()
+        first = preprocessor.process(self.frame)
+        # The internal buffer is reused, so the next frame overwrites the last result.
+        second = preprocessor.process(self.frame[::-1].copy())
+        self.assertIs(first, second)
+
+        out = np.zeros(preprocessor.output_shape(self.frame.shape), dtype=np.uint8)
+        result = preprocessor.process(self.frame, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, self.frame[:, ::-1, ::-1])
+
+        # A frame of another size gets new buffers.
+        small = preprocessor.process(self.frame[:4, :6].copy())
+        self.assertEqual(small.shape, (4, 6, 3))
+        self.assertIsNot(small, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import time
+import unittest
+
+import numpy as np
+
+from Tracker.process import ProcessTrackerWorker, SharedFrameRing
+from Tracker.results import empty_faces
+
+
+class FakeCamera:
+    def __init__(self):
+        self.frame = None
+        self.sequence = 0
+
+    def push(self):
+        self.sequence += 1
+        self.frame = np.full((4, 6, 3), self.sequence, dtype=np.uint8)
+
+    def read_latest(self):
+        return self.frame, float(self.sequence), self.sequence
+
+
+class FakeHandTracker:
+    """Reports one hand whose wrist x is the mean of the frame, so the test can tell frames apart."""
+
+    def __init__(self):
+        self.model_complexity = 1
+        self.inference_width = None
+        self.value = 0.0
+
+    def process_rgb(self, frame_rgb):
+        self.value = float(frame_rgb.mean())
+
+    def get_arrays(self):
+        hands = np.full((1, 21, 3), self.value, dtype=np.float32)
+        return hands, np.zeros(1, dtype=np.int8), np.ones(1, dtype=np.float32)
+
+    def close(self):
+        pass
+
+
+class FakeFaceTracker:
+    def process_rgb(self, frame_rgb):
+        pass
+
+    def get_arrays(self):
+        return empty_faces(), np.zeros(0, dtype=np.float32)
+
+    def close(self):
+        pass
+
+
+def make_worker(camera):
+    return ProcessTrackerWorker(
+        camera, flip=False, trackers={"hand": FakeHandTracker, "face": FakeFaceTracker}
+    )
+
+
+def run_until(worker, done, timeout=20.0):
+    deadline = time.perf_counter() + timeout
+    while not done() and time.perf_counter() < deadline:
+        if not worker.process_latest():
+            time.sleep(0.005)
+    return done()
+
+
+class TestSlots(unittest.TestCase):
+    def test_slot_reuse(self):
+        worker = make_worker(FakeCamera())
+        worker.ring = SharedFrameRing((4, 6, 3), worker.slots)
+        try:
+            worker._busy_slots = {"hand": None, "face": None}
+            frame = np.full((4, 6, 3), 7, dtype=np.uint8)
+            slot = worker._slot_for(frame, 1)
+            # The same frame is prepared once and shared by both processes.
+            self.assertEqual(worker._slot_for(frame, 1), slot)
+            np.testing.assert_array_equal(worker.ring.frames[slot], frame[..., ::-1])
+
+            # Slots held by a process are never overwritten.
+            worker._busy_slots = {"hand": slot, "face": None}
+            other = worker._slot_for(frame, 2)
+            self.assertNotEqual(other, slot)
+            worker._busy_slots = {"hand": slot, "face": other}
+            self.assertNotIn(worker._slot_for(frame, 3), (slot, other))
+        finally:
+            worker.ring.close()
+
+
+class TestProcessTrackerWorker(unittest.TestCase):
+    def setUp(self):
+        self.camera = FakeCamera()
+        self.worker = make_worker(self.camera)
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def test_results_and_stop(self):
+        self.camera.push()
+        self.assertTrue(run_until(self.worker, lambda: self.worker.latest().sequence == 1))
+        self.assertEqual(self.worker.latest().hands[0, 0, 0], 1.0)
+        processes = list(self.worker._processes.values())
+        self.worker.stop()
+        self.assertFalse(any(process.is_alive() for process in processes))
+        self.assertIsNone(self.worker.ring)
+
+    def test_dead_process(self):
+        self.camera.push()
+        self.assertTrue(run_until(self.worker, lambda: self.worker.latest().sequence == 1))
+        hand = self.worker._processes["hand"]
+        hand.kill()
+        hand.join()
+        self.camera.push()
+        with self.assertLogs("Tracker.process", "ERROR"):
+            self.assertTrue(run_until(self.worker, lambda: self.worker.failed is not None))
+        self.assertEqual(self.worker.failed, "hand")
+        self.assertEqual(self.worker._processes, {})
+        self.assertIsNone(self.worker.ring)
+        # The last result stays and nothing is restarted.
+        self.assertFalse(self.worker.process_latest())
+        self.assertEqual(self.worker.latest().sequence, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
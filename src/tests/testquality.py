@@ -0,0 +1,90 @@
+import unittest
+from types import SimpleNamespace
+
+from Tracker.quality import QualityController, QualityLevel
+
+
+class FakeWorker:
+    """Hands out a new tracker result with the given latency on every call to latest()."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.sequence = 0
+        self.requested = []
+
+    def latest(self):
+        self.sequence += 1
+        return SimpleNamespace(sequence=self.sequence, latency=self.latency)
+
+    def request_quality(self, level):
+        self.requested.append(level)
+
+
+LEVELS = [QualityLevel(1, None, 1), QualityLevel(1, 640, 2), QualityLevel(0, 320, 6)]
+
+
+class TestQualityController(unittest.TestCase):
+    def setUp(self):
+        self.worker = FakeWorker()
+        # A 10 ms frame budget and a 20 ms latency budget.
+        self.controller = QualityController(
+            self.worker,
+            target_fps=100,
+            tracker_fps=50,
+            levels=LEVELS,
+            smoothing=0.5,
+            downgrade_after=3,
+            upgrade_after=5,
+            headroom=0.5,
+        )
+
+    def observe(self, frame_time, count=1):
+        for _ in range(count):
+            level = self.controller.observe(frame_time)
+        return level
+
+    def test_moving_average(self):
+        self.observe(0.004)
+        self.assertAlmostEqual(self.controller.frame_time, 0.004)
+        self.observe(0.008)
+        self.assertAlmostEqual(self.controller.frame_time, 0.006)
+        self.worker.latency = 0.01
+        self.observe(0.006)
+        self.assertAlmostEqual(self.controller.latency, 0.005)
+
+    def test_downgrade_after(self):
+        self.assertIs(self.observe(0.02, 2), LEVELS[0])
+        self.assertIs(self.observe(0.02), LEVELS[1])
+        self.assertEqual(self.worker.requested, [LEVELS[1]])
+        # The count starts over after a change, and the ladder stops at its cheapest level.
+        self.assertIs(self.observe(0.02, 2), LEVELS[1])
+        self.assertIs(self.observe(0.02, 10), LEVELS[2])
+        self.assertEqual(self.worker.requested, LEVELS[1:])
+
+    def test_slow_tracker_downgrades(self):
+        self.worker.latency = 0.05
+        self.assertIs(self.observe(0.001, 3), LEVELS[1])
+
+    def test_upgrade_needs_headroom(self):
+        self.controller.set_level(2)
+        # Under budget but not under the headroom, so the level stays put.
+        self.assertIs(self.observe(0.007, 20), LEVELS[2])
+        self.assertEqual(self.controller.under_count, 0)
+
+        self.controller.frame_time = None
+        self.assertIs(self.observe(0.002, 4), LEVELS[2])
+        self.assertIs(self.observe(0.002), LEVELS[1])
+        self.worker.latency = 0.015
+        self.assertIs(self.observe(0.002, 20), LEVELS[1])
+
+    def test_over_budget_resets_upgrade(self):
+        self.controller.set_level(1)
+        self.observe(0.001, 4)
+        self.observe(0.05)
+        self.controller.frame_time = None
+        self.assertIs(self.observe(0.001, 4), LEVELS[1])
+        self.assertIs(self.observe(0.001), LEVELS[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from Pong.headless import BallFollower, HeadlessGame
+from Pong.replay import MAX_SEED, InputLog, InputReplay, replay
+
+
+class TestInputReplay(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".hpi")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_replay_is_exact(self):
+        log = InputLog(self.path, seed=7, paddles=2, width=1024, height=768)
+        # Stop following now and then so points get scored and balls get added.
+        follower = BallFollower()
+        headless = HeadlessGame(
+            script=lambda tick: follower(tick) if tick % 900 < 600 else (None, 0.2),
+            seed=7,
+            input_log=log,
+        )
+        follower.game = headless.game
+        headless.run(4000)
+        log.close()
+        self.assertGreater(len(headless.game.balls), 1)
+
+        inputs = InputReplay(self.path)
+        self.assertEqual((inputs.seed, inputs.paddles, len(inputs)), (7, 2, 4000))
+
+        game = replay(self.path)
+        self.assertEqual(game.scorer.score_left, headless.game.scorer.score_left)
+        self.assertEqual(game.scorer.score_right, headless.game.scorer.score_right)
+        recorded = [(b.x, b.y, b.vel_x, b.vel_y, b.radius) for b in headless.game.balls]
+        replayed = [(b.x, b.y, b.vel_x, b.vel_y, b.radius) for b in game.balls]
+        self.assertEqual(replayed, recorded)
+
+    def test_not_a_log(self):
+        with open(self.path, "wb") as file:
+            file.write(b"x" * 64)
+        with self.assertRaises(ValueError):
+            InputReplay(self.path)
+
+    def test_seed_range(self):
+        for seed in (-1, MAX_SEED + 1):
+            with self.assertRaises(ValueError):
+                InputLog(self.path, seed, 2, 800, 600)
+        log = InputLog(self.path, MAX_SEED, 1, 800, 600)
+        log.write(1.0, [0.0])
+        log.close()
+        self.assertEqual(InputReplay(self.path).seed, MAX_SEED)
+
+
+if __name__ == "__main__":
+    unittest.main()
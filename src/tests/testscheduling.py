@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from Tracker.scheduling import FaceScheduler
+
+
+def face(x, y):
+    """A single face with all six keypoints at (x, y)."""
+    return np.full((1, 6, 2), (x, y), dtype=np.float32)
+
+
+class TestFaceScheduler(unittest.TestCase):
+    def test_interval(self):
+        scheduler = FaceScheduler(interval=3)
+        self.assertTrue(scheduler.should_detect(0.0))
+        scheduler.add_detection(0.0, face(0.5, 0.5))
+        detected = [scheduler.should_detect(t) for t in (0.1, 0.2, 0.3)]
+        self.assertEqual(detected, [False, False, True])
+
+    def test_budget(self):
+        scheduler = FaceScheduler(budget=0.1)
+        scheduler.add_detection(1.0, face(0.5, 0.5), duration=0.02)
+        # 20 ms of detection at a 10% budget allows the next one 200 ms later.
+        self.assertFalse(scheduler.should_detect(1.1))
+        self.assertFalse(scheduler.should_detect(1.19))
+        self.assertTrue(scheduler.should_detect(1.2))
+
+    def test_extrapolation(self):
+        scheduler = FaceScheduler(max_extrapolation=0.25)
+        self.assertEqual(scheduler.predict(0.0).shape, (0, 6, 2))
+        scheduler.add_detection(0.0, face(0.2, 0.5))
+        np.testing.assert_allclose(scheduler.predict(0.1), face(0.2, 0.5))
+
+        # Moving right at 1 unit per second.
+        scheduler.add_detection(0.1, face(0.3, 0.5), scores=np.array([0.8], dtype=np.float32))
+        np.testing.assert_allclose(scheduler.predict(0.2), face(0.4, 0.5), atol=1e-6)
+        self.assertEqual(scheduler.scores.tolist(), [np.float32(0.8)])
+        # Far past the last detection the face stops at the clamp.
+        np.testing.assert_allclose(scheduler.predict(5.0), face(0.55, 0.5), atol=1e-6)
+        np.testing.assert_allclose(scheduler.predict(0.05), face(0.3, 0.5))
+
+    def test_no_extrapolation_when_faces_change(self):
+        scheduler = FaceScheduler()
+        scheduler.add_detection(0.0, face(0.2, 0.5))
+        two_faces = np.concatenate([face(0.3, 0.5), face(0.7, 0.5)])
+        scheduler.add_detection(0.1, two_faces)
+        np.testing.assert_array_equal(scheduler.predict(0.2), two_faces)
+        self.assertEqual(scheduler.scores.tolist(), [1.0, 1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from Tracker.sources import FramePlayer, FrameRecorder, FrameSource
+
+
+class ListSource(FrameSource):
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.released = False
+
+    def read(self):
+        if not self.frames:
+            return False, None
+        return True, self.frames.pop(0)
+
+    def release(self):
+        self.released = True
+
+
+class TestFrameRecording(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".hpf")
+        os.close(handle)
+        rng = np.random.default_rng(0)
+        self.frames = [rng.integers(0, 255, (6, 8, 3), dtype=np.uint8) for _ in range(5)]
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        source = ListSource(self.frames)
+        recorder = FrameRecorder(source, self.path)
+        while recorder.read()[0]:
+            pass
+        recorder.release()
+        self.assertTrue(source.released)
+
+        player = FramePlayer(self.path, realtime=False)
+        self.assertEqual(len(player), len(self.frames))
+        for expected in self.frames:
+            ret, frame = player.read()
+            self.assertTrue(ret)
+            np.testing.assert_array_equal(frame, expected)
+        self.assertEqual(player.read(), (False, None))
+        np.testing.assert_array_equal(player.timestamps, np.sort(player.timestamps))
+
+    def test_loop_and_timing(self):
+        recorder = FrameRecorder(ListSource([]), self.path)
+        for i, frame in enumerate(self.frames[:3]):
+            recorder.write(frame, 10.0 + 0.02 * i)
+        recorder.close()
+
+        player = FramePlayer(self.path, realtime=True, loop=True)
+        start = time.perf_counter()
+        for expected in self.frames[:3] + self.frames[:1]:
+            ret, frame = player.read()
+            np.testing.assert_array_equal(frame, expected)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+    def test_shape_mismatch(self):
+        recorder = FrameRecorder(ListSource([]), self.path)
+        recorder.write(self.frames[0], 0.0)
+        with self.assertRaises(ValueError):
+            recorder.write(np.zeros((2, 2, 3), dtype=np.uint8), 1.0)
+        recorder.close()
+
+    def test_close_unregisters(self):
+        with mock.patch("Tracker.sources.atexit") as atexit:
+            recorder = FrameRecorder(ListSource([]), self.path)
+            atexit.register.assert_called_once_with(recorder.close)
+            recorder.close()
+            recorder.close()
+        atexit.unregister.assert_called_once_with(recorder.close)
+
+    def test_truncated_header(self):
+        with open(self.path, "wb") as file:
+            file.write(b"HPFRAME1")
+        with self.assertRaises(ValueError):
+            FramePlayer(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
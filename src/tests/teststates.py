@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+
+from Pong.gamelogic import State, StateManager
+
+
+class RecordingState(State):
+    def __init__(self):
+        self.steps = []
+        self.alphas = []
+        self.resumed = []
+
+    def update(self, dt):
+        self.steps.append(dt)
+
+    def draw(self, alpha=1.0):
+        self.alphas.append(alpha)
+
+    def on_resume(self, dt):
+        self.resumed.append(dt)
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def setUp(self):
+        self.state = RecordingState()
+        with patch("pygame.time.get_ticks", return_value=0):
+            self.manager = StateManager(None, None, self.state, step=0.5, max_steps=4)
+
+    def advance(self, ticks):
+        with patch("pygame.time.get_ticks", return_value=ticks):
+            return self.manager.update()
+
+    def test_steps_are_fixed(self):
+        # 40 ms is 1.33 game units: two steps and a third of one left over.
+        self.assertEqual(self.advance(40), 2)
+        self.assertEqual(self.state.steps, [0.5, 0.5])
+        self.assertAlmostEqual(self.manager.alpha, (40 / 30 - 1.0) / 0.5)
+
+        self.manager.draw()
+        self.assertEqual(self.state.alphas, [self.manager.alpha])
+
+        # The remainder carries over to the next frame.
+        self.assertEqual(self.advance(60), 1)
+        self.assertEqual(len(self.state.steps), 3)
+
+    def test_catch_up_is_capped(self):
+        self.assertEqual(self.advance(3000), 4)
+        self.assertEqual(len(self.state.steps), 4)
+        self.assertLess(self.manager.accumulator, self.manager.step)
+        self.assertEqual(self.advance(3001), 0)
+
+
+class TestPause(unittest.TestCase):
+    def test_resume_gets_paused_time(self):
+        menu, game = RecordingState(), RecordingState()
+        with patch("pygame.time.get_ticks", return_value=0):
+            manager = StateManager(game, None, menu)
+        for ticks, state in ((300, game), (600, menu), (3600, game), (3600, game)):
+            with patch("pygame.time.get_ticks", return_value=ticks):
+                manager.set_state(state)
+        # The game had never run before its first start, then it was paused for 3 seconds.
+        self.assertEqual(game.resumed, [100.0])
+        self.assertEqual(menu.resumed, [10.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
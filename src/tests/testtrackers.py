@@ -0,0 +1,101 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from Tracker.trackers import HandModels, HandTracker
+
+
+def hand_at(x, y):
+    """Builds a fake MediaPipe hand with all 21 landmarks around (x, y)."""
+    return SimpleNamespace(
+        landmark=[SimpleNamespace(x=x + i * 0.001, y=y, z=0.0) for i in range(21)]
+    )
+
+
+class FakeHands:
+    """Stands in for mediapipe Hands and finds the hands of the shared scene for each call to process()."""
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.shapes = []
+
+    def process(self, image):
+        full = image.shape[:2] == (240, 320)
+        self.scene.calls.append("full" if full else "crop")
+        self.shapes.append(image.shape[:2])
+        # A crop only ever sees the first hand, the way it would when a second hand comes into view.
+        hands = self.scene.hands if full else self.scene.hands[:1]
+        return SimpleNamespace(
+            multi_hand_landmarks=[hand_at(x, y) for x, y in hands] or None,
+            multi_handedness=None,
+        )
+
+    def close(self):
+        pass
+
+
+class TestHandTrackerROI(unittest.TestCase):
+    def setUp(self):
+        self.fake = SimpleNamespace(calls=[], hands=[])
+        self.full = FakeHands(self.fake)
+        self.crop = FakeHands(self.fake)
+        models = HandModels(self.full, self.crop)
+        with mock.patch.object(HandTracker, "create_hands", return_value=models):
+            self.tracker = HandTracker(max_num_hands=2, roi=True, roi_refresh=4)
+        self.frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+    def run_frames(self, count):
+        for _ in range(count):
+            self.tracker.process_rgb(self.frame)
+
+    def test_refresh_finds_new_hands(self):
+        self.fake.hands = [(0.2, 0.2)]
+        self.run_frames(5)
+        self.assertEqual(self.fake.calls, ["full", "crop", "crop", "crop", "full"])
+        self.assertEqual(self.tracker.roi_hands, 1)
+
+        self.fake.calls.clear()
+        self.fake.hands = [(0.2, 0.2), (0.8, 0.8)]
+        self.run_frames(5)
+        # The crop misses the new hand until the next full frame, which tracks both from then on.
+        self.assertEqual(self.fake.calls, ["crop", "crop", "crop", "full", "full"])
+        self.assertEqual(len(self.tracker.get_landmarks()), 2)
+
+    def test_lost_hand_falls_back(self):
+        self.fake.hands = [(0.2, 0.2), (0.3, 0.3)]
+        self.run_frames(2)
+        # The crop only finds one of the two hands, so the frame is searched again.
+        self.assertEqual(self.fake.calls, ["full", "crop", "full"])
+        self.assertEqual(len(self.tracker.get_landmarks()), 2)
+
+
+    def test_moving_crop_uses_static_model(self):
+        boxes = []
+        for step in range(3):
+            self.fake.hands = [(0.2 + 0.05 * step, 0.2 + 0.05 * step)]
+            self.tracker.process_rgb(self.frame)
+            boxes.append(self.tracker.roi_box)
+        self.assertEqual(self.fake.calls, ["full", "crop", "crop"])
+        self.assertNotEqual(boxes[1], boxes[2])
+        # The video mode model only ever sees whole frames, the crops go to the other one.
+        self.assertEqual(self.full.shapes, [(240, 320)])
+        self.assertEqual(len(self.crop.shapes), 2)
+        self.assertTrue(all(shape != (240, 320) for shape in self.crop.shapes))
+
+    def test_create_hands(self):
+        self.tracker.mp_hands = mock.Mock()
+        models = self.tracker.create_hands(0)
+        calls = self.tracker.mp_hands.Hands.call_args_list
+        modes = [call.kwargs["static_image_mode"] for call in calls]
+        self.assertEqual(modes, [False, True])
+        self.assertIsNotNone(models.crop)
+
+        self.tracker.set_hands(models, 0)
+        self.assertIs(self.tracker.crop_hands, models.crop)
+        self.assertEqual(self.tracker.model_complexity, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from Tracker.quality import QualityLevel
+from Tracker.results import empty_faces, empty_hands
+from Tracker.worker import TrackerWorker
+
+
+class FakeCamera:
+    """Hands out the frames given to push() the way CameraStream.read_latest() does."""
+
+    def __init__(self):
+        self.frame = None
+        self.timestamp = 0.0
+        self.sequence = 0
+
+    def push(self, timestamp):
+        self.frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        self.timestamp = timestamp
+        self.sequence += 1
+
+    def read_latest(self):
+        return self.frame, self.timestamp, self.sequence
+
+
+class FakeHandTracker:
+    def __init__(self, model_complexity=1):
+        self.model_complexity = model_complexity
+        self.inference_width = None
+        self.frames = 0
+        self.installed = []
+
+    def process_rgb(self, frame_rgb):
+        self.frames += 1
+        time.sleep(0.001)
+
+    def get_arrays(self):
+        hands = np.full((1, 21, 3), 0.5, dtype=np.float32)
+        return hands, np.zeros(1, dtype=np.int8), np.ones(1, dtype=np.float32)
+
+    def create_hands(self, model_complexity):
+        return FakeHands(model_complexity)
+
+    def set_hands(self, hands, model_complexity):
+        self.installed.append(model_complexity)
+        self.model_complexity = model_complexity
+
+
+class BlockingHandTracker(FakeHandTracker):
+    """Builds Hands objects only when the test releases them, like a slow model load."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.built = []
+
+    def create_hands(self, model_complexity):
+        self.release.wait(5.0)
+        hands = FakeHands(model_complexity)
+        self.built.append(hands)
+        return hands
+
+
+class FakeHands:
+    def __init__(self, model_complexity):
+        self.model_complexity = model_complexity
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeFaceTracker:
+    def process_rgb(self, frame_rgb):
+        pass
+
+    def get_arrays(self):
+        return empty_faces(), np.zeros(0, dtype=np.float32)
+
+
+class TestTrackerWorker(unittest.TestCase):
+    def setUp(self):
+        self.camera = FakeCamera()
+        self.hand_tracker = FakeHandTracker()
+        self.worker = TrackerWorker(self.camera, self.hand_tracker, FakeFaceTracker())
+
+    def test_publishes_results(self):
+        self.assertFalse(self.worker.process_latest())
+        self.assertEqual(len(self.worker.latest().hands), len(empty_hands()))
+
+        self.camera.push(12.5)
+        self.assertTrue(self.worker.process_latest())
+        result = self.worker.latest()
+        self.assertEqual(result.timestamp, 12.5)
+        self.assertEqual(result.sequence, 1)
+        self.assertGreater(result.latency, 0)
+        self.assertEqual(result.hands.shape, (1, 21, 3))
+        # The same frame is not processed twice.
+        self.assertFalse(self.worker.process_latest())
+        self.assertEqual(self.hand_tracker.frames, 1)
+
+    def test_thread(self):
+        self.worker.start()
+        thread = self.worker._thread
+        self.camera.push(1.0)
+        deadline = time.perf_counter() + 2.0
+        while self.worker.latest().sequence != 1 and time.perf_counter() < deadline:
+            time.sleep(0.002)
+        self.assertEqual(self.worker.latest().sequence, 1)
+        self.worker.stop()
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.worker._thread)
+
+
+    def test_stale_build_is_dropped(self):
+        hand_tracker = BlockingHandTracker()
+        worker = TrackerWorker(self.camera, hand_tracker, FakeFaceTracker())
+        worker.request_quality(QualityLevel(0, 480, 3))
+        worker._apply_quality()
+        builder = worker._builder
+        self.assertIsNotNone(builder)
+
+        # Back to the current complexity while the build for 0 is still running.
+        worker.request_quality(QualityLevel(1, 640, 2))
+        worker._apply_quality()
+        self.assertEqual(hand_tracker.inference_width, 640)
+        hand_tracker.release.set()
+        builder.join(5.0)
+        worker._apply_quality()
+        self.assertEqual(hand_tracker.installed, [])
+        self.assertEqual(hand_tracker.model_complexity, 1)
+        self.assertTrue(hand_tracker.built[0].closed)
+        self.assertIsNone(worker._builder)
+
+        # A build that is still wanted is installed.
+        worker.request_quality(QualityLevel(0, 480, 3))
+        worker._apply_quality()
+        worker._builder.join(5.0)
+        worker._apply_quality()
+        self.assertEqual(hand_tracker.installed, [0])
+        self.assertFalse(hand_tracker.built[1].closed)
+
+
+if __name__ == "__main__":
+    unittest.main()